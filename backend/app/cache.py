@@ -0,0 +1,76 @@
+"""
+VEP MVP Backend - Cache
+
+Small in-process LRU cache with per-entry expiry.
+
+Each API worker process has its own cache, so cached values must either
+be validated against the database before use (e.g. by a version key) or
+be safe to serve until their TTL expires.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    LRU cache holding at most `maxsize` entries for `ttl` seconds each.
+
+    Expired entries are dropped when read; the least recently used entry
+    is evicted when a new one would exceed `maxsize`. Safe to share
+    between the event loop and worker threads.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return a live entry (marking it recently used), else `default`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Remove an entry, returning its value if it was still live."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= self._clock():
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,243 @@
+"""
+VEP MVP Backend - Command Line Interface
+
+Administrative commands run against the configured database:
+
+    python -m app.cli reconcile-counters
+    python -m app.cli import-voters path/to/voters.csv
+    python -m app.cli prune-sync-tombstones
+    python -m app.cli provision-users path/to/volunteers.csv
+"""
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import text
+
+from app.config import settings
+from app.database import async_engine, asyncpg_connection, engine
+from app.dependencies import new_async_session
+from app.models.user import UserProvisionReport, UserProvisionStatus
+from app.models.voter import VoterImportReport
+from app.user_provisioning import UserProvisionFileError, provision_users, read_provision_rows
+from app.voter_import import (
+    VoterFileError,
+    import_voter_file,
+    import_voter_path,
+    import_worker_count,
+    read_header,
+)
+
+
+def reconcile_counters(args: argparse.Namespace) -> int:
+    """
+    Rebuild the trigger-maintained assignment progress counters.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: Process exit code
+    """
+    with engine.begin() as connection:
+        corrected = connection.execute(text("SELECT reconcile_assignment_counters()")).scalar_one()
+    print(f"✅ Reconciled assignment counters ({corrected} assignments corrected)")
+    return 0
+
+
+def prune_sync_tombstones(args: argparse.Namespace) -> int:
+    """
+    Delete delta sync tombstones older than the retention period.
+
+    Clients whose sync cursor predates the retention period get a full
+    resync, so they never depend on pruned tombstones.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: Process exit code
+    """
+    prune = text(
+        "DELETE FROM sync_tombstones WHERE deleted_at < NOW() - make_interval(days => :days)"
+    )
+    with engine.begin() as connection:
+        pruned = connection.execute(
+            prune, {"days": settings.SYNC_TOMBSTONE_RETENTION_DAYS}
+        ).rowcount
+    print(
+        f"✅ Pruned {pruned} sync tombstones older than "
+        f"{settings.SYNC_TOMBSTONE_RETENTION_DAYS} days"
+    )
+    return 0
+
+
+def print_import_progress(report: VoterImportReport) -> None:
+    """Print a one-line running import status."""
+    print(
+        f"   {report.rows_read:,} rows read, {report.rows_loaded:,} staged, "
+        f"{report.rows_rejected:,} rejected ({report.rows_per_second:,.0f} rows/s)",
+        flush=True,
+    )
+
+
+async def run_voter_import(args: argparse.Namespace) -> VoterImportReport:
+    """
+    Import a voter file through a pooled asyncpg connection.
+
+    With more than one worker (after capping at the CPU core count),
+    shards of the file are validated in a process pool (unless it has
+    quoted multi-line cells); otherwise the file is streamed in chunks of
+    `--chunk-size` rows.
+    """
+    try:
+        if import_worker_count(args.workers) > 1:
+            read_header(args.path)  # fail on a missing or malformed file before connecting
+            async with asyncpg_connection() as connection:
+                return await import_voter_path(
+                    connection,
+                    args.path,
+                    workers=args.workers,
+                    progress=print_import_progress,
+                    delete_missing=args.delete_missing,
+                )
+        with open(args.path, newline="", encoding="utf-8-sig") as source:
+            async with asyncpg_connection() as connection:
+                return await import_voter_file(
+                    connection,
+                    source,
+                    chunk_size=args.chunk_size,
+                    progress=print_import_progress,
+                    delete_missing=args.delete_missing,
+                )
+    finally:
+        await async_engine.dispose()
+
+
+def import_voters(args: argparse.Namespace) -> int:
+    """
+    Import (upsert) voters from a CSV voter file.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: Process exit code
+    """
+    try:
+        report = asyncio.run(run_voter_import(args))
+    except (OSError, VoterFileError) as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+
+    print(
+        f"✅ Imported {args.path}: {report.inserted:,} inserted, {report.updated:,} updated, "
+        f"{report.unchanged:,} unchanged, {report.deleted:,} deleted, "
+        f"{report.rows_rejected:,} rejected in {report.elapsed_seconds:,.1f}s "
+        f"({report.rows_per_second:,.0f} rows/s)"
+    )
+    for rejected in report.errors:
+        print(f"   line {rejected.line}: {rejected.error}")
+    if report.rows_rejected > len(report.errors):
+        print(f"   ... and {report.rows_rejected - len(report.errors):,} more rejected rows")
+    return 0
+
+
+async def run_user_provisioning(args: argparse.Namespace) -> UserProvisionReport:
+    """Read a provisioning file and create its users in one batch."""
+    with open(args.path, newline="", encoding="utf-8-sig") as source:
+        rows = read_provision_rows(source, args.path)
+    try:
+        async with new_async_session() as db:
+            return await provision_users(db, rows)
+    finally:
+        await async_engine.dispose()
+
+
+def provision_users_command(args: argparse.Namespace) -> int:
+    """
+    Create volunteer accounts from a CSV or JSON file.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        int: Process exit code
+    """
+    try:
+        report = asyncio.run(run_user_provisioning(args))
+    except (OSError, UserProvisionFileError) as exc:
+        print(f"❌ {exc}", file=sys.stderr)
+        return 1
+
+    print(
+        f"✅ Provisioned {args.path}: {report.created:,} created, {report.existing:,} existing, "
+        f"{report.rejected:,} rejected in {report.elapsed_seconds:,.1f}s"
+    )
+    for result in report.results:
+        if result.status != UserProvisionStatus.CREATED:
+            print(f"   row {result.row} ({result.email or 'no email'}): {result.error}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with all subcommands."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="VEP MVP admin commands")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = subcommands.add_parser(
+        "reconcile-counters",
+        help="Recompute assignment voter_count/completed_count from source tables",
+    )
+    reconcile.set_defaults(handler=reconcile_counters)
+
+    voters = subcommands.add_parser(
+        "import-voters",
+        help="Upsert voters from a CSV (or VAN/PDI-style) voter file",
+    )
+    voters.add_argument("path", help="Path to the voter CSV file")
+    voters.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.VOTER_IMPORT_CHUNK_SIZE,
+        help="Rows validated and loaded per chunk (single worker only)",
+    )
+    voters.add_argument(
+        "--workers",
+        type=int,
+        default=settings.VOTER_IMPORT_WORKERS,
+        help="Validation processes, capped at the CPU core count "
+        "(1 = no process pool, 0 = one per CPU core)",
+    )
+    voters.add_argument(
+        "--delete-missing",
+        action="store_true",
+        help="Treat the file as complete and soft-delete voters not in it",
+    )
+    voters.set_defaults(handler=import_voters)
+
+    tombstones = subcommands.add_parser(
+        "prune-sync-tombstones",
+        help="Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS",
+    )
+    tombstones.set_defaults(handler=prune_sync_tombstones)
+
+    provision = subcommands.add_parser(
+        "provision-users",
+        help="Create volunteer accounts from a CSV file or JSON array",
+    )
+    provision.add_argument("path", help="Path to the CSV or JSON file")
+    provision.set_defaults(handler=provision_users_command)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point."""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
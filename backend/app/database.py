@@ -0,0 +1,273 @@
+"""
+VEP MVP Backend - Database
+
+Database engine construction and connection pool instrumentation:
+- Synchronous (psycopg2) and asynchronous (asyncpg) engines
+- Pooling mode selection (in-process QueuePool or an external pooler)
+- Pool checkout-wait metrics
+- Raw asyncpg connections for driver-level operations (COPY)
+"""
+
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import uuid4
+
+import asyncpg
+
+from sqlalchemy import Engine, exc, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from sqlmodel import create_engine
+
+from app.config import Settings, settings
+
+
+class PoolMode:
+    """Connection pooling mode constants."""
+    QUEUE = "queue"
+    EXTERNAL = "external"
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters describing how long checkouts wait on a pool.
+
+    Wait time covers everything between asking the pool for a connection
+    and receiving one: queueing behind other checkouts when the pool is
+    exhausted, plus connection setup when a new connection has to be opened.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record_checkout(self, waited: float) -> None:
+        """Record a successful checkout that waited `waited` seconds."""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def record_timeout(self, waited: float) -> None:
+        """Record a checkout that gave up after `waited` seconds."""
+        with self._lock:
+            self.timeouts += 1
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def snapshot(self) -> dict:
+        """Return the current counters as a JSON-serializable dict."""
+        with self._lock:
+            average = self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_seconds * 1000, 3),
+                "avg_wait_ms": round(average * 1000, 3),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+class _CheckoutTimingMixin:
+    """
+    Pool mixin that records checkout wait time into the pool's own `metrics`.
+
+    Each pool instance gets its own counters, so engines sharing a pool
+    class (the sync and async engines, or engines built in tests) never
+    report each other's checkouts.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """QueuePool that records checkout wait metrics."""
+
+
+class InstrumentedNullPool(_CheckoutTimingMixin, NullPool):
+    """NullPool that records connection setup time as checkout wait."""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """Asyncio-compatible QueuePool that records checkout wait metrics."""
+
+
+class InstrumentedAsyncNullPool(_CheckoutTimingMixin, NullPool):
+    """NullPool for the async engine that records connection setup time."""
+
+
+def pool_options(app_settings: Settings, queue_pool: type, null_pool: type) -> dict:
+    """
+    Build pool keyword arguments for `create_engine` from settings.
+
+    Args:
+        app_settings: Application settings
+        queue_pool: Pool class to use in queue mode
+        null_pool: Pool class to use in external pooler mode
+
+    Returns:
+        dict: Keyword arguments for engine construction
+
+    Raises:
+        ValueError: If DB_POOL_MODE is not a known mode
+    """
+    if app_settings.DB_POOL_MODE == PoolMode.QUEUE:
+        return {
+            "poolclass": queue_pool,
+            "pool_size": app_settings.DB_POOL_SIZE,
+            "max_overflow": app_settings.DB_MAX_OVERFLOW,
+            "pool_timeout": app_settings.DB_POOL_TIMEOUT,
+            "pool_recycle": app_settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": app_settings.DB_POOL_PRE_PING,
+        }
+    if app_settings.DB_POOL_MODE == PoolMode.EXTERNAL:
+        # An external pooler (e.g. PgBouncer in transaction mode) owns the
+        # server connections, so holding our own idle connections would only
+        # pin its slots. Open per checkout and hand the connection straight back.
+        return {"poolclass": null_pool}
+    raise ValueError(
+        f"Unknown DB_POOL_MODE {app_settings.DB_POOL_MODE!r}; "
+        f"expected {PoolMode.QUEUE!r} or {PoolMode.EXTERNAL!r}"
+    )
+
+
+def create_db_engine(url: str, app_settings: Settings = settings) -> Engine:
+    """
+    Create the synchronous database engine using the configured pooling mode.
+
+    Args:
+        url: Database URL
+        app_settings: Application settings
+
+    Returns:
+        Engine: Configured SQLAlchemy engine
+    """
+    return create_engine(
+        url,
+        echo=app_settings.DEBUG,
+        **pool_options(app_settings, InstrumentedQueuePool, InstrumentedNullPool),
+    )
+
+
+def async_database_url(url: str) -> str:
+    """
+    Convert a PostgreSQL URL to its asyncpg equivalent.
+
+    libpq's `sslmode` query parameter is renamed to asyncpg's `ssl`.
+
+    Args:
+        url: Database URL (postgresql://, postgres:// or postgresql+psycopg2://)
+
+    Returns:
+        str: URL using the postgresql+asyncpg driver
+    """
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    parsed = make_url(url)
+    if not parsed.drivername.startswith("postgresql"):
+        return url
+    query = dict(parsed.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    parsed = parsed.set(drivername="postgresql+asyncpg", query=query)
+    return parsed.render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str, app_settings: Settings = settings) -> AsyncEngine:
+    """
+    Create the asyncpg-backed engine using the configured pooling mode.
+
+    Args:
+        url: Database URL; converted to the asyncpg driver
+        app_settings: Application settings
+
+    Returns:
+        AsyncEngine: Configured async SQLAlchemy engine
+    """
+    options = pool_options(app_settings, InstrumentedAsyncQueuePool, InstrumentedAsyncNullPool)
+    if app_settings.DB_POOL_MODE == PoolMode.EXTERNAL:
+        # PgBouncer in transaction mode may run consecutive statements on
+        # different server connections, so named prepared statements must
+        # not be cached or reused.
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return create_async_engine(
+        async_database_url(url),
+        echo=app_settings.DEBUG,
+        **options,
+    )
+
+
+def pool_status(db_engine: Engine | AsyncEngine) -> dict:
+    """
+    Describe a pool's current occupancy and checkout-wait metrics.
+
+    Args:
+        db_engine: Engine whose pool should be described
+
+    Returns:
+        dict: Pool occupancy and wait metrics
+    """
+    pool = db_engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status["checkout_wait"] = metrics.snapshot()
+    return status
+
+
+# Database engines
+engine = create_db_engine(settings.DATABASE_URL)
+async_engine = create_async_db_engine(settings.DATABASE_URL)
+
+
+@asynccontextmanager
+async def asyncpg_connection() -> AsyncIterator[asyncpg.Connection]:
+    """
+    Check out a raw asyncpg connection from the async engine's pool.
+
+    For driver-level APIs SQLAlchemy does not expose, such as COPY. The
+    connection is returned to the pool (and any open transaction rolled
+    back) on exit.
+
+    Yields:
+        asyncpg.Connection: Driver connection
+    """
+    async with async_engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        yield raw_connection.driver_connection
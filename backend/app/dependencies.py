@@ -7,24 +7,19 @@ Provides dependency injection for FastAPI endpoints:
 - User context
 """
 
-from typing import Annotated, Optional
+from typing import Annotated, AsyncGenerator, Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
-from sqlmodel import Session, create_engine, select
-from sqlalchemy.pool import NullPool
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.config import settings
-from app.models.user import User
-
-# Database engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    poolclass=NullPool,  # Use NullPool for serverless environments
-)
+from app.database import async_engine, engine
+from app.models.user import TokenType, User
+from app.user_cache import load_user
 
 # Security scheme
 security = HTTPBearer()
@@ -41,16 +36,48 @@ def get_db() -> Session:
         yield session
 
 
+def new_async_session() -> AsyncSession:
+    """
+    Create an asyncpg-backed database session.
+    
+    Objects are not expired on commit, so routes can build responses from
+    committed rows without triggering implicit (and forbidden) lazy loads.
+    Used directly by streaming responses, whose bodies outlive the request's
+    dependencies.
+    
+    Returns:
+        AsyncSession: SQLModel async database session
+    """
+    return AsyncSession(async_engine, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an asyncpg-backed database session.
+    
+    Yields:
+        AsyncSession: SQLModel async database session
+    """
+    async with new_async_session() as session:
+        yield session
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> User:
     """
     Dependency that extracts and validates the current user from JWT token.
     
+    The user record normally comes from the in-process user cache, so
+    most requests make no database round trip here. With STATELESS_AUTH,
+    tokens carrying a role claim are trusted outright: the returned User
+    holds only the id, role and token version signed into the token, and
+    the database is not touched at all.
+    
     Args:
         credentials: HTTP bearer token credentials
-        db: Database session
+        db: Database session, only used on a user cache miss
         
     Returns:
         User: The authenticated user
@@ -74,12 +101,16 @@ async def get_current_user(
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
+        # Refresh tokens only buy new access tokens at /auth/refresh
+        if payload.get("type", TokenType.ACCESS) != TokenType.ACCESS:
+            raise credentials_exception
     except JWTError:
         raise credentials_exception
     
-    # Fetch user from database
-    statement = select(User).where(User.id == UUID(user_id))
-    user = db.exec(statement).first()
+    if settings.STATELESS_AUTH and "role" in payload:
+        return User(id=UUID(user_id), role=payload["role"], token_version=payload.get("ver", 0))
+    
+    user = await load_user(db, UUID(user_id))
     
     if user is None:
         raise credentials_exception
@@ -158,3 +189,4 @@ CurrentUser = Annotated[User, Depends(get_current_active_user)]
 ManagerUser = Annotated[User, Depends(require_manager)]
 AdminUser = Annotated[User, Depends(require_admin)]
 DatabaseSession = Annotated[Session, Depends(get_db)]
+AsyncDatabaseSession = Annotated[AsyncSession, Depends(get_async_db)]
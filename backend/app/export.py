@@ -0,0 +1,175 @@
+"""
+VEP MVP Backend - Export
+
+Streams query results as NDJSON or CSV for bulk exports (e.g. nightly
+sync back to VAN/PDI).
+
+Rows are read from a server-side cursor in batches of EXPORT_BATCH_SIZE
+and written to the response as each batch arrives, so memory use stays
+constant regardless of table size.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, Callable, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.dependencies import new_async_session
+from app.models.voter import PointGeometry
+
+# Rows fetched from the server-side cursor per round trip
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat:
+    """Export format constants."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def point_columns(statement: Select) -> set[str]:
+    """Names of a statement's selected point geometry columns."""
+    return {
+        column.name
+        for column in statement.selected_columns
+        if isinstance(column.type, PointGeometry)
+    }
+
+
+def export_fields(statement: Select) -> list[str]:
+    """
+    List output field names for a statement's selected columns.
+
+    Point geometry columns are flattened into latitude and longitude.
+
+    Args:
+        statement: SELECT of plain columns
+
+    Returns:
+        list[str]: Field names in output order
+    """
+    points = point_columns(statement)
+    fields = []
+    for column in statement.selected_columns:
+        if column.name in points:
+            fields.extend(["latitude", "longitude"])
+        else:
+            fields.append(column.name)
+    return fields
+
+
+def _export_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def row_to_record(row, points: set[str]) -> dict:
+    """
+    Convert a result row into a flat, JSON/CSV-safe record.
+
+    Args:
+        row: Result row of plain columns
+        points: Names of point geometry columns to flatten
+
+    Returns:
+        dict: Field name to serializable value
+    """
+    record = {}
+    for key, value in row._mapping.items():
+        if key in points:
+            record["latitude"] = value.latitude if value else None
+            record["longitude"] = value.longitude if value else None
+        else:
+            record[key] = _export_value(value)
+    return record
+
+
+async def stream_export(
+    statement: Select,
+    export_format: str,
+    session_factory: Optional[Callable[[], AsyncSession]] = None,
+) -> AsyncIterator[str]:
+    """
+    Stream a statement's rows as NDJSON lines or CSV text.
+
+    The session is opened here rather than taken from the request, because
+    the response body is produced after the endpoint function has returned.
+
+    Args:
+        statement: SELECT of plain columns to export
+        export_format: One of ExportFormat
+        session_factory: Session constructor (defaults to a new async session)
+
+    Yields:
+        str: Chunk of output covering one batch of rows
+    """
+    fields = export_fields(statement)
+    points = point_columns(statement)
+    session_factory = session_factory or new_async_session
+
+    async with session_factory() as session:
+        result = await session.stream(
+            statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        if export_format == ExportFormat.CSV:
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=fields)
+            writer.writeheader()
+            yield buffer.getvalue()
+
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+            if export_format == ExportFormat.CSV:
+                writer = csv.DictWriter(buffer, fieldnames=fields)
+                writer.writerows(row_to_record(row, points) for row in rows)
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(row_to_record(row, points), separators=(",", ":")))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+
+
+def export_response(statement: Select, export_format: str, filename: str) -> StreamingResponse:
+    """
+    Build a streaming download response for an export.
+
+    Args:
+        statement: SELECT of plain columns to export
+        export_format: Requested format
+        filename: Download file name without extension
+
+    Returns:
+        StreamingResponse: Response streaming the export body
+
+    Raises:
+        HTTPException: If the format is not supported
+    """
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format: {export_format}",
+        )
+    return StreamingResponse(
+        stream_export(statement, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
@@ -0,0 +1,139 @@
+"""
+VEP MVP Backend - Geometry
+
+Codec for the PostGIS points stored in voters.location and
+contact_logs.location (GEOMETRY(POINT, 4326)).
+
+Points are read as binary: ST_AsBinary returns 21-byte WKB (byte order,
+geometry type, x, y), which is decoded with struct instead of parsing
+ST_AsText output. EWKB (with an embedded SRID, as from ST_AsEWKB) and
+big-endian input are accepted too. For whole result sets,
+`decode_points` decodes every point in one NumPy call.
+
+Coordinates are (latitude, longitude) throughout the API; WKB stores
+them as x = longitude, y = latitude.
+"""
+
+import math
+import struct
+from typing import Optional, Sequence
+
+import numpy as np
+from sqlalchemy import LargeBinary, func
+
+SRID = 4326
+
+WKB_POINT = 1
+POINT_WKB_SIZE = 21
+
+# EWKB flags carried in the geometry type word
+EWKB_SRID_FLAG = 0x20000000
+EWKB_FLAGS = 0xE0000000
+
+# A little-endian 2D WKB point, as ST_AsBinary returns it on x86 and ARM;
+# PLAIN_POINT is the same layout for struct
+LITTLE_ENDIAN_POINT = np.dtype([("order", "u1"), ("type", "<u4"), ("x", "<f8"), ("y", "<f8")])
+PLAIN_POINT = struct.Struct("<BIdd")
+
+
+def decode_point(wkb: bytes) -> Optional[tuple[float, float]]:
+    """
+    Decode a WKB or EWKB point.
+
+    Args:
+        wkb: Point bytes, either byte order, with or without an SRID; Z and
+            M ordinates are ignored
+
+    Returns:
+        Optional[tuple]: (latitude, longitude), or None for an empty point
+
+    Raises:
+        ValueError: If the bytes are not a point or are truncated
+    """
+    if len(wkb) == POINT_WKB_SIZE and wkb[0] == 1:
+        _, geometry_type, longitude, latitude = PLAIN_POINT.unpack(wkb)
+        if geometry_type == WKB_POINT:
+            if math.isnan(longitude) or math.isnan(latitude):
+                return None
+            return latitude, longitude
+
+    if len(wkb) < 5 or wkb[0] not in (0, 1):
+        raise ValueError("Not a WKB geometry")
+    byte_order = "<" if wkb[0] == 1 else ">"
+    (geometry_type,) = struct.unpack_from(f"{byte_order}I", wkb, 1)
+    offset = 9 if geometry_type & EWKB_SRID_FLAG else 5
+    # ISO WKB encodes Z/M as 1001, 2001, 3001; EWKB as high flag bits
+    if (geometry_type & ~EWKB_FLAGS) % 1000 != WKB_POINT:
+        raise ValueError(f"Not a WKB point (geometry type {geometry_type:#x})")
+    try:
+        longitude, latitude = struct.unpack_from(f"{byte_order}dd", wkb, offset)
+    except struct.error as exc:
+        raise ValueError("Truncated WKB point") from exc
+    if math.isnan(longitude) or math.isnan(latitude):
+        return None
+    return latitude, longitude
+
+
+def decode_points(values: Sequence[Optional[bytes]]) -> np.ndarray:
+    """
+    Decode a column of WKB points at once.
+
+    Plain little-endian WKB (what ST_AsBinary returns) is decoded in a
+    single NumPy pass; anything else falls back to `decode_point` per
+    value.
+
+    Args:
+        values: WKB values, None for NULL
+
+    Returns:
+        np.ndarray: (n, 2) latitudes and longitudes; NaN rows for NULL
+            and empty points
+
+    Raises:
+        ValueError: If a value is not a point
+    """
+    points = np.full((len(values), 2), np.nan)
+    present = [i for i, value in enumerate(values) if value is not None]
+    if not present:
+        return points
+    blobs = [values[i] for i in present]
+
+    if all(len(blob) == POINT_WKB_SIZE for blob in blobs):
+        records = np.frombuffer(b"".join(blobs), dtype=LITTLE_ENDIAN_POINT)
+        if np.all(records["order"] == 1) and np.all(records["type"] == WKB_POINT):
+            points[present, 0] = records["y"]
+            points[present, 1] = records["x"]
+            return points
+
+    for i, blob in zip(present, blobs):
+        point = decode_point(bytes(blob))
+        if point is not None:
+            points[i] = point
+    return points
+
+
+def encode_point(latitude: float, longitude: float) -> str:
+    """EWKT for a point, as bound through ST_GeomFromEWKT."""
+    return f"SRID={SRID};POINT({longitude} {latitude})"
+
+
+def encode_polygon(vertices: Sequence[tuple[float, float]]) -> str:
+    """
+    EWKT for a polygon, closing the ring if needed.
+
+    Args:
+        vertices: (latitude, longitude) pairs of the outer ring
+
+    Returns:
+        str: EWKT, as bound through ST_GeomFromEWKT
+    """
+    ring = list(vertices)
+    if ring[0] != ring[-1]:
+        ring.append(ring[0])
+    points = ", ".join(f"{longitude} {latitude}" for latitude, longitude in ring)
+    return f"SRID={SRID};POLYGON(({points}))"
+
+
+def point_wkb(column):
+    """Select a geometry column as raw WKB bytes, for `decode_points`."""
+    return func.ST_AsBinary(column, type_=LargeBinary)
@@ -5,15 +5,24 @@ FastAPI application with all routes and middleware configured.
 """
 
 from fastapi import FastAPI
+from fastapi.datastructures import Default
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from app.config import settings
-from app.routes import auth, assignments, contact_logs, users, voters
+from app.database import async_engine, engine, pool_status
+from app.passwords import password_hasher
+from app.responses import FastJSONResponse, fast_json_enabled
+from app.routes import auth, assignments, contact_logs, sync, users, voters
+from app.user_cache import user_change_listener
 
 app = FastAPI(
     title="VEP MVP API",
     description="Voter Engagement Platform MVP - Backend API",
     version="0.1.0",
+    # Kept a default (not a fixed class) so routes with a response_model
+    # still encode through pydantic-core
+    default_response_class=Default(FastJSONResponse if fast_json_enabled() else JSONResponse),
 )
 
 # Configure CORS
@@ -31,6 +40,7 @@ app.include_router(users.router, prefix="/users", tags=["Users"])
 app.include_router(assignments.router, prefix="/assignments", tags=["Assignments"])
 app.include_router(voters.router, prefix="/voters", tags=["Voters"])
 app.include_router(contact_logs.router, prefix="/contact-logs", tags=["Contact Logs"])
+app.include_router(sync.router, prefix="/sync", tags=["Sync"])
 
 
 @app.get("/")
@@ -59,6 +69,26 @@ async def health_check():
     }
 
 
+@app.get("/health/db")
+async def database_health_check():
+    """
+    Connection pool occupancy and checkout-wait metrics.
+    """
+    return {
+        "pool_mode": settings.DB_POOL_MODE,
+        "pool": pool_status(engine),
+        "async_pool": pool_status(async_engine),
+    }
+
+
+@app.get("/health/passwords")
+async def password_hashing_health_check():
+    """
+    Password hashing pool queue depth and wait metrics.
+    """
+    return password_hasher.snapshot()
+
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -66,6 +96,8 @@ async def startup_event():
     """
     print(f"🚀 VEP MVP API starting in {settings.ENVIRONMENT} mode")
     print(f"📊 Debug mode: {settings.DEBUG}")
+    if settings.USER_CACHE_LISTEN:
+        user_change_listener.start()
 
 
 @app.on_event("shutdown")
@@ -74,6 +106,10 @@ async def shutdown_event():
     Cleanup on application shutdown.
     """
     print("👋 VEP MVP API shutting down")
+    await user_change_listener.stop()
+    password_hasher.shutdown()
+    engine.dispose()
+    await async_engine.dispose()
 
 
 if __name__ == "__main__":
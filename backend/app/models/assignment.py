@@ -10,6 +10,8 @@ from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel
 
+from app.models.voter import Coordinate
+
 
 class AssignmentStatus:
     """Assignment status constants."""
@@ -39,6 +41,9 @@ class Assignment(AssignmentBase, table=True):
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id")
+    # Progress counters maintained by database triggers; never written by the API
+    voter_count: int = Field(default=0)
+    completed_count: int = Field(default=0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -73,6 +78,18 @@ class AssignmentUpdate(SQLModel):
     status: Optional[str] = None
 
 
+class AssignmentVotersRequest(SQLModel):
+    """Schema for adding or removing voters on an assignment in bulk."""
+    voter_ids: list[UUID] = Field(min_length=1)
+
+
+class AssignmentVotersResult(SQLModel):
+    """Schema for the outcome of a bulk voter change on an assignment."""
+    assignment_id: UUID
+    voter_ids: list[UUID] = Field(default_factory=list)
+    skipped_count: int = 0
+
+
 class AssignmentRead(AssignmentBase):
     """Schema for reading an assignment."""
     id: UUID
@@ -83,6 +100,81 @@ class AssignmentRead(AssignmentBase):
     updated_at: datetime
 
 
+class LastContact(SQLModel):
+    """Schema for the most recent contact with a voter on an assignment."""
+    date: datetime
+    type: str
+    result: Optional[str] = None
+
+
+class AssignmentPacketVoter(SQLModel):
+    """Schema for a voter on an assignment, with its last contact there."""
+    id: UUID
+    voter_id: str
+    first_name: str
+    last_name: str
+    address: str
+    city: str
+    zip: str
+    party_affiliation: Optional[str] = None
+    support_level: Optional[int] = None
+    sequence_order: Optional[int] = None
+    location: Optional[Coordinate] = None
+    last_contact: Optional[LastContact] = None
+
+
 class AssignmentWithVoters(AssignmentRead):
     """Schema for reading an assignment with voter details."""
-    voters: list = Field(default_factory=list)
+    voters: list[AssignmentPacketVoter] = Field(default_factory=list)
+
+
+class AssignmentPacket(SQLModel):
+    """Schema for a complete offline assignment packet, served gzip-compressed."""
+    assignment: AssignmentRead
+    voters: list[AssignmentPacketVoter] = Field(default_factory=list)
+    etag: str
+    built_at: datetime
+
+
+class RouteOptimizeRequest(SQLModel):
+    """Schema for optimizing an assignment's walking order."""
+    start: Optional[Coordinate] = None
+
+
+class RouteOptimizeResult(SQLModel):
+    """Schema for the outcome of a route optimization."""
+    assignment_id: UUID
+    voter_count: int
+    routed_count: int
+    initial_distance_meters: float
+    optimized_distance_meters: float
+    voter_ids: list[UUID] = Field(default_factory=list)
+
+
+class TurfCutRequest(SQLModel):
+    """
+    Schema for cutting turfs from a filtered set of voters.
+    
+    The number of turfs is `turf_count` if given, else enough turfs of
+    `doors_per_turf` voters, else one per canvasser in `user_ids`. Turfs
+    are handed to `user_ids` round-robin, or to the requesting manager
+    when no canvassers are given.
+    """
+    zips: list[str] = Field(default_factory=list)
+    support_levels: list[int] = Field(default_factory=list)
+    party_affiliations: list[str] = Field(default_factory=list)
+    polygon: Optional[list[Coordinate]] = Field(default=None, min_length=3)
+    include_assigned: bool = False
+    turf_count: Optional[int] = Field(default=None, ge=1)
+    doors_per_turf: Optional[int] = Field(default=None, ge=1)
+    user_ids: list[UUID] = Field(default_factory=list)
+    name_prefix: str = "Turf"
+    description: Optional[str] = None
+    assigned_date: date = Field(default_factory=date.today)
+    due_date: Optional[date] = None
+
+
+class TurfCutResult(SQLModel):
+    """Schema for the assignments created by a turf cut."""
+    voter_count: int
+    assignments: list[AssignmentRead] = Field(default_factory=list)
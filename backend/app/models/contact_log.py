@@ -8,9 +8,10 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Column
 from sqlmodel import Field, SQLModel
 
-from app.models.voter import Coordinate
+from app.models.voter import Coordinate, PointGeometry
 
 
 class ContactType:
@@ -25,6 +26,11 @@ class ContactType:
     DECEASED = "deceased"
 
 
+CONTACT_TYPES = frozenset(
+    value for key, value in vars(ContactType).items() if not key.startswith("_")
+)
+
+
 class ContactLogBase(SQLModel):
     """Base contact log fields shared across schemas."""
     assignment_id: UUID
@@ -32,6 +38,8 @@ class ContactLogBase(SQLModel):
     contact_type: str
     result: Optional[str] = None
     support_level: Optional[int] = Field(default=None, ge=1, le=5)
+    # Generated on-device per log; retries with the same key return the original row
+    idempotency_key: Optional[UUID] = None
 
 
 class ContactLog(ContactLogBase, table=True):
@@ -46,8 +54,7 @@ class ContactLog(ContactLogBase, table=True):
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key="users.id")
-    # Note: location is stored as GEOMETRY(POINT, 4326) in PostgreSQL
-    # We'll handle conversion in the routes layer
+    location: Optional[Coordinate] = Field(default=None, sa_column=Column(PointGeometry()))
     contacted_at: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -55,6 +62,35 @@ class ContactLog(ContactLogBase, table=True):
 class ContactLogCreate(ContactLogBase):
     """Schema for creating a new contact log."""
     location: Optional[Coordinate] = None
+    # Set by offline clients to preserve when the contact actually happened
+    contacted_at: Optional[datetime] = None
+
+
+class ContactLogBatchCreate(SQLModel):
+    """Schema for uploading many contact logs in one request."""
+    logs: list[ContactLogCreate] = Field(min_length=1)
+
+
+class BatchItemStatus:
+    """Per-item outcome constants for batch uploads."""
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    FAILED = "failed"
+
+
+class ContactLogBatchItemResult(SQLModel):
+    """Outcome of a single log within a batch upload."""
+    index: int
+    status: str
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class ContactLogBatchResult(SQLModel):
+    """Schema for the response to a batch upload."""
+    created: int = 0
+    results: list[ContactLogBatchItemResult] = Field(default_factory=list)
+    errors: list[ContactLogBatchItemResult] = Field(default_factory=list)
 
 
 class ContactLogUpdate(SQLModel):
@@ -76,3 +112,10 @@ class ContactLogRead(ContactLogBase):
 class ContactLogWithDetails(ContactLogRead):
     """Schema for reading a contact log with voter details."""
     voter_name: Optional[str] = None
+
+
+class ContactLogPage(SQLModel):
+    """Schema for one page of contact logs; pass next_cursor back to fetch the next."""
+    logs: list[ContactLogWithDetails]
+    limit: int
+    next_cursor: Optional[str] = None
@@ -0,0 +1,58 @@
+"""
+VEP MVP Backend - Sync Models
+
+Pydantic schemas for delta sync of a canvasser's assignments.
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+from app.models.assignment import AssignmentRead
+from app.models.contact_log import ContactLogRead
+from app.models.voter import VoterRead
+
+
+class SyncEntity:
+    """Tombstone entity constants (match sync_tombstones.entity)."""
+    ASSIGNMENT = "assignment"
+    ASSIGNMENT_VOTER = "assignment_voter"
+    CONTACT_LOG = "contact_log"
+
+
+class SyncAssignmentVoter(SQLModel):
+    """Schema for an assignment's voter membership and walking order."""
+    id: UUID
+    assignment_id: UUID
+    voter_id: UUID
+    sequence_order: Optional[int] = None
+
+
+class SyncVoter(VoterRead):
+    """Schema for a synced voter; deleted_at is set once the voter is removed."""
+    deleted_at: Optional[datetime] = None
+
+
+class SyncTombstone(SQLModel):
+    """Schema for a deleted row the client should drop."""
+    entity: str
+    id: UUID
+
+
+class SyncChanges(SQLModel):
+    """
+    Schema for changes since a sync cursor.
+
+    Rows are full current versions to upsert locally. When `reset` is true
+    the response is a full sync and the client should drop anything it did
+    not receive. Pass next_cursor as `since` on the next sync.
+    """
+    assignments: list[AssignmentRead] = Field(default_factory=list)
+    assignment_voters: list[SyncAssignmentVoter] = Field(default_factory=list)
+    voters: list[SyncVoter] = Field(default_factory=list)
+    contact_logs: list[ContactLogRead] = Field(default_factory=list)
+    deleted: list[SyncTombstone] = Field(default_factory=list)
+    reset: bool = False
+    next_cursor: str
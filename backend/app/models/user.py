@@ -19,6 +19,12 @@ class UserRole:
     CANVASSER = "canvasser"
 
 
+class TokenType:
+    """JWT token type constants (the `type` claim)."""
+    ACCESS = "access"
+    REFRESH = "refresh"
+
+
 class UserBase(SQLModel):
     """Base user fields shared across schemas."""
     email: EmailStr
@@ -33,10 +39,14 @@ class User(UserBase, table=True):
     
     Stores user metadata for authentication and role-based access control.
     Supabase Auth handles authentication; this table stores additional metadata.
+    
+    token_version is signed into every token; bumping it (on a role change)
+    revokes the user's outstanding refresh tokens.
     """
     __tablename__ = "users"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
+    token_version: int = Field(default=0)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -59,3 +69,38 @@ class UserRead(UserBase):
     id: UUID
     created_at: datetime
     updated_at: datetime
+
+
+class UserProvisionStatus:
+    """Per-row bulk provisioning outcome constants."""
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+class UserProvisionRow(UserBase):
+    """
+    Schema for one volunteer in a bulk provisioning batch.
+    
+    There is no password: credentials live in Supabase Auth, which
+    provisioned volunteers are invited through.
+    """
+
+
+class UserProvisionResult(SQLModel):
+    """Outcome of one bulk provisioning row (row numbers start at 1)."""
+    row: int
+    email: Optional[str] = None
+    status: str
+    user_id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class UserProvisionReport(SQLModel):
+    """Schema for bulk provisioning results."""
+    created: int = 0
+    existing: int = 0
+    rejected: int = 0
+    results: list[UserProvisionResult] = Field(default_factory=list)
+    elapsed_seconds: float = 0.0
@@ -8,8 +8,12 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Column, LargeBinary, func
+from sqlalchemy.types import UserDefinedType
 from sqlmodel import Field, SQLModel
 
+from app.geometry import decode_point, encode_point
+
 
 class Coordinate(SQLModel):
     """Geographic coordinate."""
@@ -17,6 +21,58 @@ class Coordinate(SQLModel):
     longitude: float
 
 
+def wkb_to_coordinate(wkb: bytes) -> Optional[Coordinate]:
+    """
+    Decode a WKB point (as returned by ST_AsBinary) into a coordinate.
+    
+    Args:
+        wkb: WKB or EWKB point (see app.geometry.decode_point)
+        
+    Returns:
+        Optional[Coordinate]: Decoded coordinate, or None for an empty point
+    """
+    point = decode_point(wkb)
+    if point is None:
+        return None
+    return Coordinate(latitude=point[0], longitude=point[1])
+
+
+class PointGeometry(UserDefinedType):
+    """
+    PostGIS GEOMETRY(POINT, 4326) column mapped to `Coordinate`.
+    
+    Values are bound through ST_GeomFromEWKT, so inserts and updates carry
+    the point in the same statement as the rest of the row, and selected
+    through ST_AsBinary, so reads decode fixed-width WKB instead of text.
+    """
+    cache_ok = True
+    
+    def get_col_spec(self, **kw) -> str:
+        return "GEOMETRY(POINT, 4326)"
+    
+    def bind_expression(self, bindvalue):
+        return func.ST_GeomFromEWKT(bindvalue, type_=self)
+    
+    def column_expression(self, col):
+        return func.ST_AsBinary(col, type_=self)
+    
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return None
+            if isinstance(value, dict):
+                value = Coordinate(**value)
+            return encode_point(value.latitude, value.longitude)
+        return process
+    
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None:
+                return None
+            return wkb_to_coordinate(bytes(value))
+        return process
+
+
 class VoterBase(SQLModel):
     """Base voter fields shared across schemas."""
     voter_id: str = Field(unique=True, index=True)
@@ -44,8 +100,11 @@ class Voter(VoterBase, table=True):
     __tablename__ = "voters"
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    # Note: location is stored as GEOMETRY(POINT, 4326) in PostgreSQL
-    # We'll handle conversion in the routes layer
+    location: Optional[Coordinate] = Field(default=None, sa_column=Column(PointGeometry()))
+    # Hash of the normalized voter file record, maintained by the importer
+    content_hash: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))
+    # Set when a voter drops out of the voter file; excluded from lists
+    deleted_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -79,6 +138,33 @@ class VoterRead(VoterBase):
     updated_at: datetime
 
 
+class VoterPage(SQLModel):
+    """Schema for one page of voters; pass next_cursor back to fetch the next."""
+    voters: list[VoterRead]
+    limit: int
+    next_cursor: Optional[str] = None
+
+
 class VoterWithContactHistory(VoterRead):
     """Schema for reading a voter with contact history."""
     contact_history: list = Field(default_factory=list)
+
+
+class VoterImportRejectedRow(SQLModel):
+    """A voter file row that failed validation."""
+    line: int
+    error: str
+
+
+class VoterImportReport(SQLModel):
+    """Schema for voter import progress and results."""
+    rows_read: int = 0
+    rows_loaded: int = 0
+    rows_rejected: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    errors: list[VoterImportRejectedRow] = Field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
@@ -0,0 +1,213 @@
+"""
+VEP MVP Backend - Assignment Packets
+
+Pre-built, gzip-compressed offline packets of an assignment's voters.
+
+A packet is built once per assignment version and cached in-process.
+The version is assignments.packet_version, which triggers replace with a
+new sequence value on any committed write to the assignment, its
+memberships, its voters or its contact logs, and any delete of those
+(migration 009). Checking it is one primary key lookup, so a refresh of
+an unchanged assignment never rebuilds the packet, and a client holding
+the current ETag gets a 304 without a body.
+"""
+
+import gzip
+import hashlib
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from fastapi import Response, status
+from sqlmodel import select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.cache import TTLCache
+from app.config import settings
+from app.models.assignment import (
+    Assignment,
+    AssignmentPacket,
+    AssignmentPacketVoter,
+    AssignmentRead,
+)
+from app.models.voter import PointGeometry
+
+# Primary key lookup of the trigger-maintained version (migration 009)
+PACKET_VERSION_QUERY = text("""
+    SELECT user_id, CAST(packet_version AS TEXT) AS version
+    FROM assignments
+    WHERE id = :assignment_id
+""")
+
+# One LATERAL probe per voter of idx_contact_logs_assignment_voter_recent
+# (migration 007) for the last contact, instead of a correlated subquery
+ASSIGNMENT_VOTERS_QUERY = text("""
+    SELECT
+        v.id, v.voter_id, v.first_name, v.last_name, v.address,
+        v.city, v.zip, v.party_affiliation, v.support_level,
+        av.sequence_order,
+        ST_AsBinary(v.location) AS location,
+        lc.contacted_at AS last_contacted_at,
+        lc.contact_type AS last_contact_type,
+        lc.result AS last_contact_result
+    FROM assignment_voters av
+    JOIN voters v ON v.id = av.voter_id
+    LEFT JOIN LATERAL (
+        SELECT cl.contacted_at, cl.contact_type, cl.result
+        FROM contact_logs cl
+        WHERE cl.assignment_id = av.assignment_id
+          AND cl.voter_id = av.voter_id
+        ORDER BY cl.contacted_at DESC
+        LIMIT 1
+    ) lc ON TRUE
+    WHERE av.assignment_id = :assignment_id
+    ORDER BY av.sequence_order NULLS LAST, v.last_name, v.first_name
+""").columns(location=PointGeometry())
+
+
+class CachedPacket(NamedTuple):
+    """A built packet: its ETag and gzip-compressed JSON body."""
+    etag: str
+    body: bytes
+
+
+packet_cache: TTLCache[UUID, CachedPacket] = TTLCache(
+    maxsize=settings.ASSIGNMENT_PACKET_CACHE_SIZE,
+    ttl=settings.ASSIGNMENT_PACKET_CACHE_TTL_SECONDS,
+)
+
+
+def packet_etag(version: str) -> str:
+    """Quoted ETag for an assignment version string."""
+    return '"' + hashlib.blake2b(version.encode(), digest_size=12).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+async def get_packet_version(
+    db: AsyncSession,
+    assignment_id: UUID,
+) -> Optional[tuple[UUID, str]]:
+    """
+    Read an assignment's owner and current packet ETag.
+
+    Args:
+        db: Database session
+        assignment_id: Assignment ID
+
+    Returns:
+        tuple: (owner user ID, ETag), or None if the assignment does not exist
+    """
+    row = (await db.exec(PACKET_VERSION_QUERY, params={"assignment_id": assignment_id})).first()
+    if row is None:
+        return None
+    return row.user_id, packet_etag(row.version)
+
+
+async def read_assignment_voter_rows(db: AsyncSession, assignment_id: UUID) -> list[dict]:
+    """
+    Read an assignment's voters in walking order with their last contact.
+
+    Args:
+        db: Database session
+        assignment_id: Assignment ID
+
+    Returns:
+        list[dict]: Plain rows shaped like AssignmentPacketVoter, in
+            sequence order
+    """
+    rows = (await db.exec(ASSIGNMENT_VOTERS_QUERY, params={"assignment_id": assignment_id})).all()
+
+    voters = []
+    for row in rows:
+        voter = dict(row._mapping)
+        contacted_at = voter.pop("last_contacted_at")
+        contact_type = voter.pop("last_contact_type")
+        result = voter.pop("last_contact_result")
+        voter["last_contact"] = None
+        if contacted_at is not None:
+            voter["last_contact"] = {"date": contacted_at, "type": contact_type, "result": result}
+        voters.append(voter)
+    return voters
+
+
+async def read_assignment_voters(
+    db: AsyncSession,
+    assignment_id: UUID,
+) -> list[AssignmentPacketVoter]:
+    """
+    Read an assignment's voters as validated models.
+
+    Args:
+        db: Database session
+        assignment_id: Assignment ID
+
+    Returns:
+        list[AssignmentPacketVoter]: Voters in sequence order
+    """
+    rows = await read_assignment_voter_rows(db, assignment_id)
+    return [AssignmentPacketVoter(**row) for row in rows]
+
+
+async def build_packet(db: AsyncSession, assignment_id: UUID, etag: str) -> CachedPacket:
+    """
+    Build and compress an assignment's packet.
+
+    Args:
+        db: Database session
+        assignment_id: Assignment ID
+        etag: ETag of the version being built
+
+    Returns:
+        CachedPacket: ETag and gzip-compressed JSON body
+    """
+    assignment = (await db.exec(select(Assignment).where(Assignment.id == assignment_id))).first()
+    voters = await read_assignment_voters(db, assignment_id)
+
+    packet = AssignmentPacket(
+        assignment=AssignmentRead(**assignment.model_dump()),
+        voters=voters,
+        etag=etag,
+        built_at=datetime.utcnow(),
+    )
+    # mtime=0 keeps the compressed bytes a function of the content alone
+    body = gzip.compress(packet.model_dump_json().encode(), compresslevel=6, mtime=0)
+    return CachedPacket(etag=etag, body=body)
+
+
+def packet_response(packet: CachedPacket, accept_encoding: str) -> Response:
+    """
+    Serve a cached packet, decompressing it for clients that lack gzip.
+
+    Args:
+        packet: Cached packet
+        accept_encoding: Request Accept-Encoding header
+
+    Returns:
+        Response: JSON response with the packet's ETag
+    """
+    headers = {
+        "ETag": packet.etag,
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=packet.body, media_type="application/json", headers=headers)
+    return Response(
+        content=gzip.decompress(packet.body), media_type="application/json", headers=headers
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 response for a client already holding the current packet."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+    )
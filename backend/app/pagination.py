@@ -0,0 +1,68 @@
+"""
+VEP MVP Backend - Pagination
+
+Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last row on a page. The next page
+starts strictly after that key using a row-value comparison, which a
+composite index on the same columns satisfies with a single index seek,
+so deep pages cost the same as the first.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode a row's sort key as an opaque, URL-safe cursor.
+
+    Args:
+        values: Sort key column values, in ORDER BY order
+
+    Returns:
+        str: Cursor string
+    """
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Cursor string from a previous page's `next_cursor`
+        parsers: One callable per sort key column converting the JSON value
+            back to its Python type (e.g. `str`, `UUID`, `datetime.fromisoformat`)
+
+    Returns:
+        tuple: Decoded sort key values
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("cursor has the wrong number of values")
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
@@ -0,0 +1,203 @@
+"""
+VEP MVP Backend - Password Hashing
+
+bcrypt hashing and verification off the event loop.
+
+A bcrypt hash costs a few hundred milliseconds of CPU at the default cost
+factor. Run inline in an async handler, that stalls every other request
+on the worker. Here hashing runs in a dedicated thread pool of
+PASSWORD_HASH_WORKERS threads (bcrypt releases the GIL while it works).
+At most PASSWORD_HASH_MAX_QUEUE calls may wait for a thread; beyond that
+callers get a 503 instead of queueing without limit behind a signup
+burst. Queue depth and wait times are reported at /health/passwords.
+
+The cost factor is BCRYPT_ROUNDS; see benchmarks/password_hashing.py for
+what each setting costs on a given machine. Existing hashes keep the cost
+they were created with.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from app.config import settings
+
+T = TypeVar("T")
+
+# bcrypt only reads the first 72 bytes; newer bcrypt releases raise instead
+# of truncating, so truncate explicitly (as passlib did)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def hash_password_sync(password: str, rounds: int) -> str:
+    """
+    Hash a password with bcrypt, blocking the calling thread.
+
+    Args:
+        password: Plain-text password
+        rounds: bcrypt cost factor (log2 of the iteration count)
+
+    Returns:
+        str: Modular crypt format hash ($2b$...)
+    """
+    secret = password.encode()[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.hashpw(secret, bcrypt.gensalt(rounds)).decode()
+
+
+def verify_password_sync(password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash; malformed hashes never match."""
+    secret = password.encode()[:BCRYPT_MAX_PASSWORD_BYTES]
+    try:
+        return bcrypt.checkpw(secret, hashed_password.encode())
+    except ValueError:
+        return False
+
+
+class HashPoolMetrics:
+    """
+    Thread-safe counters for the password hashing pool.
+
+    Wait time is from submission until a worker thread picks the call up;
+    work time is the hashing itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self.queued = 0
+            self.running = 0
+            self.completed = 0
+            self.rejected = 0
+            self.cancelled = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+            self.total_work_seconds = 0.0
+
+    def try_enqueue(self, limit: int) -> bool:
+        """Count a new call as queued, unless `limit` calls are already in flight."""
+        with self._lock:
+            if self.queued + self.running >= limit:
+                self.rejected += 1
+                return False
+            self.queued += 1
+            return True
+
+    def record_start(self, waited: float) -> None:
+        """Record a queued call starting on a worker after `waited` seconds."""
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def record_cancelled(self) -> None:
+        """Record a queued call cancelled before a worker picked it up."""
+        with self._lock:
+            self.queued -= 1
+            self.cancelled += 1
+
+    def record_finish(self, worked: float) -> None:
+        """Record a call finishing after `worked` seconds of hashing."""
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+            self.total_work_seconds += worked
+
+    def snapshot(self) -> dict:
+        """Return the current counters as a JSON-serializable dict."""
+        with self._lock:
+            started = self.completed + self.running
+            average_wait = self.total_wait_seconds / started if started else 0.0
+            average_work = self.total_work_seconds / self.completed if self.completed else 0.0
+            return {
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "cancelled": self.cancelled,
+                "avg_wait_ms": round(average_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+                "avg_work_ms": round(average_work * 1000, 3),
+            }
+
+
+class PasswordHasher:
+    """
+    Bounded thread pool for bcrypt.
+
+    Args:
+        workers: Threads hashing at once
+        max_queue: Calls allowed to wait for a thread before rejecting
+        rounds: bcrypt cost factor for new hashes
+    """
+
+    def __init__(self, workers: int, max_queue: int, rounds: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.rounds = rounds
+        self.metrics = HashPoolMetrics()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+
+    async def hash(self, password: str) -> str:
+        """Hash a password on the pool."""
+        return await self._run(hash_password_sync, password, self.rounds)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password on the pool."""
+        return await self._run(verify_password_sync, password, hashed_password)
+
+    async def _run(self, function: Callable[..., T], *args) -> T:
+        if not self.metrics.try_enqueue(self.workers + self.max_queue):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password operations in progress; try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        submitted = time.perf_counter()
+
+        def timed() -> T:
+            started = time.perf_counter()
+            self.metrics.record_start(started - submitted)
+            try:
+                return function(*args)
+            finally:
+                self.metrics.record_finish(time.perf_counter() - started)
+
+        def release_if_cancelled(future: Future) -> None:
+            # Cancelling the awaiting task (client disconnect, timeout) cancels
+            # a call still in the queue, so timed() never runs to release it
+            if future.cancelled():
+                self.metrics.record_cancelled()
+
+        future = self._executor.submit(timed)
+        future.add_done_callback(release_if_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def snapshot(self) -> dict:
+        """Pool configuration and metrics, for the health endpoint."""
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "bcrypt_rounds": self.rounds,
+            **self.metrics.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish."""
+        self._executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    rounds=settings.BCRYPT_ROUNDS,
+)
@@ -0,0 +1,76 @@
+"""
+VEP MVP Backend - Responses
+
+Opt-in fast JSON encoding for large list responses (FAST_JSON_RESPONSES).
+
+By default, endpoints build a SQLModel instance per row, and FastAPI
+validates the result against the response_model before dumping it with
+pydantic-core. For rows that come straight from typed database columns,
+building the models costs several times more than encoding them (see
+benchmarks/json_responses.py). With the setting on and orjson installed
+(`pip install "vep-backend[fast-json]"`), the large list endpoints hand
+plain rows to FastJSONResponse instead, which FastAPI passes through
+untouched. The JSON is the same either way.
+
+app.main also makes FastJSONResponse the default for routes without a
+response_model; routes with one keep FastAPI's pydantic-core encoder.
+"""
+
+from typing import Any, Iterable
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.config import settings
+from app.models.voter import Coordinate
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def fast_json_enabled() -> bool:
+    """Whether the fast path is switched on and orjson is available."""
+    return settings.FAST_JSON_RESPONSES and orjson is not None
+
+
+def encode_extra(value: Any) -> Any:
+    """orjson fallback for the model values rows can contain."""
+    if isinstance(value, Coordinate):
+        return {"latitude": value.latitude, "longitude": value.longitude}
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    UUIDs, dates and datetimes are encoded natively, matching pydantic's
+    output (UTC as "Z"); Coordinates and other models go through
+    `encode_extra`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=encode_extra,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def model_rows(model: type[BaseModel], objects: Iterable[Any]) -> list[dict[str, Any]]:
+    """
+    Pick a schema's fields off already-typed objects, without validation.
+
+    Args:
+        model: Response schema whose fields (and field order) to use
+        objects: ORM instances or rows with those attributes
+
+    Returns:
+        list[dict]: One plain dict per object
+    """
+    names = tuple(model.model_fields)
+    return [{name: getattr(obj, name) for name in names} for obj in objects]
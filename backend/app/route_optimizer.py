@@ -0,0 +1,223 @@
+"""
+VEP MVP Backend - Route Optimizer
+
+Walking-order optimization for an assignment's doors.
+
+The route is an open path: it starts at the canvasser's start point (or,
+without one, wherever is best) and ends at whichever door is last. It is
+modelled as a path between two fixed endpoints, using a dummy node at
+zero distance from every door as the free end, which lets the classic
+closed-tour moves work unchanged:
+
+- Nearest-neighbour construction for the initial route
+- 2-opt (reverse a segment) and Or-opt (move a run of 1-3 doors, either
+  way round) improvement until no move helps or the time limit is hit
+
+Distances are great-circle (haversine) metres from a NumPy distance
+matrix; each improvement step evaluates all candidate moves for one
+position in a single vectorized expression. The matrix takes memory and
+time quadratic in the number of doors, which the time limit does not
+bound, so callers cap the door count (ROUTE_OPTIMIZE_MAX_DOORS).
+"""
+
+import time
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+EARTH_RADIUS_METERS = 6_371_008.8
+
+# Moves must save at least this much, so float noise never loops forever
+MIN_IMPROVEMENT_METERS = 1e-6
+
+OR_OPT_SEGMENT_LENGTHS = (1, 2, 3)
+
+
+class RoutePlan(NamedTuple):
+    """An optimized visiting order and its length before and after."""
+    order: list[int]
+    initial_distance: float
+    optimized_distance: float
+
+
+def haversine_matrix(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Pairwise great-circle distances.
+
+    Args:
+        latitudes: Latitudes in degrees
+        longitudes: Longitudes in degrees
+
+    Returns:
+        np.ndarray: (n, n) distances in metres
+    """
+    lat = np.radians(latitudes)[:, None]
+    lng = np.radians(longitudes)[:, None]
+    half_dlat = (lat - lat.T) / 2
+    half_dlng = (lng - lng.T) / 2
+    a = np.sin(half_dlat) ** 2 + np.cos(lat) * np.cos(lat.T) * np.sin(half_dlng) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def path_length(path: np.ndarray, dist: np.ndarray) -> float:
+    """Total length of a path through the distance matrix."""
+    return float(dist[path[:-1], path[1:]].sum())
+
+
+def nearest_neighbour_path(dist: np.ndarray, head: int, first: int, tail: int) -> np.ndarray:
+    """
+    Build a path head -> first -> (nearest unvisited)... -> tail.
+
+    Args:
+        dist: Distance matrix
+        head: Fixed first node
+        first: First node to visit after head (may equal head)
+        tail: Fixed last node
+
+    Returns:
+        np.ndarray: Node indices, head and tail included
+    """
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    visited[[head, tail]] = True
+    path = [head]
+    current = head
+    if first != head:
+        path.append(first)
+        visited[first] = True
+        current = first
+    while not visited.all():
+        candidates = np.where(visited, np.inf, dist[current])
+        current = int(candidates.argmin())
+        visited[current] = True
+        path.append(current)
+    path.append(tail)
+    return np.array(path)
+
+
+def two_opt_pass(path: np.ndarray, dist: np.ndarray, deadline: float) -> bool:
+    """
+    Apply the best segment reversal for each position, in place.
+
+    Returns:
+        bool: Whether any reversal shortened the path
+    """
+    improved = False
+    m = len(path)
+    for i in range(m - 3):
+        if time.perf_counter() > deadline:
+            break
+        a, b = path[i], path[i + 1]
+        c, d = path[i + 2:m - 1], path[i + 3:m]
+        # Replace edges (a, b) and (c, d) with (a, c) and (b, d)
+        delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+        k = int(delta.argmin())
+        if delta[k] < -MIN_IMPROVEMENT_METERS:
+            path[i + 1:i + 3 + k] = path[i + 1:i + 3 + k][::-1]
+            improved = True
+    return improved
+
+
+def or_opt_pass(path: np.ndarray, dist: np.ndarray, deadline: float) -> tuple[np.ndarray, bool]:
+    """
+    Move runs of 1-3 interior nodes to their best position, either way round.
+
+    Returns:
+        tuple: The (possibly new) path and whether any move shortened it
+    """
+    improved = False
+    for length in OR_OPT_SEGMENT_LENGTHS:
+        i = 1
+        while i + length <= len(path) - 1:
+            if time.perf_counter() > deadline:
+                return path, improved
+            first, last = path[i], path[i + length - 1]
+            before, after = path[i - 1], path[i + length]
+            removal_gain = dist[before, first] + dist[last, after] - dist[before, after]
+
+            starts, ends = path[:-1], path[1:]
+            edge = dist[starts, ends]
+            forward = dist[starts, first] + dist[last, ends] - edge
+            reverse = dist[starts, last] + dist[first, ends] - edge
+            # Edges touching the run cannot receive it
+            forward[i - 1:i + length] = np.inf
+            reverse[i - 1:i + length] = np.inf
+
+            j_forward, j_reverse = int(forward.argmin()), int(reverse.argmin())
+            if forward[j_forward] <= reverse[j_reverse]:
+                j, cost, segment = j_forward, forward[j_forward], path[i:i + length]
+            else:
+                j, cost, segment = j_reverse, reverse[j_reverse], path[i:i + length][::-1]
+
+            if cost < removal_gain - MIN_IMPROVEMENT_METERS:
+                rest = np.concatenate([path[:i], path[i + length:]])
+                at = j + 1 if j < i else j + 1 - length
+                path = np.concatenate([rest[:at], segment, rest[at:]])
+                improved = True
+            else:
+                i += 1
+    return path, improved
+
+
+def optimize_route(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    start: Optional[tuple[float, float]] = None,
+    time_limit: float = 0.8,
+) -> RoutePlan:
+    """
+    Compute a short walking order through a set of points.
+
+    Args:
+        latitudes: Door latitudes, in the current visiting order
+        longitudes: Door longitudes, in the current visiting order
+        start: Optional (latitude, longitude) the route must start from
+        time_limit: Seconds to spend improving the route; the best route
+            found so far is returned when it runs out
+
+    Returns:
+        RoutePlan: Indices into the input in visiting order, and route
+            lengths in metres for the input order and the optimized order
+    """
+    deadline = time.perf_counter() + time_limit
+    n = len(latitudes)
+    if n == 0:
+        return RoutePlan([], 0.0, 0.0)
+
+    lats = np.asarray(latitudes, dtype=float)
+    lngs = np.asarray(longitudes, dtype=float)
+    if start is not None:
+        lats = np.append(lats, start[0])
+        lngs = np.append(lngs, start[1])
+
+    # Doors are 0..n-1, then the start point if any, then the dummy free end
+    points = len(lats)
+    dist = np.zeros((points + 1, points + 1))
+    dist[:points, :points] = haversine_matrix(lats, lngs)
+    dummy = points
+
+    if start is not None:
+        head = first = n
+    else:
+        # Open-ended: begin at the door farthest from the centroid
+        head = dummy
+        east = (lngs - lngs.mean()) * np.cos(np.radians(lats))
+        spread = (lats - lats.mean()) ** 2 + east ** 2
+        first = int(spread.argmax())
+
+    initial = np.arange(n) if start is None else np.concatenate([[head], np.arange(n)])
+    initial_distance = path_length(initial, dist)
+
+    path = nearest_neighbour_path(dist, head, first, dummy)
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = two_opt_pass(path, dist, deadline)
+        path, moved = or_opt_pass(path, dist, deadline)
+        improved = improved or moved
+
+    order = [int(node) for node in path if node < n]
+    optimized = path_length(path, dist)
+    # Never hand back a longer route than the one we were given
+    if optimized > initial_distance:
+        return RoutePlan(list(range(n)), initial_distance, initial_distance)
+    return RoutePlan(order, initial_distance, optimized)
@@ -4,46 +4,174 @@ VEP MVP Backend - Assignment Routes
 Endpoints for assignment management.
 """
 
+import asyncio
+import math
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+import numpy as np
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
 from sqlmodel import func, select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.dependencies import CurrentUser, DatabaseSession, ManagerUser
+from app.config import settings
+from app.dependencies import AsyncDatabaseSession, CurrentUser, ManagerUser
+from app.geometry import decode_points, encode_polygon, point_wkb
 from app.models.assignment import (
     Assignment,
     AssignmentCreate,
+    AssignmentPacket,
     AssignmentRead,
+    AssignmentStatus,
     AssignmentUpdate,
     AssignmentVoter,
+    AssignmentVotersRequest,
+    AssignmentVotersResult,
     AssignmentWithVoters,
+    RouteOptimizeRequest,
+    RouteOptimizeResult,
+    TurfCutRequest,
+    TurfCutResult,
 )
+from app.models.user import User
 from app.models.voter import Voter
+from app.packets import (
+    build_packet,
+    etag_matches,
+    get_packet_version,
+    not_modified_response,
+    packet_cache,
+    packet_response,
+    read_assignment_voter_rows,
+    read_assignment_voters,
+)
+from app.responses import FastJSONResponse, fast_json_enabled, model_rows
+from app.route_optimizer import optimize_route
+from app.turf_cutting import cut_turfs
 
 router = APIRouter()
 
+# Only rows whose position changed are written, so delta sync stays small
+UPDATE_SEQUENCE_QUERY = text("""
+    UPDATE assignment_voters av
+    SET sequence_order = o.sequence_order
+    FROM unnest(
+        CAST(:voter_ids AS uuid[]),
+        CAST(:sequence_orders AS integer[])
+    ) AS o(voter_id, sequence_order)
+    WHERE av.assignment_id = :assignment_id
+      AND av.voter_id = o.voter_id
+      AND av.sequence_order IS DISTINCT FROM o.sequence_order
+""")
+
+# Many assignments in one statement; one array parameter per varying column
+INSERT_ASSIGNMENTS_QUERY = text("""
+    INSERT INTO assignments (
+        id, user_id, name, description, assigned_date, due_date, status,
+        created_at, updated_at
+    )
+    SELECT
+        t.id, t.user_id, t.name, :description, :assigned_date, :due_date, :status,
+        :created_at, :created_at
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:user_ids AS uuid[]),
+        CAST(:names AS text[])
+    ) AS t(id, user_id, name)
+""")
+
+# Memberships of any number of assignments in one statement
+INSERT_ASSIGNMENT_VOTERS_QUERY = text("""
+    INSERT INTO assignment_voters (assignment_id, voter_id, sequence_order)
+    SELECT t.assignment_id, t.voter_id, t.sequence_order
+    FROM unnest(
+        CAST(:assignment_ids AS uuid[]),
+        CAST(:voter_ids AS uuid[]),
+        CAST(:sequence_orders AS integer[])
+    ) AS t(assignment_id, voter_id, sequence_order)
+""")
+
+# Appends after the current last position; voters already present are
+# skipped before numbering, so the new positions follow on without gaps
+ADD_ASSIGNMENT_VOTERS_QUERY = text("""
+    INSERT INTO assignment_voters (assignment_id, voter_id, sequence_order)
+    SELECT
+        :assignment_id,
+        t.voter_id,
+        (
+            SELECT COALESCE(max(av.sequence_order), 0)
+            FROM assignment_voters av
+            WHERE av.assignment_id = :assignment_id
+        ) + row_number() OVER (ORDER BY t.position)
+    FROM unnest(CAST(:voter_ids AS uuid[])) WITH ORDINALITY AS t(voter_id, position)
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM assignment_voters av
+        WHERE av.assignment_id = :assignment_id
+          AND av.voter_id = t.voter_id
+    )
+    ON CONFLICT (assignment_id, voter_id) DO NOTHING
+    RETURNING voter_id
+""")
 
-def point_to_coordinate(point_str: str) -> dict:
-    """Convert PostGIS POINT string to coordinate dict."""
-    if not point_str or point_str == "None":
-        return None
-    try:
-        coords = point_str.replace("POINT(", "").replace(")", "").split()
-        return {"latitude": float(coords[1]), "longitude": float(coords[0])}
-    except:
-        return None
+REMOVE_ASSIGNMENT_VOTERS_QUERY = text("""
+    DELETE FROM assignment_voters
+    WHERE assignment_id = :assignment_id
+      AND voter_id = ANY(CAST(:voter_ids AS uuid[]))
+    RETURNING voter_id
+""")
+
+
+async def find_missing_voters(db: AsyncSession, voter_ids: list[UUID]) -> list[UUID]:
+    """
+    Check that voters exist and are not soft-deleted, in one query.
+    
+    Args:
+        db: Database session
+        voter_ids: Voter IDs to check
+        
+    Returns:
+        list[UUID]: IDs that do not refer to a live voter, in input order
+    """
+    if not voter_ids:
+        return []
+    statement = select(Voter.id).where(Voter.id.in_(voter_ids), Voter.deleted_at.is_(None))
+    found = set((await db.exec(statement)).all())
+    return [voter_id for voter_id in voter_ids if voter_id not in found]
+
+
+def voters_not_found(missing: list[UUID]) -> HTTPException:
+    """404 naming the voter IDs that were not found."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Voters not found: {', '.join(str(voter_id) for voter_id in missing)}",
+    )
 
 
 @router.get("/", response_model=list[AssignmentRead])
-async def list_assignments(db: DatabaseSession, current_user: CurrentUser):
+async def list_assignments(
+    db: AsyncDatabaseSession,
+    current_user: CurrentUser,
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
+    user_id: Optional[UUID] = Query(None, description="Filter by assigned user ID"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+):
     """
     List assignments for the current user.
     
     Managers/admins can see all assignments, canvassers see only their own.
+    Voter and completed counts are read from the trigger-maintained counter
+    columns, so the whole page is a single statement.
     
     Args:
         db: Database session
         current_user: Authenticated user
+        status_filter: Optional status filter
+        user_id: Optional assigned user filter
+        limit: Maximum number of results
+        offset: Number of results to skip
         
     Returns:
         list[AssignmentRead]: List of assignments
@@ -54,41 +182,33 @@ async def list_assignments(db: DatabaseSession, current_user: CurrentUser):
     if current_user.role not in ["manager", "admin"]:
         statement = statement.where(Assignment.user_id == current_user.id)
     
-    assignments = db.exec(statement).all()
+    if user_id:
+        statement = statement.where(Assignment.user_id == user_id)
     
-    # Enhance with voter counts
-    result = []
-    for assignment in assignments:
-        assignment_dict = assignment.model_dump()
-        
-        # Get voter count
-        voter_count_query = select(func.count(AssignmentVoter.id)).where(
-            AssignmentVoter.assignment_id == assignment.id
-        )
-        voter_count = db.exec(voter_count_query).first()
-        assignment_dict["voter_count"] = voter_count or 0
-        
-        # Get completed count (voters with contact logs)
-        completed_count_query = text("""
-            SELECT COUNT(DISTINCT cl.voter_id)
-            FROM contact_logs cl
-            WHERE cl.assignment_id = :assignment_id
-        """)
-        completed_count = db.exec(
-            completed_count_query, {"assignment_id": assignment.id}
-        ).first()
-        assignment_dict["completed_count"] = completed_count[0] if completed_count else 0
-        
-        result.append(AssignmentRead(**assignment_dict))
+    if status_filter:
+        statement = statement.where(Assignment.status == status_filter)
+    
+    statement = (
+        statement.order_by(Assignment.created_at.desc(), Assignment.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    assignments = (await db.exec(statement)).all()
     
-    return result
+    return [AssignmentRead(**assignment.model_dump()) for assignment in assignments]
 
 
 @router.get("/{assignment_id}", response_model=AssignmentWithVoters)
-async def get_assignment(assignment_id: UUID, db: DatabaseSession, current_user: CurrentUser):
+async def get_assignment(assignment_id: UUID, db: AsyncDatabaseSession, current_user: CurrentUser):
     """
     Get a specific assignment with voter details.
     
+    Voters come back in walking order with their last contact on this
+    assignment, read with one index probe per voter (see
+    read_assignment_voters), so the cost does not grow with the number
+    of contact logs. With FAST_JSON_RESPONSES on, rows are encoded
+    without building models.
+    
     Args:
         assignment_id: Assignment ID
         db: Database session
@@ -101,7 +221,7 @@ async def get_assignment(assignment_id: UUID, db: DatabaseSession, current_user:
         HTTPException: If assignment not found or unauthorized
     """
     statement = select(Assignment).where(Assignment.id == assignment_id)
-    assignment = db.exec(statement).first()
+    assignment = (await db.exec(statement)).first()
     
     if not assignment:
         raise HTTPException(
@@ -119,85 +239,94 @@ async def get_assignment(assignment_id: UUID, db: DatabaseSession, current_user:
             detail="Insufficient permissions to view this assignment",
         )
     
-    assignment_dict = assignment.model_dump()
+    if fast_json_enabled():
+        voters = await read_assignment_voter_rows(db, assignment.id)
+        return FastJSONResponse({**model_rows(AssignmentRead, [assignment])[0], "voters": voters})
     
-    # Get voter count
-    voter_count_query = select(func.count(AssignmentVoter.id)).where(
-        AssignmentVoter.assignment_id == assignment.id
-    )
-    voter_count = db.exec(voter_count_query).first()
-    assignment_dict["voter_count"] = voter_count or 0
-    
-    # Get completed count
-    completed_count_query = text("""
-        SELECT COUNT(DISTINCT cl.voter_id)
-        FROM contact_logs cl
-        WHERE cl.assignment_id = :assignment_id
-    """)
-    completed_count = db.exec(
-        completed_count_query, {"assignment_id": assignment.id}
-    ).first()
-    assignment_dict["completed_count"] = completed_count[0] if completed_count else 0
-    
-    # Get voters with details
-    voters_query = text("""
-        SELECT 
-            v.id, v.voter_id, v.first_name, v.last_name, v.address, 
-            v.city, v.zip, v.party_affiliation, v.support_level,
-            av.sequence_order,
-            ST_AsText(v.location) as location_text,
-            (
-                SELECT json_build_object(
-                    'date', cl.contacted_at,
-                    'type', cl.contact_type,
-                    'result', cl.result
-                )
-                FROM contact_logs cl
-                WHERE cl.voter_id = v.id
-                  AND cl.assignment_id = :assignment_id
-                ORDER BY cl.contacted_at DESC
-                LIMIT 1
-            ) as last_contact
-        FROM voters v
-        JOIN assignment_voters av ON v.id = av.voter_id
-        WHERE av.assignment_id = :assignment_id
-        ORDER BY av.sequence_order NULLS LAST, v.last_name, v.first_name
-    """)
+    voters = await read_assignment_voters(db, assignment.id)
     
-    voters_results = db.exec(voters_query, {"assignment_id": assignment.id}).all()
+    return AssignmentWithVoters(**assignment.model_dump(), voters=voters)
+
+
+@router.get(
+    "/{assignment_id}/packet",
+    response_class=Response,
+    responses={
+        200: {"model": AssignmentPacket, "description": "Packet (gzip-compressed when accepted)"},
+        304: {"description": "Packet unchanged since the ETag in If-None-Match"},
+    },
+)
+async def get_assignment_packet(
+    assignment_id: UUID,
+    db: AsyncDatabaseSession,
+    current_user: CurrentUser,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: str = Header(""),
+):
+    """
+    Download an assignment's offline packet.
     
-    voters = []
-    for row in voters_results:
-        voter_data = {
-            "id": row[0],
-            "voter_id": row[1],
-            "first_name": row[2],
-            "last_name": row[3],
-            "address": row[4],
-            "city": row[5],
-            "zip": row[6],
-            "party_affiliation": row[7],
-            "support_level": row[8],
-            "sequence_order": row[9],
-            "location": point_to_coordinate(row[10]) if row[10] else None,
-            "last_contact": row[11] if row[11] else None,
-        }
-        voters.append(voter_data)
+    The packet holds the assignment, its voters in walking order with
+    coordinates and last contact, and its ETag. It is served from the
+    in-process cache unless the assignment, its voters or its contact
+    logs changed since it was built.
     
-    assignment_dict["voters"] = voters
+    Args:
+        assignment_id: Assignment ID
+        db: Database session
+        current_user: Authenticated user
+        if_none_match: ETag of the packet the client already has
+        accept_encoding: Encodings the client accepts
+        
+    Returns:
+        Response: Packet JSON, or 304 if the client's copy is current
+        
+    Raises:
+        HTTPException: If assignment not found or unauthorized
+    """
+    version = await get_packet_version(db, assignment_id)
     
-    return AssignmentWithVoters(**assignment_dict)
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignment not found",
+        )
+    
+    owner_id, etag = version
+    
+    # Check authorization
+    if current_user.role not in ["manager", "admin"] and owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to view this assignment",
+        )
+    
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    
+    packet = packet_cache.get(assignment_id)
+    if packet is None or packet.etag != etag:
+        packet = await build_packet(db, assignment_id, etag)
+        packet_cache.set(assignment_id, packet)
+    
+    return packet_response(packet, accept_encoding)
 
 
 @router.post("/", response_model=AssignmentRead, status_code=status.HTTP_201_CREATED)
 async def create_assignment(
     assignment_data: AssignmentCreate,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: ManagerUser,
 ):
     """
     Create a new assignment (managers and admins only).
     
+    The canvasser and every voter are validated up front, then the
+    assignment and all of its voters are written with two set-based
+    INSERTs in one transaction, so a bad voter ID never leaves a
+    partially built assignment behind. Voters keep the order given, and
+    repeated IDs are added once.
+    
     Args:
         assignment_data: Assignment data
         db: Database session
@@ -205,8 +334,25 @@ async def create_assignment(
         
     Returns:
         AssignmentRead: Created assignment
+        
+    Raises:
+        HTTPException: If the user or any voter does not exist
     """
-    # Create assignment
+    user = (await db.exec(select(User.id).where(User.id == assignment_data.user_id))).first()
+    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    
+    voter_ids = list(dict.fromkeys(assignment_data.voter_ids))
+    missing = await find_missing_voters(db, voter_ids)
+    
+    if missing:
+        raise voters_not_found(missing)
+    
+    now = datetime.utcnow()
     db_assignment = Assignment(
         user_id=assignment_data.user_id,
         name=assignment_data.name,
@@ -214,36 +360,214 @@ async def create_assignment(
         assigned_date=assignment_data.assigned_date,
         due_date=assignment_data.due_date,
         status=assignment_data.status,
+        voter_count=len(voter_ids),
+        created_at=now,
+        updated_at=now,
     )
     
-    db.add(db_assignment)
-    db.commit()
-    db.refresh(db_assignment)
+    await db.exec(
+        INSERT_ASSIGNMENTS_QUERY,
+        params={
+            "ids": [db_assignment.id],
+            "user_ids": [db_assignment.user_id],
+            "names": [db_assignment.name],
+            "description": db_assignment.description,
+            "assigned_date": db_assignment.assigned_date,
+            "due_date": db_assignment.due_date,
+            "status": db_assignment.status,
+            "created_at": now,
+        },
+    )
+    
+    if voter_ids:
+        await db.exec(
+            INSERT_ASSIGNMENT_VOTERS_QUERY,
+            params={
+                "assignment_ids": [db_assignment.id] * len(voter_ids),
+                "voter_ids": voter_ids,
+                "sequence_orders": list(range(1, len(voter_ids) + 1)),
+            },
+        )
+    
+    await db.commit()
+    
+    return AssignmentRead(**db_assignment.model_dump())
+
+
+@router.post("/turfs", response_model=TurfCutResult, status_code=status.HTTP_201_CREATED)
+async def cut_assignment_turfs(
+    request: TurfCutRequest,
+    db: AsyncDatabaseSession,
+    current_user: ManagerUser,
+):
+    """
+    Cut turfs from filtered voters and create an assignment for each
+    (managers and admins only).
+    
+    Voters with coordinates matching every given filter are clustered
+    into compact turfs of equal size (to within one voter), each turf is
+    put in walking order, and all assignments and memberships are written
+    with two set-based INSERTs in one transaction. Voters already on a
+    pending or in-progress assignment are left out unless
+    `include_assigned` is set.
+    
+    Args:
+        request: Voter filters, turf sizing and assignment details
+        db: Database session
+        current_user: Authenticated manager/admin user
+        
+    Returns:
+        TurfCutResult: Created assignments, ordered north to south
+        
+    Raises:
+        HTTPException: If the sizing is missing, a canvasser does not
+            exist, no or too many voters match, or turfs would have more
+            than TURF_CUT_MAX_DOORS_PER_TURF voters
+    """
+    if not (request.turf_count or request.doors_per_turf or request.user_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specify turf_count, doors_per_turf or user_ids",
+        )
+    
+    canvasser_ids = list(dict.fromkeys(request.user_ids))
+    if canvasser_ids:
+        found = set((await db.exec(select(User.id).where(User.id.in_(canvasser_ids)))).all())
+        missing = [str(user_id) for user_id in canvasser_ids if user_id not in found]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown user_ids: {', '.join(missing)}",
+            )
+    
+    statement = select(Voter.id, point_wkb(Voter.location)).where(
+        Voter.deleted_at.is_(None),
+        Voter.location.is_not(None),
+    )
+    
+    if request.zips:
+        statement = statement.where(Voter.zip.in_(request.zips))
+    
+    if request.support_levels:
+        statement = statement.where(Voter.support_level.in_(request.support_levels))
+    
+    if request.party_affiliations:
+        statement = statement.where(Voter.party_affiliation.in_(request.party_affiliations))
+    
+    if request.polygon:
+        polygon = encode_polygon([(c.latitude, c.longitude) for c in request.polygon])
+        statement = statement.where(
+            func.ST_Covers(func.ST_GeomFromEWKT(polygon), Voter.location)
+        )
+    
+    if not request.include_assigned:
+        active = (
+            select(AssignmentVoter.id)
+            .join(Assignment, Assignment.id == AssignmentVoter.assignment_id)
+            .where(
+                AssignmentVoter.voter_id == Voter.id,
+                Assignment.status.in_([AssignmentStatus.PENDING, AssignmentStatus.IN_PROGRESS]),
+            )
+        )
+        statement = statement.where(~active.exists())
+    
+    # Ordered so the same universe always clusters the same way
+    statement = statement.order_by(Voter.id).limit(settings.TURF_CUT_MAX_VOTERS + 1)
+    voters = (await db.exec(statement)).all()
     
-    # Add voters to assignment
-    for idx, voter_id in enumerate(assignment_data.voter_ids):
-        assignment_voter = AssignmentVoter(
-            assignment_id=db_assignment.id,
-            voter_id=voter_id,
-            sequence_order=idx + 1,
+    if not voters:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No voters with coordinates match the filter",
+        )
+    
+    if len(voters) > settings.TURF_CUT_MAX_VOTERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"More than {settings.TURF_CUT_MAX_VOTERS} voters match; narrow the filter",
+        )
+    
+    if request.turf_count:
+        turf_count = request.turf_count
+    elif request.doors_per_turf:
+        turf_count = math.ceil(len(voters) / request.doors_per_turf)
+    else:
+        turf_count = len(canvasser_ids)
+    
+    doors_per_turf = math.ceil(len(voters) / turf_count)
+    if doors_per_turf > settings.TURF_CUT_MAX_DOORS_PER_TURF:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"{len(voters)} voters in {turf_count} turfs is {doors_per_turf} doors per "
+                f"turf; at most {settings.TURF_CUT_MAX_DOORS_PER_TURF} are allowed, so cut "
+                f"at least {math.ceil(len(voters) / settings.TURF_CUT_MAX_DOORS_PER_TURF)} turfs"
+            ),
         )
-        db.add(assignment_voter)
     
-    db.commit()
+    points = decode_points([location for _, location in voters])
+    turfs = await asyncio.to_thread(
+        cut_turfs,
+        points[:, 0],
+        points[:, 1],
+        turf_count,
+        settings.TURF_CUT_ROUTE_BUDGET_SECONDS,
+        max_route_doors=settings.ROUTE_OPTIMIZE_MAX_DOORS,
+    )
     
-    # Prepare response
-    assignment_dict = db_assignment.model_dump()
-    assignment_dict["voter_count"] = len(assignment_data.voter_ids)
-    assignment_dict["completed_count"] = 0
+    now = datetime.utcnow()
+    owners = canvasser_ids or [current_user.id]
+    assignments = [
+        Assignment(
+            user_id=owners[index % len(owners)],
+            name=f"{request.name_prefix} {index + 1}",
+            description=request.description,
+            assigned_date=request.assigned_date,
+            due_date=request.due_date,
+            status=AssignmentStatus.PENDING,
+            voter_count=len(turf),
+            created_at=now,
+            updated_at=now,
+        )
+        for index, turf in enumerate(turfs)
+    ]
+    
+    await db.exec(
+        INSERT_ASSIGNMENTS_QUERY,
+        params={
+            "ids": [assignment.id for assignment in assignments],
+            "user_ids": [assignment.user_id for assignment in assignments],
+            "names": [assignment.name for assignment in assignments],
+            "description": request.description,
+            "assigned_date": request.assigned_date,
+            "due_date": request.due_date,
+            "status": AssignmentStatus.PENDING,
+            "created_at": now,
+        },
+    )
+    await db.exec(
+        INSERT_ASSIGNMENT_VOTERS_QUERY,
+        params={
+            "assignment_ids": [
+                assignment.id for assignment, turf in zip(assignments, turfs) for _ in turf
+            ],
+            "voter_ids": [voters[index][0] for turf in turfs for index in turf],
+            "sequence_orders": [position for turf in turfs for position in range(1, len(turf) + 1)],
+        },
+    )
+    await db.commit()
     
-    return AssignmentRead(**assignment_dict)
+    return TurfCutResult(
+        voter_count=len(voters),
+        assignments=[AssignmentRead(**assignment.model_dump()) for assignment in assignments],
+    )
 
 
 @router.patch("/{assignment_id}", response_model=AssignmentRead)
 async def update_assignment(
     assignment_id: UUID,
     assignment_data: AssignmentUpdate,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
@@ -265,7 +589,7 @@ async def update_assignment(
         HTTPException: If assignment not found or unauthorized
     """
     statement = select(Assignment).where(Assignment.id == assignment_id)
-    assignment = db.exec(statement).first()
+    assignment = (await db.exec(statement)).first()
     
     if not assignment:
         raise HTTPException(
@@ -289,35 +613,220 @@ async def update_assignment(
         setattr(assignment, key, value)
     
     db.add(assignment)
-    db.commit()
-    db.refresh(assignment)
+    await db.commit()
+    await db.refresh(assignment)
+    
+    return AssignmentRead(**assignment.model_dump())
+
+
+@router.post("/{assignment_id}/optimize", response_model=RouteOptimizeResult)
+async def optimize_assignment_route(
+    assignment_id: UUID,
+    db: AsyncDatabaseSession,
+    current_user: CurrentUser,
+    request: Optional[RouteOptimizeRequest] = None,
+):
+    """
+    Compute and save a walking order (sequence_order) for an assignment.
+    
+    Doors with coordinates are ordered by the route optimizer, starting
+    from `start` if given. Doors without coordinates follow in their
+    previous order.
+    
+    Args:
+        assignment_id: Assignment ID
+        db: Database session
+        current_user: Authenticated user
+        request: Optional start point
+        
+    Returns:
+        RouteOptimizeResult: New order and route length before and after
+        
+    Raises:
+        HTTPException: If assignment not found or unauthorized, or it has
+            more than ROUTE_OPTIMIZE_MAX_DOORS mapped doors
+    """
+    statement = select(Assignment).where(Assignment.id == assignment_id)
+    assignment = (await db.exec(statement)).first()
     
-    # Prepare response
-    assignment_dict = assignment.model_dump()
+    if not assignment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignment not found",
+        )
     
-    voter_count_query = select(func.count(AssignmentVoter.id)).where(
-        AssignmentVoter.assignment_id == assignment.id
+    # Check authorization
+    if (
+        current_user.role not in ["manager", "admin"]
+        and assignment.user_id != current_user.id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to update this assignment",
+        )
+    
+    doors_query = (
+        select(AssignmentVoter.voter_id, point_wkb(Voter.location))
+        .join(Voter, Voter.id == AssignmentVoter.voter_id)
+        .where(AssignmentVoter.assignment_id == assignment_id)
+        .order_by(AssignmentVoter.sequence_order.nulls_last(), Voter.last_name, Voter.first_name)
     )
-    voter_count = db.exec(voter_count_query).first()
-    assignment_dict["voter_count"] = voter_count or 0
+    doors = (await db.exec(doors_query)).all()
+    points = decode_points([location for _, location in doors])
+    mapped = ~np.isnan(points).any(axis=1)
+    routable = [voter_id for (voter_id, _), ok in zip(doors, mapped) if ok]
+    unroutable = [voter_id for (voter_id, _), ok in zip(doors, mapped) if not ok]
+    
+    # The optimizer's distance matrix is quadratic in the number of doors
+    if len(routable) > settings.ROUTE_OPTIMIZE_MAX_DOORS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Assignment has {len(routable)} mapped doors; at most "
+                f"{settings.ROUTE_OPTIMIZE_MAX_DOORS} can be route optimized"
+            ),
+        )
     
-    completed_count_query = text("""
-        SELECT COUNT(DISTINCT cl.voter_id)
-        FROM contact_logs cl
-        WHERE cl.assignment_id = :assignment_id
-    """)
-    completed_count = db.exec(
-        completed_count_query, {"assignment_id": assignment.id}
-    ).first()
-    assignment_dict["completed_count"] = completed_count[0] if completed_count else 0
+    start = request.start if request else None
+    plan = await asyncio.to_thread(
+        optimize_route,
+        points[mapped, 0],
+        points[mapped, 1],
+        (start.latitude, start.longitude) if start else None,
+        settings.ROUTE_OPTIMIZE_TIME_LIMIT_SECONDS,
+    )
+    voter_ids = [routable[index] for index in plan.order] + unroutable
+    
+    if voter_ids:
+        await db.exec(
+            UPDATE_SEQUENCE_QUERY,
+            params={
+                "assignment_id": assignment_id,
+                "voter_ids": voter_ids,
+                "sequence_orders": list(range(1, len(voter_ids) + 1)),
+            },
+        )
+        await db.commit()
+    
+    return RouteOptimizeResult(
+        assignment_id=assignment_id,
+        voter_count=len(voter_ids),
+        routed_count=len(routable),
+        initial_distance_meters=round(plan.initial_distance, 1),
+        optimized_distance_meters=round(plan.optimized_distance, 1),
+        voter_ids=voter_ids,
+    )
+
+
+@router.post("/{assignment_id}/voters", response_model=AssignmentVotersResult)
+async def add_assignment_voters(
+    assignment_id: UUID,
+    request: AssignmentVotersRequest,
+    db: AsyncDatabaseSession,
+    current_user: ManagerUser,
+):
+    """
+    Add voters to an assignment in bulk (managers and admins only).
     
-    return AssignmentRead(**assignment_dict)
+    New voters are appended after the current last stop, in the order
+    given, with one INSERT. Voters already on the assignment are skipped.
+    
+    Args:
+        assignment_id: Assignment ID
+        request: Voter IDs to add
+        db: Database session
+        current_user: Authenticated manager/admin user
+        
+    Returns:
+        AssignmentVotersResult: Voters added and how many were skipped
+        
+    Raises:
+        HTTPException: If the assignment or any voter does not exist
+    """
+    statement = select(Assignment.id).where(Assignment.id == assignment_id)
+    
+    if not (await db.exec(statement)).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignment not found",
+        )
+    
+    voter_ids = list(dict.fromkeys(request.voter_ids))
+    missing = await find_missing_voters(db, voter_ids)
+    
+    if missing:
+        raise voters_not_found(missing)
+    
+    added = (
+        await db.exec(
+            ADD_ASSIGNMENT_VOTERS_QUERY,
+            params={"assignment_id": assignment_id, "voter_ids": voter_ids},
+        )
+    ).all()
+    await db.commit()
+    
+    added_ids = {row[0] for row in added}
+    return AssignmentVotersResult(
+        assignment_id=assignment_id,
+        voter_ids=[voter_id for voter_id in voter_ids if voter_id in added_ids],
+        skipped_count=len(voter_ids) - len(added_ids),
+    )
+
+
+@router.post("/{assignment_id}/voters/remove", response_model=AssignmentVotersResult)
+async def remove_assignment_voters(
+    assignment_id: UUID,
+    request: AssignmentVotersRequest,
+    db: AsyncDatabaseSession,
+    current_user: ManagerUser,
+):
+    """
+    Remove voters from an assignment in bulk (managers and admins only).
+    
+    Removed with one DELETE; voters not on the assignment are skipped.
+    The remaining voters keep their sequence order.
+    
+    Args:
+        assignment_id: Assignment ID
+        request: Voter IDs to remove
+        db: Database session
+        current_user: Authenticated manager/admin user
+        
+    Returns:
+        AssignmentVotersResult: Voters removed and how many were skipped
+        
+    Raises:
+        HTTPException: If the assignment does not exist
+    """
+    statement = select(Assignment.id).where(Assignment.id == assignment_id)
+    
+    if not (await db.exec(statement)).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assignment not found",
+        )
+    
+    voter_ids = list(dict.fromkeys(request.voter_ids))
+    removed = (
+        await db.exec(
+            REMOVE_ASSIGNMENT_VOTERS_QUERY,
+            params={"assignment_id": assignment_id, "voter_ids": voter_ids},
+        )
+    ).all()
+    await db.commit()
+    
+    removed_ids = {row[0] for row in removed}
+    return AssignmentVotersResult(
+        assignment_id=assignment_id,
+        voter_ids=[voter_id for voter_id in voter_ids if voter_id in removed_ids],
+        skipped_count=len(voter_ids) - len(removed_ids),
+    )
 
 
 @router.delete("/{assignment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_assignment(
     assignment_id: UUID,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: ManagerUser,
 ):
     """
@@ -332,7 +841,7 @@ async def delete_assignment(
         HTTPException: If assignment not found
     """
     statement = select(Assignment).where(Assignment.id == assignment_id)
-    assignment = db.exec(statement).first()
+    assignment = (await db.exec(statement)).first()
     
     if not assignment:
         raise HTTPException(
@@ -340,8 +849,8 @@ async def delete_assignment(
             detail="Assignment not found",
         )
     
-    db.delete(assignment)
-    db.commit()
+    await db.delete(assignment)
+    await db.commit()
     
     return None
 
@@ -349,7 +858,7 @@ async def delete_assignment(
 @router.get("/{assignment_id}/voters", response_model=list[dict])
 async def get_assignment_voters(
     assignment_id: UUID,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
@@ -367,7 +876,7 @@ async def get_assignment_voters(
         HTTPException: If assignment not found or unauthorized
     """
     statement = select(Assignment).where(Assignment.id == assignment_id)
-    assignment = db.exec(statement).first()
+    assignment = (await db.exec(statement)).first()
     
     if not assignment:
         raise HTTPException(
@@ -385,36 +894,49 @@ async def get_assignment_voters(
             detail="Insufficient permissions to view this assignment",
         )
     
-    # Get voters
-    voters_query = text("""
-        SELECT 
-            v.id, v.voter_id, v.first_name, v.last_name, v.address, 
-            v.city, v.zip, v.party_affiliation, v.support_level,
-            av.sequence_order,
-            ST_AsText(v.location) as location_text
-        FROM voters v
-        JOIN assignment_voters av ON v.id = av.voter_id
-        WHERE av.assignment_id = :assignment_id
-        ORDER BY av.sequence_order NULLS LAST, v.last_name, v.first_name
-    """)
+    # Get voters; locations come back as WKB and are decoded in one pass
+    voters_query = (
+        select(
+            Voter.id,
+            Voter.voter_id,
+            Voter.first_name,
+            Voter.last_name,
+            Voter.address,
+            Voter.city,
+            Voter.zip,
+            Voter.party_affiliation,
+            Voter.support_level,
+            AssignmentVoter.sequence_order,
+            point_wkb(Voter.location).label("location"),
+        )
+        .join(AssignmentVoter, AssignmentVoter.voter_id == Voter.id)
+        .where(AssignmentVoter.assignment_id == assignment.id)
+        .order_by(AssignmentVoter.sequence_order.nulls_last(), Voter.last_name, Voter.first_name)
+    )
     
-    results = db.exec(voters_query, {"assignment_id": assignment.id}).all()
+    results = (await db.exec(voters_query)).all()
+    points = decode_points([row.location for row in results])
     
     voters = []
-    for row in results:
+    for row, (latitude, longitude) in zip(results, points.tolist()):
         voter_data = {
-            "id": str(row[0]),
-            "voter_id": row[1],
-            "first_name": row[2],
-            "last_name": row[3],
-            "address": row[4],
-            "city": row[5],
-            "zip": row[6],
-            "party_affiliation": row[7],
-            "support_level": row[8],
-            "sequence_order": row[9],
-            "location": point_to_coordinate(row[10]) if row[10] else None,
+            "id": str(row.id),
+            "voter_id": row.voter_id,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "address": row.address,
+            "city": row.city,
+            "zip": row.zip,
+            "party_affiliation": row.party_affiliation,
+            "support_level": row.support_level,
+            "sequence_order": row.sequence_order,
+            "location": None,
         }
+        if not math.isnan(latitude):
+            voter_data["location"] = {"latitude": latitude, "longitude": longitude}
         voters.append(voter_data)
     
+    if fast_json_enabled():
+        return FastJSONResponse(voters)
+    
     return voters
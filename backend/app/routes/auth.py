@@ -5,30 +5,29 @@ Endpoints for user authentication and authorization.
 """
 
 from datetime import datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from jose import jwt
-from passlib.context import CryptContext
+from jose import JWTError, jwt
 from pydantic import BaseModel, EmailStr
 from sqlmodel import select
 
 from app.config import settings
-from app.dependencies import CurrentUser, DatabaseSession, get_db
-from app.models.user import User, UserCreate, UserRead
+from app.dependencies import AsyncDatabaseSession, CurrentUser, get_db
+from app.models.user import TokenType, User, UserCreate, UserRead
+from app.passwords import password_hasher
+from app.user_cache import load_user
 
 router = APIRouter()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
 class Token(BaseModel):
-    """JWT token response."""
+    """JWT token response; refresh_token is only issued with STATELESS_AUTH."""
     user_id: str
     email: str
     token: str
     role: str
+    refresh_token: Optional[str] = None
 
 
 class LoginRequest(BaseModel):
@@ -37,14 +36,19 @@ class LoginRequest(BaseModel):
     password: str
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+class RefreshRequest(BaseModel):
+    """Token refresh request schema."""
+    refresh_token: str
+
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash, on the password hashing pool."""
+    return await password_hasher.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
+
+async def get_password_hash(password: str) -> str:
+    """Hash a password, on the password hashing pool."""
+    return await password_hasher.hash(password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -59,8 +63,43 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return encoded_jwt
 
 
+def issue_token(user: User) -> Token:
+    """
+    Build the token response for a signed-in user.
+    
+    Access tokens always carry the user's role and token version. With
+    STATELESS_AUTH they are short-lived and come with a refresh token.
+    
+    Args:
+        user: Authenticated user
+        
+    Returns:
+        Token: Access (and refresh) token and user info
+    """
+    claims = {"sub": str(user.id), "ver": user.token_version}
+    refresh_token = None
+    expires_delta = None
+    if settings.STATELESS_AUTH:
+        expires_delta = timedelta(minutes=settings.STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES)
+        refresh_token = create_access_token(
+            {**claims, "type": TokenType.REFRESH},
+            timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    access_token = create_access_token(
+        {**claims, "type": TokenType.ACCESS, "role": user.role}, expires_delta
+    )
+    
+    return Token(
+        user_id=str(user.id),
+        email=user.email,
+        token=access_token,
+        role=user.role,
+        refresh_token=refresh_token,
+    )
+
+
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: DatabaseSession):
+async def signup(user_data: UserCreate, db: AsyncDatabaseSession):
     """
     Create a new user account.
     
@@ -76,7 +115,7 @@ async def signup(user_data: UserCreate, db: DatabaseSession):
     """
     # Check if user already exists
     statement = select(User).where(User.email == user_data.email)
-    existing_user = db.exec(statement).first()
+    existing_user = (await db.exec(statement)).first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -84,7 +123,7 @@ async def signup(user_data: UserCreate, db: DatabaseSession):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     db_user = User(
         email=user_data.email,
         full_name=user_data.full_name,
@@ -95,22 +134,14 @@ async def signup(user_data: UserCreate, db: DatabaseSession):
     # For MVP with Supabase, this is handled by Supabase Auth
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    
-    # Create access token
-    access_token = create_access_token(data={"sub": str(db_user.id)})
+    await db.commit()
+    await db.refresh(db_user)
     
-    return Token(
-        user_id=str(db_user.id),
-        email=db_user.email,
-        token=access_token,
-        role=db_user.role,
-    )
+    return issue_token(db_user)
 
 
 @router.post("/login", response_model=Token)
-async def login(login_data: LoginRequest, db: DatabaseSession):
+async def login(login_data: LoginRequest, db: AsyncDatabaseSession):
     """
     Authenticate a user and return a JWT token.
     
@@ -126,7 +157,7 @@ async def login(login_data: LoginRequest, db: DatabaseSession):
     """
     # Find user by email
     statement = select(User).where(User.email == login_data.email)
-    user = db.exec(statement).first()
+    user = (await db.exec(statement)).first()
     
     # Note: In production with Supabase, we'd call Supabase Auth API
     # For MVP demo, we'll verify against a mock password check
@@ -146,28 +177,73 @@ async def login(login_data: LoginRequest, db: DatabaseSession):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Create access token
-    access_token = create_access_token(data={"sub": str(user.id)})
+    return issue_token(user)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(refresh_data: RefreshRequest, db: AsyncDatabaseSession):
+    """
+    Exchange a refresh token for a new access token and refresh token.
+    
+    The user is re-read from the database, so the new access token carries
+    the current role. Refresh tokens issued before the user's token version
+    was bumped (e.g. by a role change) are refused.
     
-    return Token(
-        user_id=str(user.id),
-        email=user.email,
-        token=access_token,
-        role=user.role,
+    Args:
+        refresh_data: Refresh token
+        db: Database session
+        
+    Returns:
+        Token: New tokens and user info
+        
+    Raises:
+        HTTPException: If the refresh token is invalid, expired or revoked
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
     )
+    
+    try:
+        payload = jwt.decode(
+            refresh_data.refresh_token,
+            settings.JWT_SECRET,
+            algorithms=[settings.JWT_ALGORITHM],
+        )
+    except JWTError:
+        raise credentials_exception
+    if payload.get("type") != TokenType.REFRESH or payload.get("sub") is None:
+        raise credentials_exception
+    
+    statement = select(User).where(User.id == UUID(payload["sub"]))
+    user = (await db.exec(statement)).first()
+    if user is None or payload.get("ver") != user.token_version:
+        raise credentials_exception
+    
+    return issue_token(user)
 
 
 @router.get("/me", response_model=UserRead)
-async def get_current_user_info(current_user: CurrentUser):
+async def get_current_user_info(current_user: CurrentUser, db: AsyncDatabaseSession):
     """
     Get the current authenticated user's information.
     
     Args:
         current_user: The authenticated user
+        db: Database session, used when STATELESS_AUTH left only token claims
         
     Returns:
         UserRead: User information
     """
+    if settings.STATELESS_AUTH:
+        user = await load_user(db, current_user.id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+        return user
     return current_user
 
 
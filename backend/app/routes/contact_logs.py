@@ -6,59 +6,101 @@ Endpoints for logging voter contacts.
 
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select, text
 
-from app.dependencies import CurrentUser, DatabaseSession
+from app.config import settings
+from app.dependencies import AsyncDatabaseSession, CurrentUser
+from app.export import ExportFormat, export_response
 from app.models.assignment import Assignment
-from app.models.contact_log import ContactLog, ContactLogCreate, ContactLogRead, ContactLogUpdate
+from app.models.contact_log import (
+    CONTACT_TYPES,
+    BatchItemStatus,
+    ContactLog,
+    ContactLogBatchCreate,
+    ContactLogBatchItemResult,
+    ContactLogBatchResult,
+    ContactLogCreate,
+    ContactLogPage,
+    ContactLogRead,
+    ContactLogUpdate,
+    ContactLogWithDetails,
+)
+from app.models.user import User
+from app.models.voter import Voter
+from app.pagination import decode_cursor, encode_cursor
 
 router = APIRouter()
 
 
-def coordinate_to_point(latitude: float, longitude: float) -> str:
-    """Convert coordinate to PostGIS POINT string."""
-    return f"SRID=4326;POINT({longitude} {latitude})"
-
-
-def point_to_coordinate(point_str: str) -> dict:
-    """Convert PostGIS POINT string to coordinate dict."""
-    if not point_str or point_str == "None":
-        return None
-    try:
-        coords = point_str.replace("POINT(", "").replace(")", "").split()
-        return {"latitude": float(coords[1]), "longitude": float(coords[0])}
-    except:
+async def get_log_by_idempotency_key(
+    db: AsyncDatabaseSession,
+    user_id: UUID,
+    idempotency_key: UUID,
+) -> Optional[ContactLogRead]:
+    """
+    Look up a previously uploaded log by the client's idempotency key.
+    
+    Args:
+        db: Database session
+        user_id: Uploading user's ID (keys are unique per user)
+        idempotency_key: Client-generated key
+        
+    Returns:
+        Optional[ContactLogRead]: The original log, or None if never uploaded
+    """
+    statement = select(ContactLog).where(
+        ContactLog.user_id == user_id,
+        ContactLog.idempotency_key == idempotency_key,
+    )
+    log = (await db.exec(statement)).first()
+    if not log:
         return None
+    return ContactLogRead(**log.model_dump())
 
 
 @router.post("/", response_model=ContactLogRead, status_code=status.HTTP_201_CREATED)
 async def create_contact_log(
     log_data: ContactLogCreate,
-    db: DatabaseSession,
+    response: Response,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
     Create a new contact log.
     
-    Users can only log contacts for their own assignments.
+    Users can only log contacts for their own assignments. If the log
+    carries an idempotency key that was already uploaded, the original log
+    is returned with 200 OK instead of inserting a duplicate.
     
     Args:
         log_data: Contact log data
+        response: Outgoing response (status set to 200 for retries)
         db: Database session
         current_user: Authenticated user
         
     Returns:
-        ContactLogRead: Created contact log
+        ContactLogRead: Created (or previously created) contact log
         
     Raises:
         HTTPException: If assignment not found or unauthorized
     """
+    # Retries resolve to the original row before any other work
+    if log_data.idempotency_key:
+        existing = await get_log_by_idempotency_key(
+            db, current_user.id, log_data.idempotency_key
+        )
+        if existing:
+            response.status_code = status.HTTP_200_OK
+            return existing
+    
     # Verify assignment belongs to user
     statement = select(Assignment).where(Assignment.id == log_data.assignment_id)
-    assignment = db.exec(statement).first()
+    assignment = (await db.exec(statement)).first()
     
     if not assignment:
         raise HTTPException(
@@ -76,7 +118,7 @@ async def create_contact_log(
             detail="You can only log contacts for your own assignments",
         )
     
-    # Create contact log
+    # Create contact log; the location is written by the same INSERT
     db_log = ContactLog(
         assignment_id=log_data.assignment_id,
         voter_id=log_data.voter_id,
@@ -84,57 +126,292 @@ async def create_contact_log(
         contact_type=log_data.contact_type,
         result=log_data.result,
         support_level=log_data.support_level,
+        idempotency_key=log_data.idempotency_key,
+        location=log_data.location,
     )
+    if log_data.contacted_at:
+        db_log.contacted_at = log_data.contacted_at
     
     db.add(db_log)
-    db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent upload with the same key won the race
+        await db.rollback()
+        if not log_data.idempotency_key:
+            raise
+        existing = await get_log_by_idempotency_key(
+            db, current_user.id, log_data.idempotency_key
+        )
+        if not existing:
+            raise
+        response.status_code = status.HTTP_200_OK
+        return existing
+    
+    # Every column was set client-side, so the response is built from the
+    # inserted object without re-reading the row.
+    return ContactLogRead(**db_log.model_dump())
+
+
+async def get_log_ids_by_idempotency_key(
+    db: AsyncDatabaseSession,
+    user_id: UUID,
+    idempotency_keys: set[UUID],
+) -> dict[UUID, UUID]:
+    """
+    Map already-uploaded idempotency keys to their log IDs in one query.
     
-    # Update location if provided
-    if log_data.location:
-        point = coordinate_to_point(
-            log_data.location.latitude,
-            log_data.location.longitude,
+    Args:
+        db: Database session
+        user_id: Uploading user's ID
+        idempotency_keys: Keys to look up
+        
+    Returns:
+        dict[UUID, UUID]: Idempotency key to contact log ID
+    """
+    statement = select(ContactLog.idempotency_key, ContactLog.id).where(
+        ContactLog.user_id == user_id,
+        ContactLog.idempotency_key.in_(idempotency_keys),
+    )
+    return dict((await db.exec(statement)).all())
+
+
+# Multi-row insert of a validated batch; one array parameter per column
+BATCH_INSERT_QUERY = text("""
+    INSERT INTO contact_logs (
+        id, assignment_id, voter_id, user_id, contact_type, result,
+        support_level, idempotency_key, location, contacted_at, created_at
+    )
+    SELECT
+        t.id, t.assignment_id, t.voter_id, :user_id, t.contact_type, t.result,
+        t.support_level, t.idempotency_key,
+        CASE
+            WHEN t.longitude IS NULL OR t.latitude IS NULL THEN NULL
+            ELSE ST_SetSRID(ST_MakePoint(t.longitude, t.latitude), 4326)
+        END,
+        COALESCE(t.contacted_at, NOW()),
+        NOW()
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:assignment_ids AS uuid[]),
+        CAST(:voter_ids AS uuid[]),
+        CAST(:contact_types AS text[]),
+        CAST(:results AS text[]),
+        CAST(:support_levels AS integer[]),
+        CAST(:idempotency_keys AS uuid[]),
+        CAST(:longitudes AS double precision[]),
+        CAST(:latitudes AS double precision[]),
+        CAST(:contacted_ats AS timestamptz[])
+    ) AS t(
+        id, assignment_id, voter_id, contact_type, result,
+        support_level, idempotency_key, longitude, latitude, contacted_at
+    )
+    ON CONFLICT (user_id, idempotency_key) WHERE idempotency_key IS NOT NULL
+    DO NOTHING
+    RETURNING id
+""")
+
+
+@router.post(
+    "/batch",
+    response_model=ContactLogBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_contact_logs_batch(
+    batch: ContactLogBatchCreate,
+    response: Response,
+    db: AsyncDatabaseSession,
+    current_user: CurrentUser,
+):
+    """
+    Create many contact logs in one request (offline sync upload).
+    
+    Assignment ownership and voter existence are checked once per distinct
+    ID, and every valid log is written with a single multi-row INSERT.
+    Logs whose idempotency key was already uploaded (or repeats within the
+    batch) are reported as duplicates with the original log's ID.
+    Invalid logs are reported per item and do not prevent the rest of the
+    batch from being saved; the response is 207 Multi-Status if any failed.
+    
+    Args:
+        batch: Contact logs to create
+        response: Outgoing response (status set to 207 on partial failure)
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        ContactLogBatchResult: Per-item outcomes in request order
+        
+    Raises:
+        HTTPException: If the batch exceeds the configured maximum size
+    """
+    if len(batch.logs) > settings.CONTACT_LOG_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.CONTACT_LOG_BATCH_MAX_SIZE} contact logs",
         )
-        update_location_query = text(
-            "UPDATE contact_logs SET location = ST_GeomFromEWKT(:point) WHERE id = :log_id"
+    
+    # Resolve every referenced assignment and voter up front
+    assignment_ids = {log.assignment_id for log in batch.logs}
+    assignment_owners = dict(
+        (
+            await db.exec(
+                select(Assignment.id, Assignment.user_id).where(
+                    Assignment.id.in_(assignment_ids)
+                )
+            )
+        ).all()
+    )
+    voter_ids = {log.voter_id for log in batch.logs}
+    existing_voters = set(
+        (await db.exec(select(Voter.id).where(Voter.id.in_(voter_ids)))).all()
+    )
+    idempotency_keys = {log.idempotency_key for log in batch.logs if log.idempotency_key}
+    uploaded_keys = {}
+    if idempotency_keys:
+        uploaded_keys = await get_log_ids_by_idempotency_key(
+            db, current_user.id, idempotency_keys
         )
-        db.exec(update_location_query, {"point": point, "log_id": db_log.id})
-        db.commit()
     
-    db.refresh(db_log)
+    is_manager = current_user.role in ["manager", "admin"]
+    results = []
+    columns = {
+        "ids": [],
+        "assignment_ids": [],
+        "voter_ids": [],
+        "contact_types": [],
+        "results": [],
+        "support_levels": [],
+        "idempotency_keys": [],
+        "longitudes": [],
+        "latitudes": [],
+        "contacted_ats": [],
+    }
+    
+    for index, log in enumerate(batch.logs):
+        if log.idempotency_key in uploaded_keys:
+            results.append(
+                ContactLogBatchItemResult(
+                    index=index,
+                    status=BatchItemStatus.DUPLICATE,
+                    id=uploaded_keys[log.idempotency_key],
+                )
+            )
+            continue
+        
+        error = None
+        owner_id = assignment_owners.get(log.assignment_id)
+        if owner_id is None:
+            error = "Assignment not found"
+        elif not is_manager and owner_id != current_user.id:
+            error = "You can only log contacts for your own assignments"
+        elif log.voter_id not in existing_voters:
+            error = "Voter not found"
+        elif log.contact_type not in CONTACT_TYPES:
+            error = f"Invalid contact_type: {log.contact_type}"
+        
+        if error:
+            results.append(
+                ContactLogBatchItemResult(index=index, status=BatchItemStatus.FAILED, error=error)
+            )
+            continue
+        
+        log_id = uuid4()
+        columns["ids"].append(log_id)
+        columns["assignment_ids"].append(log.assignment_id)
+        columns["voter_ids"].append(log.voter_id)
+        columns["contact_types"].append(log.contact_type)
+        columns["results"].append(log.result)
+        columns["support_levels"].append(log.support_level)
+        columns["idempotency_keys"].append(log.idempotency_key)
+        columns["longitudes"].append(log.location.longitude if log.location else None)
+        columns["latitudes"].append(log.location.latitude if log.location else None)
+        columns["contacted_ats"].append(log.contacted_at)
+        results.append(
+            ContactLogBatchItemResult(index=index, status=BatchItemStatus.CREATED, id=log_id)
+        )
+        if log.idempotency_key:
+            # Later repeats of this key in the same batch point at this log
+            uploaded_keys[log.idempotency_key] = log_id
+    
+    if columns["ids"]:
+        insert_result = await db.exec(
+            BATCH_INSERT_QUERY,
+            params={"user_id": current_user.id, **columns},
+        )
+        inserted = {row[0] for row in insert_result.all()}
+        await db.commit()
+        
+        # Keyed logs skipped by ON CONFLICT were uploaded concurrently
+        raced = {
+            log.idempotency_key: result
+            for log, result in zip(batch.logs, results)
+            if result.status == BatchItemStatus.CREATED
+            and log.idempotency_key
+            and result.id not in inserted
+        }
+        if raced:
+            originals = await get_log_ids_by_idempotency_key(db, current_user.id, set(raced))
+            for log, result in zip(batch.logs, results):
+                if log.idempotency_key in raced:
+                    result.status = BatchItemStatus.DUPLICATE
+                    result.id = originals.get(log.idempotency_key)
+    
+    created = sum(1 for result in results if result.status == BatchItemStatus.CREATED)
+    errors = [result for result in results if result.status == BatchItemStatus.FAILED]
+    if errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    
+    return ContactLogBatchResult(created=created, results=results, errors=errors)
+
+
+def filter_contact_logs(
+    statement,
+    current_user: User,
+    assignment_id: Optional[UUID],
+    start_date: Optional[datetime],
+):
+    """
+    Apply role scoping and the optional list filters to a contact log query.
     
-    # Prepare response
-    log_dict = db_log.model_dump()
+    Users can see their own logs, managers can see all logs.
     
-    # Get location
-    if log_data.location:
-        location_query = text(
-            "SELECT ST_AsText(location) FROM contact_logs WHERE id = :log_id"
-        )
-        location_result = db.exec(location_query, {"log_id": db_log.id}).first()
-        if location_result and location_result[0]:
-            log_dict["location"] = point_to_coordinate(location_result[0])
-        else:
-            log_dict["location"] = None
-    else:
-        log_dict["location"] = None
-    
-    return ContactLogRead(**log_dict)
+    Args:
+        statement: SELECT over contact_logs
+        current_user: Authenticated user
+        assignment_id: Optional assignment filter
+        start_date: Optional start date filter
+        
+    Returns:
+        The filtered statement
+    """
+    if current_user.role not in ["manager", "admin"]:
+        statement = statement.where(ContactLog.user_id == current_user.id)
+    
+    if assignment_id:
+        statement = statement.where(ContactLog.assignment_id == assignment_id)
+    
+    if start_date:
+        statement = statement.where(ContactLog.contacted_at >= start_date)
+    
+    return statement
 
 
-@router.get("/", response_model=list[dict])
+@router.get("/", response_model=ContactLogPage)
 async def list_contact_logs(
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
     assignment_id: Optional[UUID] = Query(None, description="Filter by assignment ID"),
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
-    List contact logs with filters.
+    List contact logs with filters, newest first.
     
     Users can see their own logs, managers can see all logs.
+    Uses keyset pagination on (contacted_at, id) descending, so every page
+    is an index seek regardless of how deep it is.
     
     Args:
         db: Database session
@@ -142,64 +419,102 @@ async def list_contact_logs(
         assignment_id: Optional assignment filter
         start_date: Optional start date filter
         limit: Maximum number of results
-        offset: Number of results to skip
+        cursor: Opaque cursor returned as next_cursor by the previous page
         
     Returns:
-        list[dict]: List of contact logs with voter details
+        ContactLogPage: Page of contact logs with voter names and the
+            cursor for the next page
     """
-    # Build query
-    query_parts = ["SELECT cl.*, v.first_name, v.last_name FROM contact_logs cl"]
-    query_parts.append("JOIN voters v ON cl.voter_id = v.id")
+    sort_key = tuple_(ContactLog.contacted_at, ContactLog.id)
+    statement = select(ContactLog, Voter.first_name, Voter.last_name).join(
+        Voter, ContactLog.voter_id == Voter.id
+    )
+    statement = filter_contact_logs(statement, current_user, assignment_id, start_date)
     
-    where_clauses = []
-    params = {"limit": limit, "offset": offset}
+    if cursor:
+        statement = statement.where(
+            sort_key < tuple_(*decode_cursor(cursor, datetime.fromisoformat, UUID))
+        )
     
-    # Filter by user role
-    if current_user.role not in ["manager", "admin"]:
-        where_clauses.append("cl.user_id = :user_id")
-        params["user_id"] = current_user.id
+    # Fetch one extra row to learn whether another page exists
+    statement = statement.order_by(
+        ContactLog.contacted_at.desc(), ContactLog.id.desc()
+    ).limit(limit + 1)
+    results = (await db.exec(statement)).all()
     
-    if assignment_id:
-        where_clauses.append("cl.assignment_id = :assignment_id")
-        params["assignment_id"] = assignment_id
+    next_cursor = None
+    if len(results) > limit:
+        results = results[:limit]
+        last = results[-1][0]
+        next_cursor = encode_cursor(last.contacted_at, last.id)
     
-    if start_date:
-        where_clauses.append("cl.contacted_at >= :start_date")
-        params["start_date"] = start_date
-    
-    if where_clauses:
-        query_parts.append("WHERE " + " AND ".join(where_clauses))
-    
-    query_parts.append("ORDER BY cl.contacted_at DESC")
-    query_parts.append("LIMIT :limit OFFSET :offset")
-    
-    query = text(" ".join(query_parts))
-    results = db.exec(query, params).all()
-    
-    logs = []
-    for row in results:
-        log_data = {
-            "id": row[0],
-            "assignment_id": row[1],
-            "voter_id": row[2],
-            "user_id": row[3],
-            "contact_type": row[4],
-            "result": row[5],
-            "support_level": row[6],
-            "contacted_at": row[8].isoformat() if row[8] else None,
-            "created_at": row[9].isoformat() if row[9] else None,
-            "voter_name": f"{row[10]} {row[11]}",
-        }
-        logs.append(log_data)
+    logs = [
+        ContactLogWithDetails(**log.model_dump(), voter_name=f"{first_name} {last_name}")
+        for log, first_name, last_name in results
+    ]
+    
+    return ContactLogPage(logs=logs, limit=limit, next_cursor=next_cursor)
+
+
+# Columns included in contact log exports, in output order. The voter's
+# external (VAN/PDI) ID is included so exports can be matched upstream.
+CONTACT_LOG_EXPORT_COLUMNS = (
+    ContactLog.id,
+    ContactLog.assignment_id,
+    ContactLog.voter_id,
+    Voter.voter_id.label("external_voter_id"),
+    ContactLog.user_id,
+    ContactLog.contact_type,
+    ContactLog.result,
+    ContactLog.support_level,
+    ContactLog.location,
+    ContactLog.contacted_at,
+    ContactLog.created_at,
+)
+
+
+@router.get("/export")
+async def export_contact_logs(
+    current_user: CurrentUser,
+    assignment_id: Optional[UUID] = Query(None, description="Filter by assignment ID"),
+    start_date: Optional[datetime] = Query(None, description="Filter by start date"),
+    export_format: str = Query(
+        ExportFormat.NDJSON, alias="format", description="Export format: ndjson or csv"
+    ),
+):
+    """
+    Stream contact logs as NDJSON or CSV, oldest first.
+    
+    Applies the same role scoping and filters as the contact log list.
+    Rows are streamed from a server-side cursor, so the export uses
+    constant memory regardless of table size.
     
-    return logs
+    Args:
+        current_user: Authenticated user
+        assignment_id: Optional assignment filter
+        start_date: Optional start date filter (e.g. the previous sync time)
+        export_format: ndjson (default) or csv
+        
+    Returns:
+        StreamingResponse: Export download
+        
+    Raises:
+        HTTPException: If the format is not supported
+    """
+    statement = select(*CONTACT_LOG_EXPORT_COLUMNS).join(
+        Voter, ContactLog.voter_id == Voter.id
+    )
+    statement = filter_contact_logs(statement, current_user, assignment_id, start_date)
+    statement = statement.order_by(ContactLog.contacted_at, ContactLog.id)
+    
+    return export_response(statement, export_format, "contact_logs")
 
 
 @router.put("/{log_id}", response_model=ContactLogRead)
 async def update_contact_log(
     log_id: UUID,
     log_data: ContactLogUpdate,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
@@ -220,7 +535,7 @@ async def update_contact_log(
         HTTPException: If log not found or unauthorized
     """
     statement = select(ContactLog).where(ContactLog.id == log_id)
-    log = db.exec(statement).first()
+    log = (await db.exec(statement)).first()
     
     if not log:
         raise HTTPException(
@@ -241,29 +556,15 @@ async def update_contact_log(
         setattr(log, key, value)
     
     db.add(log)
-    db.commit()
-    db.refresh(log)
-    
-    # Prepare response
-    log_dict = log.model_dump()
-    
-    # Get location
-    location_query = text(
-        "SELECT ST_AsText(location) FROM contact_logs WHERE id = :log_id"
-    )
-    location_result = db.exec(location_query, {"log_id": log.id}).first()
-    if location_result and location_result[0]:
-        log_dict["location"] = point_to_coordinate(location_result[0])
-    else:
-        log_dict["location"] = None
+    await db.commit()
     
-    return ContactLogRead(**log_dict)
+    return ContactLogRead(**log.model_dump())
 
 
 @router.delete("/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_contact_log(
     log_id: UUID,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
@@ -280,7 +581,7 @@ async def delete_contact_log(
         HTTPException: If log not found or unauthorized
     """
     statement = select(ContactLog).where(ContactLog.id == log_id)
-    log = db.exec(statement).first()
+    log = (await db.exec(statement)).first()
     
     if not log:
         raise HTTPException(
@@ -295,7 +596,7 @@ async def delete_contact_log(
             detail="Insufficient permissions to delete this contact log",
         )
     
-    db.delete(log)
-    db.commit()
+    await db.delete(log)
+    await db.commit()
     
     return None
@@ -0,0 +1,154 @@
+"""
+VEP MVP Backend - Sync Routes
+
+Delta sync of the calling user's assignments for offline clients.
+
+Every synced row carries the ID of the transaction that last wrote it
+(change_xid, maintained by triggers; see migration 006). A sync cursor
+holds the oldest transaction still running when the previous sync read
+its data (the snapshot's xmin): everything older was already visible to
+that sync, so rows with change_xid >= the cursor are all a client can
+have missed. Rows written by transactions that were in flight at the
+time may be sent twice, which is harmless since clients upsert.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Query
+from sqlmodel import text
+
+from app.config import settings
+from app.dependencies import AsyncDatabaseSession, CurrentUser
+from app.models.assignment import AssignmentRead
+from app.models.contact_log import ContactLogRead
+from app.models.sync import SyncAssignmentVoter, SyncChanges, SyncTombstone, SyncVoter
+from app.models.voter import PointGeometry
+from app.pagination import decode_cursor, encode_cursor
+
+router = APIRouter()
+
+# Bound as text: drivers have no native xid8 parameter type
+SINCE = "CAST(CAST(:since AS TEXT) AS xid8)"
+
+SYNC_HORIZON_QUERY = text("SELECT CAST(pg_snapshot_xmin(pg_current_snapshot()) AS TEXT)")
+
+SYNC_ASSIGNMENTS_QUERY = text(f"""
+    SELECT
+        a.id, a.user_id, a.name, a.description, a.assigned_date, a.due_date,
+        a.status, a.voter_count, a.completed_count, a.created_at, a.updated_at
+    FROM assignments a
+    WHERE a.user_id = :user_id
+      AND a.change_xid >= {SINCE}
+""")
+
+# Children of an assignment that changed owner are sent in full to the new owner
+SYNC_ASSIGNMENT_VOTERS_QUERY = text(f"""
+    SELECT av.id, av.assignment_id, av.voter_id, av.sequence_order
+    FROM assignment_voters av
+    JOIN assignments a ON a.id = av.assignment_id
+    WHERE a.user_id = :user_id
+      AND (av.change_xid >= {SINCE} OR a.assigned_xid >= {SINCE})
+""")
+
+# Starts from the user's (few hundred) memberships rather than the voters
+# table; a voter is sent when it changed or when it newly joined a turf.
+SYNC_VOTERS_QUERY = text(f"""
+    WITH mine AS (
+        SELECT
+            av.voter_id,
+            bool_or(av.change_xid >= {SINCE} OR a.assigned_xid >= {SINCE}) AS joined
+        FROM assignment_voters av
+        JOIN assignments a ON a.id = av.assignment_id
+        WHERE a.user_id = :user_id
+        GROUP BY av.voter_id
+    )
+    SELECT
+        v.id, v.voter_id, v.first_name, v.last_name, v.address, v.city, v.state,
+        v.zip, v.party_affiliation, v.support_level, v.phone, v.email,
+        ST_AsBinary(v.location) AS location, v.deleted_at, v.created_at, v.updated_at
+    FROM mine m
+    JOIN voters v ON v.id = m.voter_id
+    WHERE m.joined OR v.change_xid >= {SINCE}
+""").columns(location=PointGeometry())
+
+SYNC_CONTACT_LOGS_QUERY = text(f"""
+    SELECT
+        cl.id, cl.assignment_id, cl.voter_id, cl.user_id, cl.contact_type, cl.result,
+        cl.support_level, cl.idempotency_key, ST_AsBinary(cl.location) AS location,
+        cl.contacted_at, cl.created_at
+    FROM contact_logs cl
+    JOIN assignments a ON a.id = cl.assignment_id
+    WHERE a.user_id = :user_id
+      AND (cl.change_xid >= {SINCE} OR a.assigned_xid >= {SINCE})
+""").columns(location=PointGeometry())
+
+SYNC_TOMBSTONES_QUERY = text(f"""
+    SELECT t.entity, t.entity_id AS id
+    FROM sync_tombstones t
+    WHERE t.user_id = :user_id
+      AND t.change_xid >= {SINCE}
+    UNION ALL
+    SELECT t.entity, t.entity_id AS id
+    FROM sync_tombstones t
+    JOIN assignments a ON a.id = t.assignment_id
+    WHERE a.user_id = :user_id
+      AND t.change_xid >= {SINCE}
+""")
+
+
+@router.get("/changes", response_model=SyncChanges)
+async def get_changes(
+    db: AsyncDatabaseSession,
+    current_user: CurrentUser,
+    since: Optional[str] = Query(
+        None, description="next_cursor from the previous sync; omit for a full sync"
+    ),
+):
+    """
+    Get changes to the current user's assignments since a sync cursor.
+    
+    Returns assignments, assignment memberships, voters and contact logs
+    written since the cursor, plus tombstones for rows deleted since then.
+    Cursors older than the tombstone retention period (or no cursor) get a
+    full sync with `reset` set.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated user
+        since: Cursor from a previous sync
+    
+    Returns:
+        SyncChanges: Changed rows, tombstones and the next cursor
+    
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    since_xid, reset = 0, True
+    if since:
+        since_xid, issued_at = decode_cursor(since, int, datetime.fromisoformat)
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        reset = issued_at < datetime.utcnow() - retention
+        if reset:
+            since_xid = 0
+    
+    # Taken before reading, so anything committed after it is re-read next time
+    horizon = (await db.exec(SYNC_HORIZON_QUERY)).first()[0]
+    next_cursor = encode_cursor(int(horizon), datetime.utcnow())
+    params = {"user_id": current_user.id, "since": str(since_xid)}
+    
+    assignments = (await db.exec(SYNC_ASSIGNMENTS_QUERY, params=params)).all()
+    assignment_voters = (await db.exec(SYNC_ASSIGNMENT_VOTERS_QUERY, params=params)).all()
+    voters = (await db.exec(SYNC_VOTERS_QUERY, params=params)).all()
+    contact_logs = (await db.exec(SYNC_CONTACT_LOGS_QUERY, params=params)).all()
+    deleted = [] if reset else (await db.exec(SYNC_TOMBSTONES_QUERY, params=params)).all()
+    
+    return SyncChanges(
+        assignments=[AssignmentRead(**row._mapping) for row in assignments],
+        assignment_voters=[SyncAssignmentVoter(**row._mapping) for row in assignment_voters],
+        voters=[SyncVoter(**row._mapping) for row in voters],
+        contact_logs=[ContactLogRead(**row._mapping) for row in contact_logs],
+        deleted=[SyncTombstone(**row._mapping) for row in deleted],
+        reset=reset,
+        next_cursor=next_cursor,
+    )
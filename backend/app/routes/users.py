@@ -4,20 +4,29 @@ VEP MVP Backend - User Routes
 Endpoints for user management.
 """
 
+import io
+from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Body, HTTPException, UploadFile, status
 from sqlmodel import select
 
-from app.dependencies import AdminUser, CurrentUser, DatabaseSession, ManagerUser
-from app.models.user import User, UserCreate, UserRead, UserUpdate
+from app.dependencies import AdminUser, AsyncDatabaseSession, CurrentUser, ManagerUser
+from app.models.user import User, UserCreate, UserProvisionReport, UserRead, UserUpdate
 from app.routes.auth import get_password_hash
+from app.user_cache import invalidate_user, notify_user_changed
+from app.user_provisioning import (
+    UserProvisionFileError,
+    check_row_count,
+    provision_users,
+    read_provision_rows,
+)
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[UserRead])
-async def list_users(db: DatabaseSession, current_user: ManagerUser):
+async def list_users(db: AsyncDatabaseSession, current_user: ManagerUser):
     """
     List all users (managers and admins only).
     
@@ -29,12 +38,12 @@ async def list_users(db: DatabaseSession, current_user: ManagerUser):
         list[UserRead]: List of users
     """
     statement = select(User)
-    users = db.exec(statement).all()
+    users = (await db.exec(statement)).all()
     return users
 
 
 @router.get("/{user_id}", response_model=UserRead)
-async def get_user(user_id: UUID, db: DatabaseSession, current_user: CurrentUser):
+async def get_user(user_id: UUID, db: AsyncDatabaseSession, current_user: CurrentUser):
     """
     Get a specific user by ID.
     
@@ -52,7 +61,7 @@ async def get_user(user_id: UUID, db: DatabaseSession, current_user: CurrentUser
         HTTPException: If user not found or unauthorized
     """
     statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
+    user = (await db.exec(statement)).first()
     
     if not user:
         raise HTTPException(
@@ -71,7 +80,7 @@ async def get_user(user_id: UUID, db: DatabaseSession, current_user: CurrentUser
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def create_user(user_data: UserCreate, db: DatabaseSession, current_user: AdminUser):
+async def create_user(user_data: UserCreate, db: AsyncDatabaseSession, current_user: AdminUser):
     """
     Create a new user (admin only).
     
@@ -88,7 +97,7 @@ async def create_user(user_data: UserCreate, db: DatabaseSession, current_user:
     """
     # Check if user already exists
     statement = select(User).where(User.email == user_data.email)
-    existing_user = db.exec(statement).first()
+    existing_user = (await db.exec(statement)).first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -96,7 +105,7 @@ async def create_user(user_data: UserCreate, db: DatabaseSession, current_user:
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash(user_data.password)
     db_user = User(
         email=user_data.email,
         full_name=user_data.full_name,
@@ -106,23 +115,97 @@ async def create_user(user_data: UserCreate, db: DatabaseSession, current_user:
     # Note: password stored in Supabase Auth, not in this table
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 
+@router.post("/bulk", response_model=UserProvisionReport)
+async def provision_users_batch(
+    db: AsyncDatabaseSession,
+    current_user: AdminUser,
+    rows: list[Any] = Body(..., description="Users, as UserCreate objects without a password"),
+):
+    """
+    Create many users at once (admin only).
+    
+    Rows are validated individually; invalid rows, emails repeated in the
+    batch and already registered emails are reported and skipped, and the
+    rest are created in one statement.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated admin user
+        rows: Raw user rows
+        
+    Returns:
+        UserProvisionReport: Counts and an outcome for every row
+        
+    Raises:
+        HTTPException: If the batch exceeds USER_PROVISION_MAX_ROWS
+    """
+    try:
+        check_row_count(rows)
+    except UserProvisionFileError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    
+    return await provision_users(db, rows)
+
+
+@router.post("/bulk/upload", response_model=UserProvisionReport)
+async def provision_users_file(file: UploadFile, db: AsyncDatabaseSession, current_user: AdminUser):
+    """
+    Create users from an uploaded CSV or JSON file (admin only).
+    
+    CSV files need an email column; full_name, role and phone are read
+    when present. Rows with a password are rejected (see
+    app.user_provisioning).
+    
+    Args:
+        file: CSV file or JSON array of users
+        db: Database session
+        current_user: Authenticated admin user
+        
+    Returns:
+        UserProvisionReport: Counts and an outcome for every row
+        
+    Raises:
+        HTTPException: If the file cannot be read
+    """
+    source = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        rows = read_provision_rows(source, file.filename or "")
+    except UserProvisionFileError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User file must be UTF-8 encoded",
+        )
+    
+    return await provision_users(db, rows)
+
+
 @router.put("/{user_id}", response_model=UserRead)
 async def update_user(
     user_id: UUID,
     user_data: UserUpdate,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
     Update a user.
     
     Users can update their own profile, admins can update any user.
+    Cached copies of the user (this worker's, and with USER_CACHE_LISTEN
+    every worker's) are dropped once the change commits.
     
     Args:
         user_id: User ID
@@ -137,7 +220,7 @@ async def update_user(
         HTTPException: If user not found or unauthorized
     """
     statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
+    user = (await db.exec(statement)).first()
     
     if not user:
         raise HTTPException(
@@ -161,11 +244,16 @@ async def update_user(
     
     # Update fields
     update_data = user_data.model_dump(exclude_unset=True)
+    # A role change revokes refresh tokens and tokens carrying the old role
+    if "role" in update_data and update_data["role"] != user.role:
+        user.token_version += 1
     for key, value in update_data.items():
         setattr(user, key, value)
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await notify_user_changed(db, user.id)
+    await db.commit()
+    invalidate_user(user.id)
+    await db.refresh(user)
     
     return user
@@ -4,84 +4,213 @@ VEP MVP Backend - Voter Routes
 Endpoints for voter data management.
 """
 
+import io
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, UploadFile, status
+from sqlalchemy import tuple_
 from sqlmodel import func, select, text
 
-from app.dependencies import CurrentUser, DatabaseSession
-from app.models.voter import Voter, VoterCreate, VoterRead, VoterUpdate, VoterWithContactHistory
+from app.config import settings
+from app.database import asyncpg_connection
+from app.dependencies import AdminUser, AsyncDatabaseSession, CurrentUser, ManagerUser
+from app.export import ExportFormat, export_response
+from app.models.voter import (
+    Voter,
+    VoterCreate,
+    VoterImportReport,
+    VoterPage,
+    VoterRead,
+    VoterUpdate,
+    VoterWithContactHistory,
+)
+from app.pagination import decode_cursor, encode_cursor
+from app.responses import FastJSONResponse, fast_json_enabled, model_rows
+from app.voter_import import VoterFileError, import_voter_file
 
 router = APIRouter()
 
+# Columns of VoterRead, in field order, for reading plain rows
+VOTER_READ_COLUMNS = tuple(getattr(Voter, name) for name in VoterRead.model_fields)
 
-def coordinate_to_point(latitude: float, longitude: float) -> str:
-    """Convert coordinate to PostGIS POINT string."""
-    return f"SRID=4326;POINT({longitude} {latitude})"
 
-
-def point_to_coordinate(point_str: str) -> dict:
-    """Convert PostGIS POINT string to coordinate dict."""
-    if not point_str or point_str == "None":
-        return None
-    # Parse "POINT(lng lat)" format
-    try:
-        coords = point_str.replace("POINT(", "").replace(")", "").split()
-        return {"latitude": float(coords[1]), "longitude": float(coords[0])}
-    except:
-        return None
-
-
-@router.get("/", response_model=list[VoterRead])
+@router.get("/", response_model=VoterPage)
 async def list_voters(
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
     zip: Optional[str] = Query(None, description="Filter by ZIP code"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
 ):
     """
-    List voters with optional filters.
+    List voters with optional filters, ordered by name.
+    
+    Voters soft-deleted by a voter file sync are excluded.
+    Uses keyset pagination on (last_name, first_name, id), so every page
+    is an index seek regardless of how deep it is. With
+    FAST_JSON_RESPONSES on, plain rows are selected and encoded without
+    building models.
     
     Args:
         db: Database session
         current_user: Authenticated user
         zip: Optional ZIP code filter
         limit: Maximum number of results
-        offset: Number of results to skip
+        cursor: Opaque cursor returned as next_cursor by the previous page
         
     Returns:
-        list[VoterRead]: List of voters
+        VoterPage: Page of voters and the cursor for the next page
+    """
+    fast_json = fast_json_enabled()
+    sort_key = tuple_(Voter.last_name, Voter.first_name, Voter.id)
+    statement = select(*VOTER_READ_COLUMNS) if fast_json else select(Voter)
+    statement = statement.where(Voter.deleted_at.is_(None))
+    
+    if zip:
+        statement = statement.where(Voter.zip == zip)
+    
+    if cursor:
+        statement = statement.where(sort_key > tuple_(*decode_cursor(cursor, str, str, UUID)))
+    
+    # Fetch one extra row to learn whether another page exists
+    statement = statement.order_by(Voter.last_name, Voter.first_name, Voter.id).limit(limit + 1)
+    voters = (await db.exec(statement)).all()
+    
+    next_cursor = None
+    if len(voters) > limit:
+        voters = voters[:limit]
+        last = voters[-1]
+        next_cursor = encode_cursor(last.last_name, last.first_name, last.id)
+    
+    if fast_json:
+        return FastJSONResponse({
+            "voters": model_rows(VoterRead, voters),
+            "limit": limit,
+            "next_cursor": next_cursor,
+        })
+    
+    return VoterPage(
+        voters=[VoterRead(**voter.model_dump()) for voter in voters],
+        limit=limit,
+        next_cursor=next_cursor,
+    )
+
+
+# Columns included in voter exports, in output order
+VOTER_EXPORT_COLUMNS = (
+    Voter.id,
+    Voter.voter_id,
+    Voter.first_name,
+    Voter.last_name,
+    Voter.address,
+    Voter.city,
+    Voter.state,
+    Voter.zip,
+    Voter.party_affiliation,
+    Voter.support_level,
+    Voter.phone,
+    Voter.email,
+    Voter.location,
+    Voter.created_at,
+    Voter.updated_at,
+)
+
+
+@router.get("/export")
+async def export_voters(
+    current_user: ManagerUser,
+    zip: Optional[str] = Query(None, description="Filter by ZIP code"),
+    export_format: str = Query(
+        ExportFormat.NDJSON, alias="format", description="Export format: ndjson or csv"
+    ),
+):
     """
-    statement = select(Voter)
+    Stream every voter as NDJSON or CSV (manager/admin only).
     
+    Rows are streamed from a server-side cursor, so the export uses
+    constant memory regardless of the size of the voter file.
+    
+    Args:
+        current_user: Authenticated manager or admin
+        zip: Optional ZIP code filter
+        export_format: ndjson (default) or csv
+        
+    Returns:
+        StreamingResponse: Export download
+        
+    Raises:
+        HTTPException: If the format is not supported
+    """
+    statement = select(*VOTER_EXPORT_COLUMNS).where(Voter.deleted_at.is_(None))
     if zip:
         statement = statement.where(Voter.zip == zip)
     
-    statement = statement.limit(limit).offset(offset)
-    voters = db.exec(statement).all()
+    return export_response(statement, export_format, "voters")
+
+
+@router.post("/import", response_model=VoterImportReport)
+async def import_voters(
+    file: UploadFile,
+    current_user: AdminUser,
+    delete_missing: bool = Query(
+        False, description="Soft-delete voters not present in this (complete) file"
+    ),
+):
+    """
+    Upsert voters from an uploaded CSV voter file (admin only).
     
-    # Convert to response format
-    result = []
-    for voter in voters:
-        voter_dict = voter.model_dump()
-        # Get location from database
-        location_query = text(
-            "SELECT ST_AsText(location) FROM voters WHERE id = :voter_id"
+    Rows are matched on the external voter_id and only new or changed
+    voters are written. Rows failing validation are skipped and reported;
+    the rest are loaded in one transaction.
+    
+    The import runs inside the request, so uploads are capped at
+    VOTER_IMPORT_MAX_UPLOAD_BYTES to bound its duration and transaction
+    size. Larger files, such as statewide voter files, are loaded with the
+    `import-voters` CLI command, which reports progress and can validate
+    the file in parallel.
+    
+    Args:
+        file: CSV voter file (VAN/PDI-style headers are recognized)
+        current_user: Authenticated admin
+        delete_missing: Soft-delete live voters missing from the file
+        
+    Returns:
+        VoterImportReport: Row counts, rejected rows and throughput
+        
+    Raises:
+        HTTPException: If the file is too large, empty or missing required
+            columns
+    """
+    size = file.size if file.size is not None else file.file.seek(0, io.SEEK_END)
+    if size > settings.VOTER_IMPORT_MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=(
+                f"Voter file exceeds {settings.VOTER_IMPORT_MAX_UPLOAD_BYTES} bytes; "
+                "load it with `python -m app.cli import-voters`"
+            ),
         )
-        location_result = db.exec(location_query, {"voter_id": voter.id}).first()
-        if location_result and location_result[0]:
-            voter_dict["location"] = point_to_coordinate(location_result[0])
-        else:
-            voter_dict["location"] = None
-        result.append(VoterRead(**voter_dict))
+    file.file.seek(0)
     
-    return result
+    source = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        async with asyncpg_connection() as connection:
+            return await import_voter_file(connection, source, delete_missing=delete_missing)
+    except VoterFileError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Voter file must be UTF-8 encoded CSV",
+        )
 
 
 @router.get("/{voter_id}", response_model=VoterWithContactHistory)
-async def get_voter(voter_id: UUID, db: DatabaseSession, current_user: CurrentUser):
+async def get_voter(voter_id: UUID, db: AsyncDatabaseSession, current_user: CurrentUser):
     """
     Get a specific voter by ID with contact history.
     
@@ -97,7 +226,7 @@ async def get_voter(voter_id: UUID, db: DatabaseSession, current_user: CurrentUs
         HTTPException: If voter not found
     """
     statement = select(Voter).where(Voter.id == voter_id)
-    voter = db.exec(statement).first()
+    voter = (await db.exec(statement)).first()
     
     if not voter:
         raise HTTPException(
@@ -107,16 +236,6 @@ async def get_voter(voter_id: UUID, db: DatabaseSession, current_user: CurrentUs
     
     voter_dict = voter.model_dump()
     
-    # Get location
-    location_query = text(
-        "SELECT ST_AsText(location) FROM voters WHERE id = :voter_id"
-    )
-    location_result = db.exec(location_query, {"voter_id": voter.id}).first()
-    if location_result and location_result[0]:
-        voter_dict["location"] = point_to_coordinate(location_result[0])
-    else:
-        voter_dict["location"] = None
-    
     # Get contact history
     contact_query = text("""
         SELECT cl.contacted_at, cl.contact_type, cl.result, u.full_name as user_name
@@ -126,7 +245,7 @@ async def get_voter(voter_id: UUID, db: DatabaseSession, current_user: CurrentUs
         ORDER BY cl.contacted_at DESC
         LIMIT 10
     """)
-    contact_results = db.exec(contact_query, {"voter_id": voter.id}).all()
+    contact_results = (await db.exec(contact_query, params={"voter_id": voter.id})).all()
     
     contact_history = [
         {
@@ -147,7 +266,7 @@ async def get_voter(voter_id: UUID, db: DatabaseSession, current_user: CurrentUs
 async def update_voter(
     voter_id: UUID,
     voter_data: VoterUpdate,
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
 ):
     """
@@ -166,7 +285,7 @@ async def update_voter(
         HTTPException: If voter not found
     """
     statement = select(Voter).where(Voter.id == voter_id)
-    voter = db.exec(statement).first()
+    voter = (await db.exec(statement)).first()
     
     if not voter:
         raise HTTPException(
@@ -174,44 +293,24 @@ async def update_voter(
             detail="Voter not found",
         )
     
-    # Update fields
+    # Update fields; location is written in the same UPDATE as the rest
     update_data = voter_data.model_dump(exclude_unset=True, exclude={"location"})
     for key, value in update_data.items():
         setattr(voter, key, value)
-    
-    db.add(voter)
-    
-    # Update location if provided
     if voter_data.location:
-        point = coordinate_to_point(
-            voter_data.location.latitude,
-            voter_data.location.longitude,
-        )
-        update_location_query = text(
-            "UPDATE voters SET location = ST_GeomFromEWKT(:point) WHERE id = :voter_id"
-        )
-        db.exec(update_location_query, {"point": point, "voter_id": voter.id})
+        voter.location = voter_data.location
     
-    db.commit()
-    db.refresh(voter)
-    
-    # Get updated location
-    voter_dict = voter.model_dump()
-    location_query = text(
-        "SELECT ST_AsText(location) FROM voters WHERE id = :voter_id"
-    )
-    location_result = db.exec(location_query, {"voter_id": voter.id}).first()
-    if location_result and location_result[0]:
-        voter_dict["location"] = point_to_coordinate(location_result[0])
-    else:
-        voter_dict["location"] = None
+    db.add(voter)
+    await db.commit()
     
-    return VoterRead(**voter_dict)
+    # The session keeps the updated attributes after commit, so no re-read
+    # is needed.
+    return VoterRead(**voter.model_dump())
 
 
 @router.get("/nearby/", response_model=list[VoterRead])
 async def find_nearby_voters(
-    db: DatabaseSession,
+    db: AsyncDatabaseSession,
     current_user: CurrentUser,
     latitude: float = Query(..., description="Latitude"),
     longitude: float = Query(..., description="Longitude"),
@@ -233,48 +332,18 @@ async def find_nearby_voters(
         list[VoterRead]: List of nearby voters
     """
     # Use PostGIS spatial query
-    query = text("""
-        SELECT v.*, ST_AsText(v.location) as location_text,
-               ST_Distance(v.location::geography, 
-                          ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326)::geography) as distance
-        FROM voters v
-        WHERE v.location IS NOT NULL
-          AND ST_DWithin(v.location::geography,
-                        ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326)::geography,
-                        :radius)
-        ORDER BY distance
-        LIMIT :limit
-    """)
-    
-    results = db.exec(
-        query,
-        {
-            "latitude": latitude,
-            "longitude": longitude,
-            "radius": radius_meters,
-            "limit": limit,
-        },
-    ).all()
-    
-    voters = []
-    for row in results:
-        voter_dict = {
-            "id": row[0],
-            "voter_id": row[1],
-            "first_name": row[2],
-            "last_name": row[3],
-            "address": row[4],
-            "city": row[5],
-            "state": row[6],
-            "zip": row[7],
-            "party_affiliation": row[9],
-            "support_level": row[10],
-            "phone": row[11],
-            "email": row[12],
-            "created_at": row[13],
-            "updated_at": row[14],
-            "location": point_to_coordinate(row[15]) if len(row) > 15 and row[15] else None,
-        }
-        voters.append(VoterRead(**voter_dict))
+    center = func.geography(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326))
+    voter_location = func.geography(Voter.location)
+    statement = (
+        select(Voter)
+        .where(
+            Voter.deleted_at.is_(None),
+            Voter.location.is_not(None),
+            func.ST_DWithin(voter_location, center, radius_meters),
+        )
+        .order_by(func.ST_Distance(voter_location, center))
+        .limit(limit)
+    )
+    voters = (await db.exec(statement)).all()
     
-    return voters
+    return [VoterRead(**voter.model_dump()) for voter in voters]
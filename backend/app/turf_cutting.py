@@ -0,0 +1,215 @@
+"""
+VEP MVP Backend - Turf Cutting
+
+Splits a voter universe into geographically compact, equally sized turfs.
+
+Clustering is balanced k-means on locally projected coordinates:
+- k-means++ seeding
+- Each round assigns voters to their nearest centre that still has room,
+  voters with the most to lose (largest gap between their nearest and
+  second-nearest centre) first, so turf sizes differ by at most one
+- Centres move to the mean of their voters until they stop moving
+
+Each turf is then put in walking order with the route optimizer, unless
+it is too large to route (see cut_turfs).
+"""
+
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.route_optimizer import EARTH_RADIUS_METERS, optimize_route
+
+# Nearest centres considered per voter before falling back to all of them
+CANDIDATE_CENTERS = 8
+
+MAX_ITERATIONS = 10
+
+# Clustering stops once no centre moves further than this
+CONVERGENCE_METERS = 1.0
+
+
+def project(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Project coordinates to local planar metres (equirectangular).
+
+    Accurate to well under 1% across a county, which is plenty for
+    clustering.
+
+    Returns:
+        np.ndarray: (n, 2) array of x (east) and y (north) metres
+    """
+    scale = math.cos(math.radians(float(np.mean(latitudes))))
+    return np.column_stack([
+        np.radians(longitudes) * EARTH_RADIUS_METERS * scale,
+        np.radians(latitudes) * EARTH_RADIUS_METERS,
+    ])
+
+
+def squared_distances(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """(n, k) squared distances without an (n, k, 2) intermediate."""
+    return np.maximum(
+        (points ** 2).sum(axis=1)[:, None]
+        - 2 * points @ centers.T
+        + (centers ** 2).sum(axis=1)[None, :],
+        0.0,
+    )
+
+
+def kmeans_plus_plus(points: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Pick k initial centres, each far from those already picked."""
+    centers = [points[rng.integers(len(points))]]
+    nearest = squared_distances(points, np.array(centers))[:, 0]
+    for _ in range(1, k):
+        total = nearest.sum()
+        if total > 0:
+            index = rng.choice(len(points), p=nearest / total)
+        else:
+            index = rng.integers(len(points))
+        centers.append(points[index])
+        nearest = np.minimum(nearest, squared_distances(points, points[index][None, :])[:, 0])
+    return np.array(centers)
+
+
+def assign_balanced(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """
+    Assign points to centres so every cluster gets n // k or n // k + 1.
+
+    Args:
+        points: (n, 2) projected points
+        centers: (k, 2) projected centres
+
+    Returns:
+        np.ndarray: Cluster label per point
+    """
+    n, k = len(points), len(centers)
+    dist = squared_distances(points, centers)
+    m = min(k, CANDIDATE_CENTERS)
+    if m < k:
+        candidates = np.argpartition(dist, m - 1, axis=1)[:, :m]
+    else:
+        candidates = np.tile(np.arange(k), (n, 1))
+    candidate_dist = np.take_along_axis(dist, candidates, axis=1)
+    by_distance = np.argsort(candidate_dist, axis=1)
+    candidates = np.take_along_axis(candidates, by_distance, axis=1)
+    candidate_dist = np.take_along_axis(candidate_dist, by_distance, axis=1)
+
+    regret = candidate_dist[:, 1] - candidate_dist[:, 0] if m > 1 else np.zeros(n)
+    order = np.argsort(-regret, kind="stable")
+    base = n // k
+
+    # Vectorized first pass: each cluster takes the `base` voters with the
+    # most regret among those who prefer it
+    first = candidates[order, 0]
+    by_cluster = np.argsort(first, kind="stable")
+    wanted = np.bincount(first, minlength=k)
+    rank = np.empty(n, dtype=np.int64)
+    rank[by_cluster] = np.arange(n) - np.repeat(np.cumsum(wanted) - wanted, wanted)
+    accepted = rank < base
+
+    labels = np.full(n, -1, dtype=np.int64)
+    labels[order[accepted]] = first[accepted]
+    room = base - np.minimum(wanted, base)
+    extra = n % k  # clusters allowed one more point
+    extended = np.zeros(k, dtype=bool)
+
+    def take(cluster):
+        nonlocal extra
+        if room[cluster] > 0:
+            room[cluster] -= 1
+            return True
+        if extra and not extended[cluster]:
+            extended[cluster] = True
+            extra -= 1
+            return True
+        return False
+
+    # Everyone else, still in regret order, gets the nearest cluster with room
+    for i in order[~accepted]:
+        for cluster in candidates[i]:
+            if take(cluster):
+                labels[i] = cluster
+                break
+        else:
+            open_clusters = (room > 0) | (~extended if extra else np.zeros(k, dtype=bool))
+            cluster = int(np.where(open_clusters, dist[i], np.inf).argmin())
+            take(cluster)
+            labels[i] = cluster
+    return labels
+
+
+def balanced_kmeans(points: np.ndarray, k: int, seed: int = 0) -> np.ndarray:
+    """
+    Cluster points into k compact clusters of (nearly) equal size.
+
+    Args:
+        points: (n, 2) projected points
+        k: Number of clusters (at most n)
+        seed: Random seed, for repeatable turfs
+
+    Returns:
+        np.ndarray: Cluster label per point
+    """
+    rng = np.random.default_rng(seed)
+    centers = kmeans_plus_plus(points, k, rng)
+    for _ in range(MAX_ITERATIONS):
+        labels = assign_balanced(points, centers)
+        counts = np.bincount(labels, minlength=k)[:, None]
+        sums = np.column_stack([
+            np.bincount(labels, weights=points[:, 0], minlength=k),
+            np.bincount(labels, weights=points[:, 1], minlength=k),
+        ])
+        moved = sums / np.maximum(counts, 1)
+        shift = np.sqrt(((moved - centers) ** 2).sum(axis=1)).max()
+        centers = moved
+        if shift < CONVERGENCE_METERS:
+            break
+    return labels
+
+
+def cut_turfs(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    turf_count: int,
+    route_budget: float = 10.0,
+    seed: int = 0,
+    max_route_doors: Optional[int] = None,
+) -> list[list[int]]:
+    """
+    Split points into balanced turfs, each in walking order.
+
+    Args:
+        latitudes: Voter latitudes
+        longitudes: Voter longitudes
+        turf_count: Number of turfs (capped at the number of voters)
+        route_budget: Seconds of route optimization shared by all turfs
+        seed: Random seed for clustering
+        max_route_doors: Turfs with more voters are left in input order
+            instead of routed, as the optimizer's memory use is quadratic
+
+    Returns:
+        list[list[int]]: Per turf, input indices in walking order (or
+            input order if too large to route); turfs are ordered north
+            to south by their centre
+    """
+    lats = np.asarray(latitudes, dtype=float)
+    lngs = np.asarray(longitudes, dtype=float)
+    n = len(lats)
+    turf_count = min(turf_count, n)
+    if turf_count <= 0:
+        return []
+
+    labels = balanced_kmeans(project(lats, lngs), turf_count, seed)
+    members = [np.flatnonzero(labels == turf) for turf in range(turf_count)]
+    members.sort(key=lambda idx: (-lats[idx].mean(), lngs[idx].mean()))
+
+    turfs = []
+    time_limit = route_budget / turf_count
+    for idx in members:
+        if max_route_doors is not None and len(idx) > max_route_doors:
+            turfs.append([int(i) for i in idx])
+            continue
+        plan = optimize_route(lats[idx], lngs[idx], time_limit=time_limit)
+        turfs.append([int(idx[i]) for i in plan.order])
+    return turfs
@@ -0,0 +1,169 @@
+"""
+VEP MVP Backend - User Cache
+
+In-process cache of authenticated users, so get_current_user does not
+read the users table on every request.
+
+Entries live for USER_CACHE_TTL_SECONDS, which bounds how long a worker
+can act on a stale record (e.g. a revoked role). Writes through the API
+drop the entry locally once committed. With USER_CACHE_LISTEN on, they
+also send a NOTIFY on `USER_CHANGES_CHANNEL` in the same transaction,
+and every worker's `UserChangeListener` drops its copy at commit.
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import make_url
+from sqlmodel import select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.cache import TTLCache
+from app.config import settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+USER_CHANGES_CHANNEL = "vep_user_changes"
+
+NOTIFY_USER_CHANGED_QUERY = text("SELECT pg_notify(:channel, :user_id)")
+
+# Column values, not instances: every request gets its own User, so one
+# request mutating its current_user can never leak into another's
+user_cache: TTLCache[UUID, dict[str, Any]] = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+async def load_user(db: AsyncSession, user_id: UUID) -> Optional[User]:
+    """
+    Read a user, from the cache when possible.
+
+    Only found users are cached, so a user created after a failed lookup
+    is seen straight away.
+
+    Args:
+        db: Database session, only used on a cache miss
+        user_id: User ID
+
+    Returns:
+        Optional[User]: A fresh, detached User, or None if there is none
+    """
+    values = user_cache.get(user_id)
+    if values is not None:
+        return User(**values)
+
+    user = (await db.exec(select(User).where(User.id == user_id))).first()
+    if user is not None:
+        user_cache.set(user_id, user.model_dump())
+    return user
+
+
+async def notify_user_changed(db: AsyncSession, user_id: UUID) -> None:
+    """
+    Queue a change notification for other workers, sent on commit.
+
+    Call before committing the write; a rolled-back write notifies no one.
+    A no-op unless USER_CACHE_LISTEN is on.
+
+    Args:
+        db: Session holding the write
+        user_id: Changed user's ID
+    """
+    if settings.USER_CACHE_LISTEN:
+        await db.exec(
+            NOTIFY_USER_CHANGED_QUERY,
+            params={"channel": USER_CHANGES_CHANNEL, "user_id": str(user_id)},
+        )
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop a user from this worker's cache; call after the write commits."""
+    user_cache.pop(user_id)
+
+
+def listener_dsn(url: str) -> str:
+    """Plain postgresql:// DSN for asyncpg.connect from a SQLAlchemy URL."""
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class UserChangeListener:
+    """
+    Dedicated LISTEN connection that evicts users changed by any worker.
+
+    Notifications sent while the connection is down are lost, so the
+    whole cache is cleared whenever it (re)connects or drops.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        cache: TTLCache = user_cache,
+        retry_seconds: float = 5.0,
+        connect: Callable[..., Any] = asyncpg.connect,
+    ):
+        self.dsn = dsn
+        self.cache = cache
+        self.retry_seconds = retry_seconds
+        self._connect = connect
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def connected(self) -> bool:
+        """Whether notifications are currently being received."""
+        return self._connection is not None and not self._connection.is_closed()
+
+    def start(self) -> None:
+        """Start listening in the background, retrying until connected."""
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        self._stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                connection = await self._connect(self.dsn)
+                connection.add_termination_listener(self._on_terminate)
+                await connection.add_listener(USER_CHANGES_CHANNEL, self._on_notify)
+            except (OSError, asyncpg.PostgresError) as exc:
+                logger.warning("User cache listener could not connect: %s", exc)
+                await asyncio.sleep(self.retry_seconds)
+                continue
+            self._connection = connection
+            self.cache.clear()
+            return
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.cache.pop(UUID(payload))
+        except ValueError:
+            logger.warning("Ignoring malformed user change notification %r", payload)
+
+    def _on_terminate(self, connection) -> None:
+        self._connection = None
+        self.cache.clear()
+        if not self._stopping:
+            logger.warning("User cache listener disconnected; reconnecting")
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+
+user_change_listener = UserChangeListener(listener_dsn(settings.DATABASE_URL))
@@ -0,0 +1,218 @@
+"""
+VEP MVP Backend - Bulk User Provisioning
+
+Creates many volunteer accounts at once, for training-day onboarding:
+
+- Rows come from a JSON array or a CSV file (email, full_name, role,
+  phone columns) and are validated one by one, so a bad row is reported
+  instead of failing the batch
+- Existing emails are found with one query
+- All new users are inserted with one statement; an email registered
+  concurrently is reported as existing rather than failing the batch
+
+Each input row gets an outcome in the report.
+
+Rows with a password are rejected. The users table holds no credentials
+(they live in Supabase Auth), so a password here could not be stored, and
+accepting it would leave the volunteer unable to sign in with it.
+Provisioned volunteers are invited through Supabase Auth instead.
+"""
+
+import csv
+import json
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, TextIO
+from uuid import uuid4
+
+from pydantic import ValidationError
+from sqlmodel import text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.models.user import (
+    UserProvisionReport,
+    UserProvisionResult,
+    UserProvisionRow,
+    UserProvisionStatus,
+    UserRole,
+)
+
+ROLES = (UserRole.ADMIN, UserRole.MANAGER, UserRole.CANVASSER)
+
+EXISTING_EMAILS_QUERY = text("""
+    SELECT email FROM users WHERE email = ANY(CAST(:emails AS text[]))
+""")
+
+# Emails taken since EXISTING_EMAILS_QUERY ran are skipped, not fatal
+INSERT_USERS_QUERY = text("""
+    INSERT INTO users (id, email, full_name, role, phone, created_at, updated_at)
+    SELECT t.id, t.email, t.full_name, t.role, t.phone, :created_at, :created_at
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:emails AS text[]),
+        CAST(:full_names AS text[]),
+        CAST(:roles AS text[]),
+        CAST(:phones AS text[])
+    ) AS t(id, email, full_name, role, phone)
+    ON CONFLICT (email) DO NOTHING
+    RETURNING id
+""")
+
+
+class UserProvisionFileError(ValueError):
+    """A provisioning file that cannot be read at all."""
+
+
+def read_provision_rows(source: TextIO, filename: str = "") -> list[dict[str, Any]]:
+    """
+    Read provisioning rows from a JSON array or CSV file.
+
+    JSON is detected by a `.json` name or a leading `[`. CSV headers are
+    matched case-insensitively, with spaces read as underscores.
+
+    Args:
+        source: Text stream
+        filename: Original file name, if known
+
+    Returns:
+        list[dict]: Raw rows, in file order
+
+    Raises:
+        UserProvisionFileError: If the file is malformed, has no email
+            column, or has more than USER_PROVISION_MAX_ROWS rows
+    """
+    content = source.read()
+    if filename.lower().endswith(".json") or content.lstrip().startswith("["):
+        try:
+            rows = json.loads(content)
+        except json.JSONDecodeError as exc:
+            raise UserProvisionFileError(f"Invalid JSON: {exc}") from exc
+        if not isinstance(rows, list):
+            raise UserProvisionFileError("JSON input must be an array of users")
+    else:
+        reader = csv.DictReader(content.splitlines())
+        if not reader.fieldnames:
+            raise UserProvisionFileError("File is empty")
+        reader.fieldnames = [name.strip().lower().replace(" ", "_") for name in reader.fieldnames]
+        if "email" not in reader.fieldnames:
+            raise UserProvisionFileError("Missing required column: email")
+        # Blank cells mean "not given", so optional fields fall back to defaults
+        rows = [
+            {key: value for key, value in row.items() if key and value not in (None, "")}
+            for row in reader
+        ]
+
+    check_row_count(rows)
+    return rows
+
+
+def check_row_count(rows: list) -> None:
+    """Raise UserProvisionFileError if a batch exceeds USER_PROVISION_MAX_ROWS."""
+    if len(rows) > settings.USER_PROVISION_MAX_ROWS:
+        raise UserProvisionFileError(
+            f"At most {settings.USER_PROVISION_MAX_ROWS} users per batch; got {len(rows)}"
+        )
+
+
+def validate_row(raw: Any) -> UserProvisionRow:
+    """
+    Validate one raw row.
+
+    Raises:
+        ValueError: With a readable reason if the row is not a valid user
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("Row must be an object")
+    if raw.get("password") not in (None, ""):
+        raise ValueError("password: not supported; volunteers are invited through Supabase Auth")
+    try:
+        row = UserProvisionRow.model_validate(raw)
+    except ValidationError as exc:
+        error = exc.errors()[0]
+        field = ".".join(str(part) for part in error["loc"])
+        raise ValueError(f"{field}: {error['msg']}") from exc
+    if row.role not in ROLES:
+        raise ValueError(f"role: must be one of {', '.join(ROLES)}")
+    return row
+
+
+async def provision_users(db: AsyncSession, rows: list[Any]) -> UserProvisionReport:
+    """
+    Create users from raw rows, reporting an outcome per row.
+
+    Args:
+        db: Database session; committed once if any user is created
+        rows: Raw rows (dicts with UserProvisionRow fields)
+
+    Returns:
+        UserProvisionReport: Counts and per-row outcomes, in input order
+    """
+    started = time.perf_counter()
+
+    results: list[UserProvisionResult] = []
+    candidates: list[tuple[UserProvisionResult, UserProvisionRow]] = []
+    seen: set[str] = set()
+    for number, raw in enumerate(rows, start=1):
+        email = raw.get("email") if isinstance(raw, dict) else None
+        email = None if email is None else str(email)
+        result = UserProvisionResult(row=number, email=email, status=UserProvisionStatus.INVALID)
+        results.append(result)
+        try:
+            row = validate_row(raw)
+        except ValueError as exc:
+            result.error = str(exc)
+            continue
+        result.email = row.email
+        if row.email in seen:
+            result.status = UserProvisionStatus.DUPLICATE
+            result.error = "Email appears earlier in this batch"
+            continue
+        seen.add(row.email)
+        candidates.append((result, row))
+
+    if candidates:
+        found = (await db.exec(EXISTING_EMAILS_QUERY, params={"emails": sorted(seen)})).all()
+        existing = {row[0] for row in found}
+        new = []
+        for result, row in candidates:
+            if row.email in existing:
+                result.status = UserProvisionStatus.EXISTS
+                result.error = "Email already registered"
+            else:
+                new.append((result, row))
+
+        if new:
+            ids = [uuid4() for _ in new]
+            created = (
+                await db.exec(
+                    INSERT_USERS_QUERY,
+                    params={
+                        "ids": ids,
+                        "emails": [row.email for _, row in new],
+                        "full_names": [row.full_name for _, row in new],
+                        "roles": [row.role for _, row in new],
+                        "phones": [row.phone for _, row in new],
+                        "created_at": datetime.utcnow(),
+                    },
+                )
+            ).all()
+            await db.commit()
+            inserted = {row[0] for row in created}
+            for user_id, (result, _) in zip(ids, new):
+                if user_id in inserted:
+                    result.status = UserProvisionStatus.CREATED
+                    result.user_id = user_id
+                else:
+                    result.status = UserProvisionStatus.EXISTS
+                    result.error = "Email already registered"
+
+    counts = Counter(result.status for result in results)
+    return UserProvisionReport(
+        created=counts[UserProvisionStatus.CREATED],
+        existing=counts[UserProvisionStatus.EXISTS],
+        rejected=counts[UserProvisionStatus.INVALID] + counts[UserProvisionStatus.DUPLICATE],
+        results=results,
+        elapsed_seconds=round(time.perf_counter() - started, 3),
+    )
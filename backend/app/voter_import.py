@@ -0,0 +1,774 @@
+"""
+VEP MVP Backend - Voter Import
+
+Bulk loading of voter files (CSV, including VAN/PDI-style exports):
+- Streaming CSV parsing with header alias mapping
+- Chunked validation against VoterCreate, plus field normalization
+- COPY into a temporary staging table
+- One set-based upsert into voters keyed on the external voter_id, which
+  skips rows whose normalized content hash is unchanged
+- Optional soft deletion of voters missing from a complete file
+
+The file is read and validated one chunk at a time, and the next chunk is
+prepared in a worker thread while the current one is being COPYed, so
+memory use is bounded by the chunk size rather than the file size.
+
+For large files on disk, `import_voter_path` instead splits the file into
+byte ranges at line boundaries and validates them in a process pool, one
+range per task, while a single writer COPYs the results in file order.
+"""
+
+import asyncio
+import csv
+import hashlib
+import io
+import multiprocessing
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import AsyncIterator, Callable, Iterator, NamedTuple, Optional, TextIO
+
+import asyncpg
+from pydantic import ValidationError, create_model
+
+from app.config import settings
+from app.models.voter import VoterCreate, VoterImportRejectedRow, VoterImportReport
+
+
+class VoterFileError(ValueError):
+    """Raised when a voter file cannot be imported at all (e.g. missing columns)."""
+
+
+# Normalized header (lowercase, alphanumerics only) to voter field. The
+# first column matching a field wins, so e.g. "Phone" beats "Cell Phone"
+# when a file has both.
+HEADER_ALIASES = {
+    "voterid": "voter_id",
+    "vanid": "voter_id",
+    "voterfilevanid": "voter_id",
+    "statefileid": "voter_id",
+    "firstname": "first_name",
+    "first": "first_name",
+    "lastname": "last_name",
+    "last": "last_name",
+    "address": "address",
+    "address1": "address",
+    "streetaddress": "address",
+    "city": "city",
+    "state": "state",
+    "st": "state",
+    "zip": "zip",
+    "zip5": "zip",
+    "zipcode": "zip",
+    "postalcode": "zip",
+    "partyaffiliation": "party_affiliation",
+    "party": "party_affiliation",
+    "supportlevel": "support_level",
+    "phone": "phone",
+    "phonenumber": "phone",
+    "cellphone": "phone",
+    "homephone": "phone",
+    "email": "email",
+    "emailaddress": "email",
+    "latitude": "latitude",
+    "lat": "latitude",
+    "longitude": "longitude",
+    "long": "longitude",
+    "lon": "longitude",
+    "lng": "longitude",
+}
+
+# Plain pydantic model with VoterCreate's field definitions, minus the
+# nested location (see parse_coordinates). Validation enforces the same
+# rules as the API without SQLModel's per-instance overhead, which
+# otherwise dominates import time.
+VoterImportRow = create_model(
+    "VoterImportRow",
+    **{
+        name: (field.annotation, field)
+        for name, field in VoterCreate.model_fields.items()
+        if name != "location"
+    },
+)
+
+REQUIRED_FIELDS = ("voter_id", "first_name", "last_name", "address", "city", "zip")
+
+STAGING_TABLE = "voter_import_staging"
+REJECTED_IDS_TABLE = "voter_import_rejected_ids"
+
+# Column order of COPY records; see validate_chunk
+STAGING_COLUMNS = (
+    "line_number",
+    "voter_id",
+    "first_name",
+    "last_name",
+    "address",
+    "city",
+    "state",
+    "zip",
+    "party_affiliation",
+    "support_level",
+    "phone",
+    "email",
+    "latitude",
+    "longitude",
+    "content_hash",
+)
+
+# Voter IDs of rejected rows are kept so a sync never soft-deletes a voter
+# just because this delivery of their row failed validation.
+CREATE_STAGING_TABLE = f"""
+    CREATE TEMP TABLE {STAGING_TABLE} (
+        line_number INTEGER NOT NULL,
+        voter_id TEXT NOT NULL,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        address TEXT NOT NULL,
+        city TEXT NOT NULL,
+        state TEXT NOT NULL,
+        zip TEXT NOT NULL,
+        party_affiliation TEXT,
+        support_level INTEGER,
+        phone TEXT,
+        email TEXT,
+        latitude DOUBLE PRECISION,
+        longitude DOUBLE PRECISION,
+        content_hash BYTEA NOT NULL
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE {REJECTED_IDS_TABLE} (voter_id TEXT NOT NULL) ON COMMIT DROP;
+"""
+
+# The last row wins when a voter_id repeats within a file. Rows whose
+# content hash matches the live voter are filtered out before the INSERT,
+# so unchanged voters are not locked, rewritten or given a new updated_at.
+# Support level and location are only overwritten when the file supplies
+# them, so an import never erases canvassing results or geocoding done since.
+# A changed row for a soft-deleted voter restores it.
+UPSERT_FROM_STAGING = f"""
+    WITH incoming AS (
+        SELECT DISTINCT ON (s.voter_id) s.*
+        FROM {STAGING_TABLE} s
+        ORDER BY s.voter_id, s.line_number DESC
+    ),
+    changed AS (
+        SELECT i.*
+        FROM incoming i
+        WHERE NOT EXISTS (
+            SELECT 1 FROM voters v
+            WHERE v.voter_id = i.voter_id
+              AND v.content_hash = i.content_hash
+              AND v.deleted_at IS NULL
+        )
+    ),
+    upserted AS (
+        INSERT INTO voters AS v (
+            voter_id, first_name, last_name, address, city, state, zip,
+            party_affiliation, support_level, phone, email, location, content_hash
+        )
+        SELECT
+            c.voter_id, c.first_name, c.last_name, c.address, c.city, c.state, c.zip,
+            c.party_affiliation, c.support_level, c.phone, c.email,
+            CASE
+                WHEN c.longitude IS NULL OR c.latitude IS NULL THEN NULL
+                ELSE ST_SetSRID(ST_MakePoint(c.longitude, c.latitude), 4326)
+            END,
+            c.content_hash
+        FROM changed c
+        ON CONFLICT (voter_id) DO UPDATE SET
+            first_name = EXCLUDED.first_name,
+            last_name = EXCLUDED.last_name,
+            address = EXCLUDED.address,
+            city = EXCLUDED.city,
+            state = EXCLUDED.state,
+            zip = EXCLUDED.zip,
+            party_affiliation = EXCLUDED.party_affiliation,
+            support_level = COALESCE(EXCLUDED.support_level, v.support_level),
+            phone = EXCLUDED.phone,
+            email = EXCLUDED.email,
+            location = COALESCE(EXCLUDED.location, v.location),
+            content_hash = EXCLUDED.content_hash,
+            deleted_at = NULL,
+            updated_at = NOW()
+        WHERE v.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+           OR v.deleted_at IS NOT NULL
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT
+        (SELECT COUNT(*) FROM incoming) AS distinct_voters,
+        COUNT(*) FILTER (WHERE inserted) AS inserted,
+        COUNT(*) FILTER (WHERE NOT inserted) AS updated
+    FROM upserted
+"""
+
+# Soft-deletes live voters absent from a complete voter file
+SOFT_DELETE_MISSING = f"""
+    WITH deleted AS (
+        UPDATE voters v
+        SET deleted_at = NOW(), updated_at = NOW()
+        WHERE v.deleted_at IS NULL
+          AND NOT EXISTS (SELECT 1 FROM {STAGING_TABLE} s WHERE s.voter_id = v.voter_id)
+          AND NOT EXISTS (SELECT 1 FROM {REJECTED_IDS_TABLE} r WHERE r.voter_id = v.voter_id)
+        RETURNING 1
+    )
+    SELECT COUNT(*) AS deleted FROM deleted
+"""
+
+NON_DIGITS = re.compile(r"\D")
+ZIP_CODE = re.compile(r"(\d{5})(?:-?\d{4})?")
+
+
+def normalize_header(header: str) -> str:
+    """Lowercase a header and strip everything but letters and digits."""
+    return re.sub(r"[^a-z0-9]", "", header.lower())
+
+
+def map_columns(headers: list[str]) -> dict[int, str]:
+    """
+    Map CSV column positions to voter fields.
+
+    Args:
+        headers: Header row
+
+    Returns:
+        dict[int, str]: Column index to voter field name
+
+    Raises:
+        VoterFileError: If a required field has no matching column
+    """
+    column_map = {}
+    for index, header in enumerate(headers):
+        field = HEADER_ALIASES.get(normalize_header(header))
+        if field and field not in column_map.values():
+            column_map[index] = field
+
+    missing = [field for field in REQUIRED_FIELDS if field not in column_map.values()]
+    if missing:
+        raise VoterFileError(f"Voter file is missing required columns: {', '.join(missing)}")
+    return column_map
+
+
+def parse_rows(
+    reader: Iterator[list[str]],
+    column_map: dict[int, str],
+    line_offset: int = 0,
+) -> Iterator[tuple[int, dict[str, str]]]:
+    """
+    Turn CSV data rows into (line number, raw field dict) pairs.
+
+    Blank cells are omitted, so missing optional fields take their
+    VoterCreate defaults and missing required fields fail validation.
+
+    Args:
+        reader: csv.reader positioned after the header row
+        column_map: Column index to voter field name (see map_columns)
+        line_offset: Lines in the file before the reader's first line
+
+    Yields:
+        tuple[int, dict[str, str]]: Line number and non-blank fields
+    """
+    names = list(column_map.values())
+    pick = itemgetter(*column_map)
+    width = max(column_map) + 1
+
+    for row in reader:
+        if len(row) < width:
+            row = row + [""] * (width - len(row))
+        fields = {name: value for name, value in zip(names, map(str.strip, pick(row))) if value}
+        if fields:
+            yield line_offset + reader.line_num, fields
+
+
+def read_voter_rows(source: TextIO) -> Iterator[tuple[int, dict[str, str]]]:
+    """
+    Stream (line number, raw field dict) pairs from a voter CSV.
+
+    Args:
+        source: Open text file positioned at the header row
+
+    Yields:
+        tuple[int, dict[str, str]]: Line number and non-blank fields
+
+    Raises:
+        VoterFileError: If the file is empty or missing required columns
+    """
+    reader = csv.reader(source)
+    try:
+        headers = next(reader)
+    except StopIteration:
+        raise VoterFileError("Voter file is empty")
+    yield from parse_rows(reader, map_columns(headers))
+
+
+def iter_chunks(rows: Iterator, chunk_size: int) -> Iterator[list]:
+    """Group an iterator into lists of at most `chunk_size` items."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_coordinates(
+    latitude: Optional[str],
+    longitude: Optional[str],
+) -> tuple[Optional[float], Optional[float]]:
+    """
+    Parse a row's latitude/longitude cells.
+
+    Coordinates are checked here rather than through VoterCreate.location,
+    because validating a nested model per row costs more than the rest of
+    the row put together.
+
+    Args:
+        latitude: Latitude cell, if present
+        longitude: Longitude cell, if present
+
+    Returns:
+        tuple: (latitude, longitude), both None unless both were given
+
+    Raises:
+        ValueError: If a coordinate is not a number or out of range
+    """
+    if latitude is None or longitude is None:
+        return None, None
+    lat, lng = float(latitude), float(longitude)
+    if not (-90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0):
+        raise ValueError(f"coordinates out of range: {latitude}, {longitude}")
+    # ~1 cm; extra digits from a different export tool are not a change
+    return round(lat, 7), round(lng, 7)
+
+
+def clean_text(value: Optional[str]) -> Optional[str]:
+    """Collapse runs of inner whitespace (cells are already stripped)."""
+    if value and ("  " in value or "\t" in value):
+        return " ".join(value.split())
+    return value
+
+
+def normalize_phone(value: Optional[str]) -> Optional[str]:
+    """Format 10-digit (or 1 + 10-digit) US numbers as 512-555-0100."""
+    if not value:
+        return value
+    digits = NON_DIGITS.sub("", value)
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    if len(digits) == 10:
+        return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+    return value
+
+
+def normalize_zip(value: str) -> str:
+    """Reduce ZIP+4 to the five-digit ZIP used for filtering."""
+    match = ZIP_CODE.fullmatch(value)
+    return match.group(1) if match else value
+
+
+def content_hash(values: tuple) -> bytes:
+    """
+    Hash a normalized voter record.
+
+    Args:
+        values: Normalized field values in STAGING_COLUMNS order (without
+            line number or hash)
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest
+    """
+    # repr() of the tuple is unambiguous (strings are quoted, None is not)
+    return hashlib.blake2b(repr(values).encode(), digest_size=16).digest()
+
+
+def validate_chunk(
+    rows: list[tuple[int, dict[str, str]]],
+) -> tuple[list[tuple], list[VoterImportRejectedRow], list[str]]:
+    """
+    Validate raw rows against VoterCreate's field rules and normalize them.
+
+    Normalization (whitespace, phone and ZIP formats, case of state and
+    email, coordinate precision) makes cosmetic differences between
+    deliveries hash identically, so they do not count as changes.
+
+    Args:
+        rows: (line number, raw fields) pairs
+
+    Returns:
+        tuple: COPY records in STAGING_COLUMNS order, rejected rows, and
+            the voter IDs of rejected rows that had one
+    """
+    records = []
+    rejected = []
+    rejected_ids = []
+    for line, fields in rows:
+        try:
+            latitude, longitude = parse_coordinates(
+                fields.pop("latitude", None), fields.pop("longitude", None)
+            )
+            voter = VoterImportRow.model_validate(fields)
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            location = ".".join(str(part) for part in error["loc"])
+            rejected.append(VoterImportRejectedRow(line=line, error=f"{location}: {error['msg']}"))
+        except ValueError as exc:
+            rejected.append(VoterImportRejectedRow(line=line, error=f"location: {exc}"))
+        else:
+            values = (
+                voter.voter_id,
+                clean_text(voter.first_name),
+                clean_text(voter.last_name),
+                clean_text(voter.address),
+                clean_text(voter.city),
+                voter.state.upper(),
+                normalize_zip(voter.zip),
+                voter.party_affiliation,
+                voter.support_level,
+                normalize_phone(voter.phone),
+                voter.email.lower() if voter.email else None,
+                latitude,
+                longitude,
+            )
+            records.append((line, *values, content_hash(values)))
+            continue
+        if "voter_id" in fields:
+            rejected_ids.append(clean_text(fields["voter_id"]))
+    return records, rejected, rejected_ids
+
+
+class PreparedChunk(NamedTuple):
+    """A validated chunk, ready to COPY."""
+    rows_read: int
+    records: list[tuple]
+    rejected: list[VoterImportRejectedRow]
+    rejected_ids: list[str]
+
+
+class Shard(NamedTuple):
+    """A byte range of a voter file holding whole lines."""
+    start: int
+    end: int
+    first_line: int
+
+
+def prepare_next_chunk(chunks: Iterator[list]) -> Optional[PreparedChunk]:
+    """Read and validate the next chunk; returns None at end of file."""
+    chunk = next(chunks, None)
+    if chunk is None:
+        return None
+    return PreparedChunk(len(chunk), *validate_chunk(chunk))
+
+
+def read_header(path: str) -> tuple[dict[int, str], int]:
+    """
+    Read and map a voter file's header row.
+
+    Args:
+        path: Voter CSV path
+
+    Returns:
+        tuple: Column map (see map_columns) and the byte offset of the
+            first data line
+
+    Raises:
+        VoterFileError: If the file is empty or missing required columns
+    """
+    with open(path, "rb") as source:
+        header = source.readline()
+    if not header:
+        raise VoterFileError("Voter file is empty")
+    headers = next(csv.reader([header.decode("utf-8-sig")]))
+    return map_columns(headers), len(header)
+
+
+def has_multiline_cells(path: str, start: int) -> bool:
+    """
+    Check whether a voter file may have quoted cells spanning lines.
+
+    A line that leaves a quoted cell open has an odd number of quote
+    characters, as does the line closing it. A stray quote in an unquoted
+    cell also counts, so the check errs towards reporting multi-line cells.
+
+    Args:
+        path: Voter CSV path
+        start: Byte offset of the first data line (see read_header)
+
+    Returns:
+        bool: Whether any data line has an odd number of quotes
+    """
+    with open(path, "rb") as source:
+        source.seek(start)
+        return any(line.count(b'"') % 2 for line in source)
+
+
+def iter_shards(path: str, start: int, shard_bytes: int) -> Iterator[Shard]:
+    """
+    Split a voter file's data lines into byte ranges of about `shard_bytes`.
+
+    Each range is extended to the end of the line it stops in, and its
+    first line number is counted here, so shards can be parsed
+    independently and still report real line numbers. Quoted cells
+    containing line breaks are not supported, as a range could start
+    inside one (see has_multiline_cells).
+
+    Args:
+        path: Voter CSV path
+        start: Byte offset of the first data line (see read_header)
+        shard_bytes: Target shard size in bytes
+
+    Yields:
+        Shard: Byte ranges in file order
+    """
+    first_line = 2
+    with open(path, "rb") as source:
+        source.seek(start)
+        while data := source.read(shard_bytes):
+            if not data.endswith(b"\n"):
+                data += source.readline()
+            yield Shard(start, start + len(data), first_line)
+            first_line += data.count(b"\n")
+            start += len(data)
+
+
+def prepare_shard(path: str, shard: Shard, column_map: dict[int, str]) -> PreparedChunk:
+    """
+    Parse and validate one shard. Runs in an import worker process.
+
+    Args:
+        path: Voter CSV path
+        shard: Byte range to read
+        column_map: Column map from read_header
+
+    Returns:
+        PreparedChunk: The shard's COPY records and rejected rows
+    """
+    with open(path, "rb") as source:
+        source.seek(shard.start)
+        text = source.read(shard.end - shard.start).decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    rows = list(parse_rows(reader, column_map, shard.first_line - 1))
+    return PreparedChunk(len(rows), *validate_chunk(rows))
+
+
+def import_worker_count(workers: int) -> int:
+    """
+    Resolve a configured worker count; 0 means one per CPU core.
+
+    Validation is CPU-bound, so workers beyond the core count only add
+    process and pickling overhead; the count is capped at the core count.
+    """
+    cores = os.cpu_count() or 1
+    return min(workers, cores) if workers > 0 else cores
+
+
+async def prepare_in_thread(chunks: Iterator[list]) -> AsyncIterator[PreparedChunk]:
+    """
+    Validate chunks in a worker thread, one chunk ahead of the consumer.
+
+    Args:
+        chunks: Chunks of (line number, raw fields) pairs
+
+    Yields:
+        PreparedChunk: Validated chunks in order
+    """
+    # Chunk N+1 is parsed off the event loop while the consumer COPYs chunk N
+    pending = asyncio.create_task(asyncio.to_thread(prepare_next_chunk, chunks))
+    while (prepared := await pending) is not None:
+        pending = asyncio.create_task(asyncio.to_thread(prepare_next_chunk, chunks))
+        yield prepared
+
+
+async def prepare_in_processes(
+    path: str,
+    column_map: dict[int, str],
+    data_start: int,
+    workers: int,
+    shard_bytes: int,
+) -> AsyncIterator[PreparedChunk]:
+    """
+    Validate a voter file's shards in a process pool, yielding them in order.
+
+    At most two shards per worker are in flight, so memory use is bounded
+    by the worker count and shard size rather than the file size.
+
+    Args:
+        path: Voter CSV path
+        column_map: Column map from read_header
+        data_start: Byte offset of the first data line
+        workers: Worker processes
+        shard_bytes: Target shard size in bytes
+
+    Yields:
+        PreparedChunk: Validated shards in file order
+    """
+    loop = asyncio.get_running_loop()
+    shards = iter_shards(path, data_start, shard_bytes)
+    pending = deque()
+    # spawn rather than fork: the parent has event loop and pool threads running
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    async def submit_next():
+        shard = await asyncio.to_thread(next, shards, None)
+        if shard is not None:
+            pending.append(loop.run_in_executor(pool, prepare_shard, path, shard, column_map))
+
+    try:
+        for _ in range(workers * 2):
+            await submit_next()
+        while pending:
+            prepared = await pending.popleft()
+            await submit_next()
+            yield prepared
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def load_prepared_chunks(
+    connection: asyncpg.Connection,
+    chunks: AsyncIterator[PreparedChunk],
+    progress: Optional[Callable[[VoterImportReport], None]] = None,
+    delete_missing: bool = False,
+) -> VoterImportReport:
+    """
+    COPY validated chunks into staging, then upsert them into voters.
+
+    Only new voters and voters whose normalized content changed are
+    written. Runs in a single transaction: nothing is written unless the
+    whole file is staged and upserted.
+
+    Args:
+        connection: asyncpg connection (see app.database.asyncpg_connection)
+        chunks: Validated chunks in file order
+        progress: Called with the running report after each chunk
+        delete_missing: Treat the file as the complete voter list and
+            soft-delete live voters not present in it
+
+    Returns:
+        VoterImportReport: Row counts, rejected rows and throughput
+    """
+    started = time.perf_counter()
+    report = VoterImportReport()
+
+    def update_timing():
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        if report.elapsed_seconds:
+            report.rows_per_second = round(report.rows_read / report.elapsed_seconds, 1)
+
+    async with connection.transaction():
+        await connection.execute(CREATE_STAGING_TABLE)
+
+        async for rows_read, records, rejected, rejected_ids in chunks:
+            if records:
+                await connection.copy_records_to_table(
+                    STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+                )
+            if rejected_ids and delete_missing:
+                await connection.copy_records_to_table(
+                    REJECTED_IDS_TABLE,
+                    records=[(voter_id,) for voter_id in rejected_ids],
+                    columns=("voter_id",),
+                )
+            report.rows_read += rows_read
+            report.rows_loaded += len(records)
+            report.rows_rejected += len(rejected)
+            room = settings.VOTER_IMPORT_MAX_REPORTED_ERRORS - len(report.errors)
+            report.errors.extend(rejected[:max(room, 0)])
+            update_timing()
+            if progress:
+                progress(report)
+
+        await connection.execute(f"ANALYZE {STAGING_TABLE}")
+        counts = await connection.fetchrow(UPSERT_FROM_STAGING)
+        report.inserted = counts["inserted"]
+        report.updated = counts["updated"]
+        report.unchanged = counts["distinct_voters"] - report.inserted - report.updated
+        if delete_missing:
+            report.deleted = (await connection.fetchrow(SOFT_DELETE_MISSING))["deleted"]
+
+    update_timing()
+    return report
+
+
+async def import_voter_file(
+    connection: asyncpg.Connection,
+    source: TextIO,
+    chunk_size: int = settings.VOTER_IMPORT_CHUNK_SIZE,
+    progress: Optional[Callable[[VoterImportReport], None]] = None,
+    delete_missing: bool = False,
+) -> VoterImportReport:
+    """
+    Import a voter CSV stream, upserting voters by their external voter_id.
+
+    Rows failing validation are skipped and reported rather than aborting
+    the import. Validation runs in a single worker thread; see
+    import_voter_path for multi-core imports of files on disk.
+
+    Args:
+        connection: asyncpg connection (see app.database.asyncpg_connection)
+        source: Open text file positioned at the header row
+        chunk_size: Rows validated and COPYed per chunk
+        progress: Called with the running report after each chunk
+        delete_missing: Treat the file as the complete voter list and
+            soft-delete live voters not present in it
+
+    Returns:
+        VoterImportReport: Row counts, rejected rows and throughput
+
+    Raises:
+        VoterFileError: If the file is empty or missing required columns
+    """
+    chunks = iter_chunks(read_voter_rows(source), chunk_size)
+    return await load_prepared_chunks(
+        connection, prepare_in_thread(chunks), progress, delete_missing
+    )
+
+
+async def import_voter_path(
+    connection: asyncpg.Connection,
+    path: str,
+    workers: int = settings.VOTER_IMPORT_WORKERS,
+    shard_bytes: int = settings.VOTER_IMPORT_SHARD_BYTES,
+    progress: Optional[Callable[[VoterImportReport], None]] = None,
+    delete_missing: bool = False,
+) -> VoterImportReport:
+    """
+    Import a voter CSV file, validating shards of it in parallel.
+
+    Produces the same staging rows, line numbers and report as
+    import_voter_file. Files that may have quoted cells containing line
+    breaks cannot be split safely (see iter_shards); they are streamed
+    through import_voter_file instead, so no row is lost or mis-parsed
+    (and then soft-deleted with `delete_missing`). So are all files when
+    only one worker is available after capping at the CPU core count,
+    since a single-process pool is slower than validating in a thread.
+
+    Args:
+        connection: asyncpg connection (see app.database.asyncpg_connection)
+        path: Voter CSV path (UTF-8)
+        workers: Validation processes, capped at the CPU core count;
+            0 means one per CPU core
+        shard_bytes: Bytes of the file validated and COPYed per shard
+        progress: Called with the running report after each shard
+        delete_missing: Treat the file as the complete voter list and
+            soft-delete live voters not present in it
+
+    Returns:
+        VoterImportReport: Row counts, rejected rows and throughput
+
+    Raises:
+        VoterFileError: If the file is empty or missing required columns
+    """
+    workers = import_worker_count(workers)
+    column_map, data_start = read_header(path)
+    if workers <= 1 or await asyncio.to_thread(has_multiline_cells, path, data_start):
+        with open(path, newline="", encoding="utf-8-sig") as source:
+            return await import_voter_file(
+                connection, source, progress=progress, delete_missing=delete_missing
+            )
+    chunks = prepare_in_processes(path, column_map, data_start, workers, shard_bytes)
+    return await load_prepared_chunks(connection, chunks, progress, delete_missing)
@@ -0,0 +1 @@
+"""VEP MVP Backend Benchmarks"""
@@ -0,0 +1,169 @@
+"""
+VEP MVP Backend - Assignment Detail Benchmark
+
+Times the assignment voter read behind GET /assignments/{id} (and the
+offline packet) against a PostgreSQL database with all migrations
+applied, using a 1,000-voter assignment with 20,000 contact logs:
+
+    python -m benchmarks.assignment_detail --runs 50
+
+The fixture is created inside a transaction that is rolled back, so the
+benchmark can be pointed at any development database (DATABASE_URL).
+For comparison it also times the correlated last-contact subquery the
+endpoint used before migration 007.
+"""
+
+import argparse
+import statistics
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+
+from app.config import settings
+from app.packets import ASSIGNMENT_VOTERS_QUERY
+
+FIXTURE_VOTERS = 1000
+FIXTURE_LOGS = 20000
+
+# p95 the assignment voter read must stay under for the fixture
+LATENCY_BUDGET_MS = 50.0
+
+# Previous plan: one correlated subquery (and JSON build) per voter row
+CORRELATED_VOTERS_QUERY = text("""
+    SELECT
+        v.id, v.voter_id, v.first_name, v.last_name, v.address,
+        v.city, v.zip, v.party_affiliation, v.support_level,
+        av.sequence_order,
+        ST_AsText(v.location) as location_text,
+        (
+            SELECT json_build_object(
+                'date', cl.contacted_at,
+                'type', cl.contact_type,
+                'result', cl.result
+            )
+            FROM contact_logs cl
+            WHERE cl.voter_id = v.id
+              AND cl.assignment_id = :assignment_id
+            ORDER BY cl.contacted_at DESC
+            LIMIT 1
+        ) as last_contact
+    FROM voters v
+    JOIN assignment_voters av ON v.id = av.voter_id
+    WHERE av.assignment_id = :assignment_id
+    ORDER BY av.sequence_order NULLS LAST, v.last_name, v.first_name
+""")
+
+SEED_STATEMENTS = (
+    """
+    INSERT INTO users (id, email, full_name, role)
+    VALUES (:user_id, :email, 'Benchmark Canvasser', 'canvasser')
+    """,
+    """
+    INSERT INTO assignments (id, user_id, name)
+    VALUES (:assignment_id, :user_id, 'Benchmark Turf')
+    """,
+    """
+    INSERT INTO voters (voter_id, first_name, last_name, address, city, zip, location)
+    SELECT
+        :prefix || g, 'Voter' || g, 'Bench' || g, g || ' Main St', 'Austin', '78701',
+        ST_SetSRID(ST_MakePoint(-97.74 - (g % 40) * 0.0005, 30.26 + (g / 40) * 0.0005), 4326)
+    FROM generate_series(1, :voters) AS g
+    """,
+    """
+    INSERT INTO assignment_voters (assignment_id, voter_id, sequence_order)
+    SELECT :assignment_id, v.id, row_number() OVER (ORDER BY v.voter_id)
+    FROM voters v
+    WHERE v.voter_id LIKE :prefix || '%'
+    """,
+    """
+    INSERT INTO contact_logs (assignment_id, voter_id, user_id, contact_type, result, contacted_at)
+    SELECT
+        :assignment_id, av.voter_id, :user_id,
+        (ARRAY['knocked', 'not_home', 'refused'])[1 + g % 3],
+        'Visit ' || g,
+        NOW() - g * INTERVAL '1 minute'
+    FROM generate_series(1, :logs) AS g
+    JOIN (
+        SELECT voter_id, sequence_order - 1 AS n
+        FROM assignment_voters
+        WHERE assignment_id = :assignment_id
+    ) av ON av.n = g % :voters
+    """,
+    "ANALYZE voters",
+    "ANALYZE assignment_voters",
+    "ANALYZE contact_logs",
+)
+
+
+def seed_large_assignment(
+    connection: Connection,
+    voters: int = FIXTURE_VOTERS,
+    logs: int = FIXTURE_LOGS,
+) -> UUID:
+    """
+    Create a canvasser, an assignment of `voters` voters and `logs` contact
+    logs spread evenly over them, in the connection's open transaction.
+
+    Returns:
+        UUID: ID of the assignment
+    """
+    params = {
+        "user_id": uuid4(),
+        "assignment_id": uuid4(),
+        "email": f"bench-{uuid4().hex}@test.com",
+        "prefix": f"BENCH-{uuid4().hex[:8]}-",
+        "voters": voters,
+        "logs": logs,
+    }
+    for statement in SEED_STATEMENTS:
+        connection.execute(text(statement), params)
+    return params["assignment_id"]
+
+
+def time_query(connection: Connection, query, assignment_id: UUID, runs: int) -> list[float]:
+    """Run a query `runs` times after one warm-up; returns milliseconds per run."""
+    params = {"assignment_id": assignment_id}
+    connection.execute(query, params).all()
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        connection.execute(query, params).all()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def p95(timings: list[float]) -> float:
+    """95th percentile of a list of timings."""
+    return statistics.quantiles(timings, n=20)[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the assignment voter read")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--voters", type=int, default=FIXTURE_VOTERS)
+    parser.add_argument("--logs", type=int, default=FIXTURE_LOGS)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            assignment_id = seed_large_assignment(connection, args.voters, args.logs)
+            print(f"{args.voters:,} voters, {args.logs:,} contact logs, {args.runs} runs")
+            print(f"{'query':>12} {'p50 ms':>8} {'p95 ms':>8}")
+            for name, query in (
+                ("lateral", ASSIGNMENT_VOTERS_QUERY),
+                ("correlated", CORRELATED_VOTERS_QUERY),
+            ):
+                timings = time_query(connection, query, assignment_id, args.runs)
+                print(f"{name:>12} {statistics.median(timings):>8.1f} {p95(timings):>8.1f}")
+            print(f"budget: p95 under {LATENCY_BUDGET_MS:.0f} ms for the lateral read")
+        finally:
+            transaction.rollback()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+VEP MVP Backend - Geometry Decoding Benchmark
+
+Measures decoding a column of voter locations, per 1,000 points:
+
+    python -m benchmarks.geometry --points 1000 --runs 50
+
+"wkt" is the ST_AsText parser the assignment voter list used to run on
+every row. "wkb" decodes ST_AsBinary output one point at a time with
+app.geometry.decode_point (what PointGeometry does per row); "wkb batch"
+decodes the whole column with decode_points. "+ Coordinate" adds
+building the API model, which every read path still pays.
+"""
+
+import argparse
+import struct
+import time
+
+from app.geometry import decode_point, decode_points
+from app.models.voter import Coordinate
+
+
+def parse_wkt(point_str: str):
+    """The string parser previously in app.routes.assignments."""
+    if not point_str or point_str == "None":
+        return None
+    try:
+        coords = point_str.replace("POINT(", "").replace(")", "").split()
+        return {"latitude": float(coords[1]), "longitude": float(coords[0])}
+    except Exception:
+        return None
+
+
+def time_ms(function, runs: int) -> float:
+    """Mean milliseconds per call, after one warm-up call."""
+    function()
+    started = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark point decoding")
+    parser.add_argument("--points", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    coordinates = [(30 + i / 10000, -97.7431 - i / 20000) for i in range(args.points)]
+    wkt = [f"POINT({lng!r} {lat!r})" for lat, lng in coordinates]
+    wkb = [struct.pack("<BIdd", 1, 1, lng, lat) for lat, lng in coordinates]
+
+    def wkt_dicts():
+        [parse_wkt(value) for value in wkt]
+
+    def wkb_tuples():
+        [decode_point(value) for value in wkb]
+
+    def wkb_batch():
+        decode_points(wkb).tolist()
+
+    def wkt_models():
+        [Coordinate(**parse_wkt(value)) for value in wkt]
+
+    def wkb_models():
+        [Coordinate(latitude=lat, longitude=lng) for lat, lng in map(decode_point, wkb)]
+
+    scale = 1000 / args.points
+    print(f"{args.points:,} points, {args.runs} runs; ms per 1,000 points")
+    baseline = time_ms(wkt_dicts, args.runs) * scale
+    print(f"{'decoder':>18} {'ms':>8} {'speedup':>8}")
+    for name, function in (
+        ("wkt", wkt_dicts),
+        ("wkb", wkb_tuples),
+        ("wkb batch", wkb_batch),
+        ("wkt + Coordinate", wkt_models),
+        ("wkb + Coordinate", wkb_models),
+    ):
+        elapsed = baseline if function is wkt_dicts else time_ms(function, args.runs) * scale
+        print(f"{name:>18} {elapsed:>8.3f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+VEP MVP Backend - JSON Response Benchmark
+
+Measures the cost of turning 1,000 voters into a response body for the
+two large read endpoints, with and without FAST_JSON_RESPONSES:
+
+    python -m benchmarks.json_responses --voters 1000 --runs 50
+
+"default" is the path taken with the setting off: one SQLModel instance
+per row, then FastAPI's response validation and pydantic-core dump
+(reproduced here with a TypeAdapter, as FastAPI does). "fast" is plain
+rows encoded by FastJSONResponse. No database or HTTP is involved.
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from app.models.assignment import AssignmentPacketVoter
+from app.models.voter import Coordinate, Voter, VoterPage, VoterRead
+from app.responses import FastJSONResponse, model_rows
+
+
+def make_voters(count: int) -> list[Voter]:
+    """ORM voters as list_voters loads them by default."""
+    now = datetime.now(timezone.utc)
+    return [
+        Voter(
+            id=uuid4(), voter_id=f"TX{10000000 + i}", first_name=f"Voter{i}",
+            last_name=f"Test{i}", address=f"{100 + i} Main St", city="Austin",
+            state="TX", zip="78701", party_affiliation="D", support_level=1 + i % 5,
+            phone="5125550100", email=None,
+            location=Coordinate(latitude=30 + i / 10000, longitude=-97.7431),
+            created_at=now, updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_assignment_rows(count: int) -> list[dict]:
+    """Assignment voter rows as read_assignment_voter_rows returns them."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid4(), "voter_id": f"TX{10000000 + i}", "first_name": f"Voter{i}",
+            "last_name": f"Test{i}", "address": f"{100 + i} Main St", "city": "Austin",
+            "zip": "78701", "party_affiliation": "D", "support_level": 1 + i % 5,
+            "sequence_order": i + 1,
+            "location": Coordinate(latitude=30 + i / 10000, longitude=-97.7431),
+            "last_contact": {"date": now, "type": "knocked", "result": None} if i % 2 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def time_ms(function, runs: int) -> float:
+    """Mean milliseconds per call, after one warm-up call."""
+    function()
+    started = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JSON response encoding")
+    parser.add_argument("--voters", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    voters = make_voters(args.voters)
+    # Plain rows as list_voters selects them on the fast path
+    voter_rows = [
+        SimpleNamespace(**{name: getattr(voter, name) for name in VoterRead.model_fields})
+        for voter in voters
+    ]
+    rows = make_assignment_rows(args.voters)
+    page_adapter = TypeAdapter(VoterPage)
+    assignment_adapter = TypeAdapter(list[AssignmentPacketVoter])
+
+    def page_default():
+        page = VoterPage(
+            voters=[VoterRead(**voter.model_dump()) for voter in voters], limit=args.voters
+        )
+        page_adapter.dump_json(page_adapter.validate_python(page, from_attributes=True))
+
+    def page_fast():
+        FastJSONResponse({
+            "voters": model_rows(VoterRead, voter_rows), "limit": args.voters, "next_cursor": None
+        })
+
+    def assignment_default():
+        typed = [AssignmentPacketVoter(**row) for row in rows]
+        assignment_adapter.dump_json(
+            assignment_adapter.validate_python(typed, from_attributes=True)
+        )
+
+    def assignment_fast():
+        FastJSONResponse(rows)
+
+    scale = 1000 / args.voters
+    print(f"{args.voters:,} voters, {args.runs} runs; ms per 1,000 voters")
+    print(f"{'endpoint':>16} {'default':>9} {'fast':>9} {'speedup':>8}")
+    for name, default, fast in (
+        ("list_voters", page_default, page_fast),
+        ("get_assignment", assignment_default, assignment_fast),
+    ):
+        before = time_ms(default, args.runs) * scale
+        after = time_ms(fast, args.runs) * scale
+        print(f"{name:>16} {before:>9.2f} {after:>9.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+VEP MVP Backend - Password Hashing Benchmark
+
+Picks a BCRYPT_ROUNDS value for this machine and shows what hashing does
+to the event loop:
+
+    python -m benchmarks.password_hashing --rounds 10 11 12 13 --signups 20
+
+Part one times a single hash at each cost factor; pick the highest one
+whose login latency is acceptable.
+
+Part two runs a burst of concurrent signups at BCRYPT_ROUNDS next to a
+ticker that should wake every 10 ms. It reports the ticker's worst delay,
+which is how long any other request on the worker would have stalled.
+Signups are hashed two ways: inline, as the handlers used to do, and on
+the PasswordHasher pool.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.config import settings
+from app.passwords import PasswordHasher, hash_password_sync
+
+TICK_SECONDS = 0.01
+
+
+def time_rounds(rounds: int, samples: int) -> float:
+    """Median milliseconds per hash at a cost factor."""
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hash_password_sync("correct horse battery staple", rounds)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+async def worst_loop_delay(burst) -> tuple[float, float]:
+    """Run `burst()` beside a 10 ms ticker; return (elapsed s, worst tick delay ms)."""
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        while not done:
+            started = time.perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            worst = max(worst, time.perf_counter() - started - TICK_SECONDS)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await burst()
+    elapsed = time.perf_counter() - started
+    done = True
+    await task
+    return elapsed, worst * 1000
+
+
+async def compare_burst(signups: int, workers: int) -> None:
+    """Hash a signup burst inline, then on the pool, beside the ticker."""
+    rounds = settings.BCRYPT_ROUNDS
+
+    async def inline():
+        async def signup():
+            hash_password_sync("correct horse battery staple", rounds)
+
+        await asyncio.gather(*(signup() for _ in range(signups)))
+
+    hasher = PasswordHasher(workers=workers, max_queue=signups, rounds=rounds)
+
+    async def pooled():
+        await asyncio.gather(
+            *(hasher.hash("correct horse battery staple") for _ in range(signups))
+        )
+
+    print(f"\n{signups} concurrent signups at {rounds} rounds, {workers} hashing threads")
+    print(f"{'mode':>8} {'total s':>9} {'worst stall ms':>15}")
+    for name, burst in (("inline", inline), ("pool", pooled)):
+        elapsed, stall = await worst_loop_delay(burst)
+        print(f"{name:>8} {elapsed:>9.2f} {stall:>15.1f}")
+    print(f"pool metrics: {hasher.snapshot()}")
+    hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bcrypt cost factors")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--signups", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    args = parser.parse_args()
+
+    print(f"{'rounds':>6} {'ms/hash':>9}")
+    for rounds in args.rounds:
+        print(f"{rounds:>6} {time_rounds(rounds, args.samples):>9.1f}")
+
+    asyncio.run(compare_burst(args.signups, args.workers))
+
+
+if __name__ == "__main__":
+    main()
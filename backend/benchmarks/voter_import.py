@@ -0,0 +1,96 @@
+"""
+VEP MVP Backend - Voter Import Benchmark
+
+Measures validation throughput of the sharded voter import across worker
+counts, without a database (shards are validated and discarded):
+
+    python -m benchmarks.voter_import --rows 1000000 --workers 1 2 4 8
+
+Scaling is near-linear up to the number of physical cores, since workers
+share nothing but the (page-cached) input file. Worker counts are capped
+at the core count exactly as in the importer, and a single worker
+validates in a thread rather than a process pool, so each row shows both
+the requested and the used worker count alongside the machine's cores.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from app.config import settings
+from app.voter_import import (
+    import_worker_count,
+    iter_chunks,
+    prepare_in_processes,
+    prepare_in_thread,
+    read_header,
+    read_voter_rows,
+)
+
+HEADER = (
+    "Voter File VANID,FirstName,LastName,Address,City,State,Zip5,"
+    "Party,Cell Phone,Latitude,Longitude\n"
+)
+
+
+def write_voter_file(path: str, rows: int) -> None:
+    """Write a synthetic VAN-style voter file with `rows` valid rows."""
+    with open(path, "w", newline="") as target:
+        target.write(HEADER)
+        for i in range(rows):
+            target.write(
+                f"TX{10000000 + i},Voter{i},Test{i},{100 + i} Main St,Austin,tx,"
+                f"78701-{i % 10000:04d},D,(512) 555-{i % 10000:04d},"
+                f"{30 + i % 1000 / 10000:.4f},-97.7431\n"
+            )
+
+
+async def validate_file(path: str, workers: int, shard_bytes: int) -> int:
+    """Validate a file the way import_voter_path would; returns the rows read."""
+    column_map, data_start = read_header(path)
+    rows = 0
+    if workers <= 1:
+        with open(path, newline="", encoding="utf-8-sig") as source:
+            chunks = iter_chunks(read_voter_rows(source), settings.VOTER_IMPORT_CHUNK_SIZE)
+            async for prepared in prepare_in_thread(chunks):
+                rows += prepared.rows_read
+        return rows
+    chunks = prepare_in_processes(path, column_map, data_start, workers, shard_bytes)
+    async for prepared in chunks:
+        rows += prepared.rows_read
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sharded voter file validation")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--shard-bytes", type=int, default=settings.VOTER_IMPORT_SHARD_BYTES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "voters.csv")
+        write_voter_file(path, args.rows)
+        size = os.path.getsize(path) / 2**20
+        print(f"{args.rows:,} rows, {size:,.0f} MiB, CPU cores: {os.cpu_count() or 1}")
+        print(
+            f"{'requested':>9} {'used':>5} {'seconds':>9} {'rows/s':>11} {'speedup':>8}"
+        )
+
+        baseline = None
+        for requested in args.workers:
+            workers = import_worker_count(requested)
+            started = time.perf_counter()
+            rows = asyncio.run(validate_file(path, workers, args.shard_bytes))
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(
+                f"{requested:>9} {workers:>5} {elapsed:>9.2f} {rows / elapsed:>11,.0f} "
+                f"{baseline / elapsed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Assignment Progress Counters
+-- =============================================================================
+-- Version: 1.1
+-- Created: 2026-10-17
+-- Description: Denormalized voter_count / completed_count columns on
+--              assignments, maintained transactionally by triggers on
+--              assignment_voters and contact_logs, plus a reconcile function
+-- =============================================================================
+
+-- =============================================================================
+-- COLUMNS: assignments.voter_count, assignments.completed_count
+-- =============================================================================
+-- voter_count:     number of assignment_voters rows for the assignment
+-- completed_count: number of distinct voters with at least one contact log
+--                  recorded against the assignment
+-- =============================================================================
+
+ALTER TABLE assignments
+    ADD COLUMN voter_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN completed_count INTEGER NOT NULL DEFAULT 0;
+
+-- =============================================================================
+-- TABLE: assignment_voter_contacts
+-- =============================================================================
+-- One row per (assignment, voter) pair that has been contacted, holding the
+-- number of contact logs for that pair. Inserting a pair's first log creates
+-- the row; deleting its last log removes it. The row lock taken by the upsert
+-- serializes concurrent first contacts, so completed_count never double counts.
+-- =============================================================================
+
+CREATE TABLE assignment_voter_contacts (
+    assignment_id UUID NOT NULL REFERENCES assignments(id) ON DELETE CASCADE,
+    voter_id UUID NOT NULL REFERENCES voters(id) ON DELETE CASCADE,
+    contact_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (assignment_id, voter_id)
+);
+
+ALTER TABLE assignment_voter_contacts ENABLE ROW LEVEL SECURITY;
+
+-- =============================================================================
+-- DATABASE FUNCTIONS
+-- =============================================================================
+-- All counter triggers are statement-level with transition tables, so a
+-- multi-row insert or delete touches each affected assignment row once.
+-- SECURITY DEFINER lets counters be maintained regardless of the RLS
+-- policies applying to the role that wrote the contact log.
+-- =============================================================================
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: assignment_voters_count_insert()
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION assignment_voters_count_insert()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE assignments a
+    SET voter_count = a.voter_count + d.n
+    FROM (
+        SELECT assignment_id, COUNT(*) AS n
+        FROM inserted_rows
+        GROUP BY assignment_id
+    ) d
+    WHERE a.id = d.assignment_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_assignment_voters_count_insert
+    AFTER INSERT ON assignment_voters
+    REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION assignment_voters_count_insert();
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: assignment_voters_count_delete()
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION assignment_voters_count_delete()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE assignments a
+    SET voter_count = GREATEST(a.voter_count - d.n, 0)
+    FROM (
+        SELECT assignment_id, COUNT(*) AS n
+        FROM deleted_rows
+        GROUP BY assignment_id
+    ) d
+    WHERE a.id = d.assignment_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_assignment_voters_count_delete
+    AFTER DELETE ON assignment_voters
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION assignment_voters_count_delete();
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: contact_logs_count_insert()
+-- -----------------------------------------------------------------------------
+-- Upserts the per-pair contact count; pairs that were newly inserted
+-- (xmax = 0) are first contacts and increment completed_count.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION contact_logs_count_insert()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    WITH first_contacts AS (
+        INSERT INTO assignment_voter_contacts AS c (assignment_id, voter_id, contact_count)
+        SELECT assignment_id, voter_id, COUNT(*)
+        FROM inserted_rows
+        GROUP BY assignment_id, voter_id
+        ON CONFLICT (assignment_id, voter_id)
+        DO UPDATE SET contact_count = c.contact_count + EXCLUDED.contact_count
+        RETURNING c.assignment_id, (c.xmax = 0) AS is_first
+    )
+    UPDATE assignments a
+    SET completed_count = a.completed_count + f.n
+    FROM (
+        SELECT assignment_id, COUNT(*) AS n
+        FROM first_contacts
+        WHERE is_first
+        GROUP BY assignment_id
+    ) f
+    WHERE a.id = f.assignment_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_contact_logs_count_insert
+    AFTER INSERT ON contact_logs
+    REFERENCING NEW TABLE AS inserted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION contact_logs_count_insert();
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: contact_logs_count_delete()
+-- -----------------------------------------------------------------------------
+-- Decrements the per-pair contact count; pairs whose last log was removed
+-- are deleted and decrement completed_count.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION contact_logs_count_delete()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE assignment_voter_contacts c
+    SET contact_count = c.contact_count - d.n
+    FROM (
+        SELECT assignment_id, voter_id, COUNT(*) AS n
+        FROM deleted_rows
+        GROUP BY assignment_id, voter_id
+    ) d
+    WHERE c.assignment_id = d.assignment_id
+      AND c.voter_id = d.voter_id;
+
+    WITH uncontacted AS (
+        DELETE FROM assignment_voter_contacts c
+        USING (SELECT DISTINCT assignment_id, voter_id FROM deleted_rows) d
+        WHERE c.assignment_id = d.assignment_id
+          AND c.voter_id = d.voter_id
+          AND c.contact_count <= 0
+        RETURNING c.assignment_id
+    )
+    UPDATE assignments a
+    SET completed_count = GREATEST(a.completed_count - u.n, 0)
+    FROM (
+        SELECT assignment_id, COUNT(*) AS n
+        FROM uncontacted
+        GROUP BY assignment_id
+    ) u
+    WHERE a.id = u.assignment_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_contact_logs_count_delete
+    AFTER DELETE ON contact_logs
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION contact_logs_count_delete();
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: reconcile_assignment_counters()
+-- -----------------------------------------------------------------------------
+-- Rebuilds assignment_voter_contacts from contact_logs and corrects any
+-- assignment whose counters have drifted. Blocks writes to the source
+-- tables for the duration of the calling transaction.
+-- Returns the number of assignments whose counters were corrected.
+-- Run via: python -m app.cli reconcile-counters
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION reconcile_assignment_counters()
+RETURNS INTEGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    corrected INTEGER;
+BEGIN
+    LOCK TABLE assignment_voters, contact_logs IN SHARE MODE;
+
+    DELETE FROM assignment_voter_contacts;
+    INSERT INTO assignment_voter_contacts (assignment_id, voter_id, contact_count)
+    SELECT assignment_id, voter_id, COUNT(*)
+    FROM contact_logs
+    GROUP BY assignment_id, voter_id;
+
+    UPDATE assignments a
+    SET voter_count = actual.voter_count,
+        completed_count = actual.completed_count
+    FROM (
+        SELECT
+            a2.id,
+            COALESCE(v.n, 0) AS voter_count,
+            COALESCE(c.n, 0) AS completed_count
+        FROM assignments a2
+        LEFT JOIN (
+            SELECT assignment_id, COUNT(*) AS n
+            FROM assignment_voters
+            GROUP BY assignment_id
+        ) v ON v.assignment_id = a2.id
+        LEFT JOIN (
+            SELECT assignment_id, COUNT(*) AS n
+            FROM assignment_voter_contacts
+            GROUP BY assignment_id
+        ) c ON c.assignment_id = a2.id
+    ) actual
+    WHERE a.id = actual.id
+      AND (a.voter_count, a.completed_count)
+          IS DISTINCT FROM (actual.voter_count, actual.completed_count);
+
+    GET DIAGNOSTICS corrected = ROW_COUNT;
+    RETURN corrected;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =============================================================================
+-- BACKFILL
+-- =============================================================================
+
+SELECT reconcile_assignment_counters();
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
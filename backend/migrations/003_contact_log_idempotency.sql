@@ -0,0 +1,27 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Contact Log Idempotency Keys
+-- =============================================================================
+-- Version: 1.2
+-- Created: 2026-10-17
+-- Description: Client-generated idempotency keys on contact_logs so mobile
+--              retries and parallel uploads never create duplicate rows
+-- =============================================================================
+
+-- =============================================================================
+-- COLUMN: contact_logs.idempotency_key
+-- =============================================================================
+-- UUID generated on-device when the contact is recorded and sent with every
+-- upload attempt. Unique per user, so a retry resolves to the original row
+-- and one user's key can never collide with (or reveal) another user's log.
+-- Logs created without a key (e.g. by older clients) are not deduplicated.
+-- =============================================================================
+
+ALTER TABLE contact_logs ADD COLUMN idempotency_key UUID;
+
+CREATE UNIQUE INDEX idx_contact_logs_idempotency_key
+    ON contact_logs(user_id, idempotency_key)
+    WHERE idempotency_key IS NOT NULL;
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
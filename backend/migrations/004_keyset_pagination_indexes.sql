@@ -0,0 +1,46 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Keyset Pagination Indexes
+-- =============================================================================
+-- Version: 1.3
+-- Created: 2026-10-17
+-- Description: Composite indexes matching the sort keys of the cursor-paginated
+--              voter and contact log lists, so each page is a single index seek
+-- =============================================================================
+
+-- =============================================================================
+-- VOTERS: ORDER BY last_name, first_name, id
+-- =============================================================================
+-- The ZIP-filtered variant leads with zip; it also serves plain ZIP lookups,
+-- which makes the single-column idx_voters_zip redundant.
+-- =============================================================================
+
+CREATE INDEX idx_voters_name_keyset ON voters(last_name, first_name, id);
+CREATE INDEX idx_voters_zip_name_keyset ON voters(zip, last_name, first_name, id);
+
+DROP INDEX IF EXISTS idx_voters_zip;
+
+-- =============================================================================
+-- CONTACT_LOGS: ORDER BY contacted_at DESC, id DESC
+-- =============================================================================
+-- Canvassers only see their own logs and the list can be filtered by
+-- assignment, so both filters get a variant leading with the filter column.
+-- Those also serve the plain user_id / assignment_id lookups, replacing the
+-- single-column indexes from the initial schema.
+-- =============================================================================
+
+-- Keyset comparison needs a total order; contacted_at has always defaulted
+-- to NOW(), so any NULL is a row written before that default applied.
+UPDATE contact_logs SET contacted_at = COALESCE(created_at, NOW()) WHERE contacted_at IS NULL;
+ALTER TABLE contact_logs ALTER COLUMN contacted_at SET NOT NULL;
+
+CREATE INDEX idx_contact_logs_keyset ON contact_logs(contacted_at DESC, id DESC);
+CREATE INDEX idx_contact_logs_user_keyset ON contact_logs(user_id, contacted_at DESC, id DESC);
+CREATE INDEX idx_contact_logs_assignment_keyset ON contact_logs(assignment_id, contacted_at DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_contact_logs_contacted_at;
+DROP INDEX IF EXISTS idx_contact_logs_user;
+DROP INDEX IF EXISTS idx_contact_logs_assignment;
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
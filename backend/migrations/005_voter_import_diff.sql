@@ -0,0 +1,45 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Incremental Voter Imports
+-- =============================================================================
+-- Version: 1.4
+-- Created: 2026-10-17
+-- Description: Per-voter content hash so re-imports only write changed rows,
+--              and soft deletion for voters dropped from the voter file
+-- =============================================================================
+
+-- =============================================================================
+-- COLUMNS: voters.content_hash, voters.deleted_at
+-- =============================================================================
+-- content_hash: BLAKE2b digest of the normalized voter file record, written
+--               by the importer. Rows whose incoming hash matches are skipped.
+--               Existing voters start NULL, so the first import after this
+--               migration rewrites them once.
+-- deleted_at:   Set when `import-voters --delete-missing` finds the voter
+--               absent from a complete file; cleared if the voter reappears.
+--               Soft-deleted voters keep their assignments and contact history.
+-- =============================================================================
+
+ALTER TABLE voters
+    ADD COLUMN content_hash BYTEA,
+    ADD COLUMN deleted_at TIMESTAMPTZ;
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+-- Voter lists only show live voters, so the keyset indexes from 004 become
+-- partial indexes over live rows.
+-- =============================================================================
+
+CREATE INDEX idx_voters_live_name_keyset
+    ON voters(last_name, first_name, id)
+    WHERE deleted_at IS NULL;
+CREATE INDEX idx_voters_live_zip_name_keyset
+    ON voters(zip, last_name, first_name, id)
+    WHERE deleted_at IS NULL;
+
+DROP INDEX IF EXISTS idx_voters_name_keyset;
+DROP INDEX IF EXISTS idx_voters_zip_name_keyset;
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
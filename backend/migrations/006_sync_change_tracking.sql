@@ -0,0 +1,175 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Delta Sync Change Tracking
+-- =============================================================================
+-- Version: 1.5
+-- Created: 2026-10-17
+-- Description: Per-row change transaction IDs and delete tombstones, so
+--              GET /sync/changes can return only what changed since a
+--              client's last sync. Requires PostgreSQL 13+ (xid8).
+-- =============================================================================
+
+-- =============================================================================
+-- COLUMNS: change_xid, assignments.assigned_xid
+-- =============================================================================
+-- change_xid:   ID of the transaction that last inserted or updated the row.
+--               Unlike updated_at, transaction IDs can be compared against a
+--               snapshot, so rows committed late by a long transaction are
+--               never skipped (see app/routes/sync.py).
+-- assigned_xid: ID of the transaction that gave the assignment its current
+--               owner. The new owner needs the assignment's voters and logs
+--               even though those rows themselves did not change.
+-- Existing rows get this migration's transaction ID.
+-- =============================================================================
+
+ALTER TABLE assignments
+    ADD COLUMN change_xid xid8 NOT NULL DEFAULT pg_current_xact_id(),
+    ADD COLUMN assigned_xid xid8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE assignment_voters ADD COLUMN change_xid xid8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE voters ADD COLUMN change_xid xid8 NOT NULL DEFAULT pg_current_xact_id();
+ALTER TABLE contact_logs ADD COLUMN change_xid xid8 NOT NULL DEFAULT pg_current_xact_id();
+
+CREATE INDEX idx_contact_logs_assignment_change ON contact_logs(assignment_id, change_xid);
+
+-- =============================================================================
+-- TABLE: sync_tombstones
+-- =============================================================================
+-- One row per deleted assignment, assignment_voter or contact_log, scoped
+-- like the live row was: assignments by owner (user_id), the others by
+-- assignment_id. Voters are soft-deleted (deleted_at) and sync as updates.
+-- Rows older than SYNC_TOMBSTONE_RETENTION_DAYS are removed by
+-- `python -m app.cli prune-sync-tombstones`; clients whose cursor is older
+-- than that get a full resync instead.
+-- =============================================================================
+
+CREATE TABLE sync_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    entity TEXT NOT NULL CHECK (entity IN ('assignment', 'assignment_voter', 'contact_log')),
+    entity_id UUID NOT NULL,
+    user_id UUID,
+    assignment_id UUID,
+    change_xid xid8 NOT NULL DEFAULT pg_current_xact_id(),
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_sync_tombstones_user ON sync_tombstones(user_id, change_xid)
+    WHERE user_id IS NOT NULL;
+CREATE INDEX idx_sync_tombstones_assignment ON sync_tombstones(assignment_id, change_xid)
+    WHERE assignment_id IS NOT NULL;
+CREATE INDEX idx_sync_tombstones_deleted_at ON sync_tombstones(deleted_at);
+
+ALTER TABLE sync_tombstones ENABLE ROW LEVEL SECURITY;
+
+-- =============================================================================
+-- DATABASE FUNCTIONS
+-- =============================================================================
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: sync_touch_row()
+-- -----------------------------------------------------------------------------
+-- Stamps updated rows with the current transaction ID. Also fires for the
+-- counter updates from 002, so an assignment's progress syncs too.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION sync_touch_row()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.change_xid := pg_current_xact_id();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_voters_sync_touch
+    BEFORE UPDATE ON voters
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_touch_row();
+
+CREATE TRIGGER trigger_assignment_voters_sync_touch
+    BEFORE UPDATE ON assignment_voters
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_touch_row();
+
+CREATE TRIGGER trigger_contact_logs_sync_touch
+    BEFORE UPDATE ON contact_logs
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_touch_row();
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: sync_touch_assignment()
+-- -----------------------------------------------------------------------------
+-- As sync_touch_row(), and on reassignment also records the new owner's
+-- assigned_xid and a tombstone for the previous owner.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION sync_touch_assignment()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    NEW.change_xid := pg_current_xact_id();
+    IF NEW.user_id IS DISTINCT FROM OLD.user_id THEN
+        NEW.assigned_xid := NEW.change_xid;
+        INSERT INTO sync_tombstones (entity, entity_id, user_id)
+        VALUES ('assignment', OLD.id, OLD.user_id);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_assignments_sync_touch
+    BEFORE UPDATE ON assignments
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_touch_assignment();
+
+-- -----------------------------------------------------------------------------
+-- FUNCTIONS: sync_tombstone_*()
+-- -----------------------------------------------------------------------------
+-- Statement-level with transition tables, like the counter triggers, so
+-- cascaded deletes of a whole assignment write tombstones in one INSERT.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION sync_tombstone_assignments()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    INSERT INTO sync_tombstones (entity, entity_id, user_id)
+    SELECT 'assignment', id, user_id FROM deleted_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_assignments_sync_tombstone
+    AFTER DELETE ON assignments
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_tombstone_assignments();
+
+CREATE OR REPLACE FUNCTION sync_tombstone_assignment_children()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    INSERT INTO sync_tombstones (entity, entity_id, assignment_id)
+    SELECT TG_ARGV[0], id, assignment_id FROM deleted_rows;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_assignment_voters_sync_tombstone
+    AFTER DELETE ON assignment_voters
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_tombstone_assignment_children('assignment_voter');
+
+CREATE TRIGGER trigger_contact_logs_sync_tombstone
+    AFTER DELETE ON contact_logs
+    REFERENCING OLD TABLE AS deleted_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION sync_tombstone_assignment_children('contact_log');
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
@@ -0,0 +1,27 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Assignment Last Contact Index
+-- =============================================================================
+-- Version: 1.6
+-- Created: 2026-10-17
+-- Description: Index serving "latest contact per voter on an assignment"
+--              for the assignment detail and offline packet reads
+-- =============================================================================
+
+-- =============================================================================
+-- CONTACT_LOGS: (assignment_id, voter_id, contacted_at DESC)
+-- =============================================================================
+-- The assignment voter query joins each assignment_voters row LATERAL to
+-- its newest contact log (ORDER BY contacted_at DESC LIMIT 1). With this
+-- index every probe reads one index entry; with only the
+-- (assignment_id, contacted_at DESC, id DESC) keyset index, each probe walked
+-- the assignment's whole log history looking for the voter. The selected
+-- columns are included so the probe can be answered from the index alone.
+-- =============================================================================
+
+CREATE INDEX idx_contact_logs_assignment_voter_recent
+    ON contact_logs(assignment_id, voter_id, contacted_at DESC)
+    INCLUDE (contact_type, result);
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
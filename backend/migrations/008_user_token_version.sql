@@ -0,0 +1,25 @@
+-- =============================================================================
+-- VEP MVP Database Schema - User Token Version
+-- =============================================================================
+-- Version: 1.7
+-- Created: 2026-10-17
+-- Description: Per-user counter signed into JWTs for stateless authorization
+-- =============================================================================
+
+-- =============================================================================
+-- USERS: token_version
+-- =============================================================================
+-- With STATELESS_AUTH, access tokens carry the user's role and are trusted
+-- without reading this table. The API bumps token_version when a user's
+-- role changes; /auth/refresh refuses refresh tokens signed with an older
+-- version, so the old role lasts at most one access token lifetime.
+-- Existing rows start at 0, which is also what tokens issued before this
+-- migration are treated as carrying.
+-- =============================================================================
+
+ALTER TABLE users
+    ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0;
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
@@ -0,0 +1,146 @@
+-- =============================================================================
+-- VEP MVP Database Schema - Assignment Packet Version
+-- =============================================================================
+-- Version: 1.8
+-- Created: 2026-10-17
+-- Description: Trigger-maintained packet_version on assignments, so the
+--              offline packet ETag check is a single primary key lookup
+-- =============================================================================
+
+-- =============================================================================
+-- COLUMN: assignments.packet_version
+-- =============================================================================
+-- Drawn from a sequence and replaced whenever anything in the assignment's
+-- offline packet changes: the assignment row itself, its memberships
+-- (including walking order), its voters and its contact logs. Deletes of
+-- memberships and logs, which write the sync tombstones from 006, bump it
+-- through the same triggers. Sequence values are never reused, so a commit
+-- always moves an assignment to a version no client can already hold,
+-- whatever order concurrent transactions commit in.
+-- Existing rows each get a fresh value.
+-- =============================================================================
+
+CREATE SEQUENCE assignment_packet_version_seq;
+
+ALTER TABLE assignments
+    ADD COLUMN packet_version BIGINT NOT NULL DEFAULT nextval('assignment_packet_version_seq');
+
+ALTER SEQUENCE assignment_packet_version_seq OWNED BY assignments.packet_version;
+
+-- =============================================================================
+-- DATABASE FUNCTIONS
+-- =============================================================================
+
+-- -----------------------------------------------------------------------------
+-- FUNCTION: sync_touch_assignment()
+-- -----------------------------------------------------------------------------
+-- Replaces the 006 version. Direct updates, including the counter updates
+-- from 002, also take a new packet version. Updates that only bump the
+-- packet version (from the triggers below) leave change_xid alone: the
+-- voters, memberships and logs that changed sync on their own.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION sync_touch_assignment()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF NEW.packet_version IS DISTINCT FROM OLD.packet_version THEN
+        RETURN NEW;
+    END IF;
+    NEW.change_xid := pg_current_xact_id();
+    NEW.packet_version := nextval('assignment_packet_version_seq');
+    IF NEW.user_id IS DISTINCT FROM OLD.user_id THEN
+        NEW.assigned_xid := NEW.change_xid;
+        INSERT INTO sync_tombstones (entity, entity_id, user_id)
+        VALUES ('assignment', OLD.id, OLD.user_id);
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- -----------------------------------------------------------------------------
+-- FUNCTIONS: packet_bump_*()
+-- -----------------------------------------------------------------------------
+-- Statement-level with transition tables, like the counter triggers, so a
+-- multi-row write touches each affected assignment row once. Transition
+-- tables allow one event per trigger, hence a trigger per event.
+-- -----------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION packet_bump_assignments()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE assignments a
+    SET packet_version = nextval('assignment_packet_version_seq')
+    WHERE a.id IN (SELECT assignment_id FROM changed_rows);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_assignment_voters_packet_insert
+    AFTER INSERT ON assignment_voters
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_assignments();
+
+CREATE TRIGGER trigger_assignment_voters_packet_update
+    AFTER UPDATE ON assignment_voters
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_assignments();
+
+CREATE TRIGGER trigger_assignment_voters_packet_delete
+    AFTER DELETE ON assignment_voters
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_assignments();
+
+CREATE TRIGGER trigger_contact_logs_packet_insert
+    AFTER INSERT ON contact_logs
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_assignments();
+
+CREATE TRIGGER trigger_contact_logs_packet_update
+    AFTER UPDATE ON contact_logs
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_assignments();
+
+CREATE TRIGGER trigger_contact_logs_packet_delete
+    AFTER DELETE ON contact_logs
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_assignments();
+
+-- Voters belong to assignments through assignment_voters
+CREATE OR REPLACE FUNCTION packet_bump_voter_assignments()
+RETURNS TRIGGER
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    UPDATE assignments a
+    SET packet_version = nextval('assignment_packet_version_seq')
+    WHERE a.id IN (
+        SELECT av.assignment_id
+        FROM assignment_voters av
+        JOIN changed_rows v ON v.id = av.voter_id
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_voters_packet_update
+    AFTER UPDATE ON voters
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION packet_bump_voter_assignments();
+
+-- =============================================================================
+-- MIGRATION COMPLETE
+-- =============================================================================
@@ -20,7 +20,7 @@ from sqlalchemy.pool import StaticPool
 # TODO: Import actual models when Agent 2 completes implementation
 # from app.main import app
 # from app.models import User, Voter, Assignment, AssignmentVoter, ContactLog
-# from app.dependencies import get_db
+# from app.dependencies import get_async_db
 # from app.config import settings
 
 
@@ -94,13 +94,13 @@ def db_session(db_engine) -> Generator[Session, None, None]:
 def client(db_session) -> Generator[TestClient, None, None]:
     """Create FastAPI test client."""
     # TODO: Import app when Agent 2 completes implementation
-    # def override_get_db():
+    # async def override_get_async_db():
     #     try:
     #         yield db_session
     #     finally:
     #         pass
     # 
-    # app.dependency_overrides[get_db] = override_get_db
+    # app.dependency_overrides[get_async_db] = override_get_async_db
     # 
     # with TestClient(app) as test_client:
     #     yield test_client
@@ -341,6 +341,80 @@ def create_test_voter(db_session, **kwargs):
     return voter_data
 
 
+class RecordingResult:
+    """Result stand-in returned by RecordingSession."""
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def all(self):
+        return list(self._rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+
+class RecordingStreamResult:
+    """Streaming result stand-in yielding canned rows in fixed-size partitions."""
+
+    def __init__(self, rows, size):
+        self._rows = list(rows)
+        self._size = size
+
+    async def partitions(self):
+        for start in range(0, len(self._rows), self._size):
+            yield self._rows[start:start + self._size]
+
+
+class RecordingSession:
+    """
+    Async session stand-in that records every executed statement.
+    
+    Each call to exec() or stream() pops the next canned row list from
+    `results` (or returns no rows once exhausted). A canned entry may also
+    be a callable taking (statement, params) and returning the rows. Used
+    by query-count regression tests that call route functions directly.
+    """
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.added = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def _next_rows(self, statement, params):
+        self.statements.append((statement, params))
+        rows = self.results.pop(0) if self.results else []
+        if callable(rows):
+            rows = rows(statement, params)
+        return rows
+
+    async def exec(self, statement, params=None):
+        return RecordingResult(self._next_rows(statement, params))
+
+    async def stream(self, statement, params=None):
+        size = statement.get_execution_options().get("yield_per", 1000)
+        return RecordingStreamResult(self._next_rows(statement, params), size)
+
+    async def rollback(self):
+        pass
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def refresh(self, instance):
+        pass
+
+
 # =============================================================================
 # PostgreSQL Integration Test Fixtures
 # =============================================================================
@@ -383,6 +457,31 @@ def postgres_session(postgres_engine) -> Generator[Session, None, None]:
         session.close()
 
 
+@pytest.fixture(scope="function")
+def large_assignment(postgres_engine):
+    """
+    A 1,000-voter assignment with 20,000 contact logs, in a transaction
+    that is rolled back afterwards. Requires all migrations applied.
+    
+    Yields:
+        tuple: (connection, assignment ID)
+    """
+    from sqlalchemy.exc import OperationalError
+    from benchmarks.assignment_detail import seed_large_assignment
+    
+    try:
+        connection = postgres_engine.connect()
+    except OperationalError:
+        pytest.skip("PostgreSQL not reachable for integration tests")
+    
+    transaction = connection.begin()
+    try:
+        yield connection, seed_large_assignment(connection)
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
 # =============================================================================
 # Markers
 # =============================================================================
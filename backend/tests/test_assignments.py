@@ -553,3 +553,952 @@ class TestAssignmentIntegration:
             headers=auth_headers_canvasser,
         )
         assert final_response.json()["status"] == "completed"
+
+
+# =============================================================================
+# Query Count Regression Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestAssignmentQueryCount:
+    """Test that assignment listing costs a constant number of statements."""
+
+    @pytest.mark.parametrize("assignment_count", [1, 50, 800])
+    async def test_list_assignments_single_statement(self, assignment_count):
+        """Test that counts for every listed assignment come from one statement."""
+        from app.models.assignment import Assignment
+        from app.models.user import User
+        from app.routes.assignments import list_assignments
+        from tests.conftest import RecordingSession
+
+        manager = User(email="manager@test.com", full_name="Test Manager", role="manager")
+        rows = [
+            Assignment(name=f"Turf {i}", user_id=uuid4(), voter_count=40, completed_count=i % 40)
+            for i in range(assignment_count)
+        ]
+        db = RecordingSession(rows)
+
+        assignments = await list_assignments(
+            db=db,
+            current_user=manager,
+            status_filter=None,
+            user_id=None,
+            limit=1000,
+            offset=0,
+        )
+
+        assert len(assignments) == assignment_count
+        assert len(db.statements) == 1
+        assert assignments[-1].voter_count == 40
+        assert assignments[-1].completed_count == (assignment_count - 1) % 40
+
+    async def test_list_assignments_filters_applied(self):
+        """Test that filters reach the query and counts are read from columns."""
+        from sqlalchemy.dialects import postgresql
+        from app.models.user import User
+        from app.routes.assignments import list_assignments
+        from tests.conftest import RecordingSession
+
+        canvasser = User(email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([])
+
+        await list_assignments(
+            db=db,
+            current_user=canvasser,
+            status_filter="in_progress",
+            user_id=None,
+            limit=25,
+            offset=50,
+        )
+
+        statement, _ = db.statements[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "assignments.user_id = " in sql
+        assert "assignments.status = " in sql
+        assert "assignments.completed_count" in sql
+        assert "contact_logs" not in sql
+
+
+# =============================================================================
+# Offline Packet Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestAssignmentPacket:
+    """Test cached, compressed assignment packets."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        from app.packets import packet_cache
+
+        packet_cache.clear()
+        yield
+        packet_cache.clear()
+
+    @staticmethod
+    def packet_rows(user_id, version="100"):
+        """Canned results for the version, assignment and voter queries."""
+        from datetime import datetime
+        from types import SimpleNamespace
+        from app.models.assignment import Assignment
+        from app.models.voter import Coordinate
+
+        assignment = Assignment(name="Turf 12", user_id=user_id, voter_count=2)
+        voters = [
+            SimpleNamespace(_mapping={
+                "id": uuid4(), "voter_id": f"TX{i}", "first_name": "Ann", "last_name": "Lee",
+                "address": f"{i} Main St", "city": "Austin", "zip": "78701",
+                "party_affiliation": None, "support_level": 4, "sequence_order": i,
+                "location": Coordinate(latitude=30.26, longitude=-97.74),
+                "last_contacted_at": datetime(2026, 10, 1, 12) if i == 1 else None,
+                "last_contact_type": "knocked" if i == 1 else None,
+                "last_contact_result": "Supportive" if i == 1 else None,
+            })
+            for i in (1, 2)
+        ]
+        return [SimpleNamespace(user_id=user_id, version=version)], [assignment], voters
+
+    @staticmethod
+    async def fetch(db, user, assignment_id, if_none_match=None, accept_encoding="gzip"):
+        from app.routes.assignments import get_assignment_packet
+
+        return await get_assignment_packet(
+            assignment_id=assignment_id,
+            db=db,
+            current_user=user,
+            if_none_match=if_none_match,
+            accept_encoding=accept_encoding,
+        )
+
+    async def test_packet_built_once_then_served_from_cache(self):
+        """Test that an unchanged assignment costs one version query per refresh."""
+        import gzip
+        import json
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment_id = uuid4()
+        version_rows, assignment_rows, voter_rows = self.packet_rows(user.id)
+
+        first_db = RecordingSession(version_rows, assignment_rows, voter_rows)
+        first = await self.fetch(first_db, user, assignment_id)
+        second_db = RecordingSession(version_rows)
+        second = await self.fetch(second_db, user, assignment_id)
+
+        assert len(first_db.statements) == 3
+        assert len(second_db.statements) == 1
+        assert first.headers["content-encoding"] == "gzip"
+        assert second.body == first.body
+        packet = json.loads(gzip.decompress(first.body))
+        assert packet["etag"] == first.headers["etag"]
+        assert [voter["sequence_order"] for voter in packet["voters"]] == [1, 2]
+        assert packet["voters"][0]["last_contact"]["type"] == "knocked"
+        assert packet["voters"][1]["last_contact"] is None
+        assert packet["voters"][0]["location"] == {"latitude": 30.26, "longitude": -97.74}
+
+    async def test_changed_version_rebuilds_packet(self):
+        """Test that a new assignment version is never served the old packet."""
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment_id = uuid4()
+        old = self.packet_rows(user.id)
+        new = self.packet_rows(user.id, version="101")
+
+        first = await self.fetch(RecordingSession(*old), user, assignment_id)
+        db = RecordingSession(*new)
+        second = await self.fetch(db, user, assignment_id)
+
+        assert len(db.statements) == 3
+        assert second.headers["etag"] != first.headers["etag"]
+
+    async def test_matching_etag_not_modified(self):
+        """Test that a client holding the current ETag gets an empty 304."""
+        from app.models.user import User
+        from app.packets import packet_etag
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        version_rows, _, _ = self.packet_rows(user.id)
+        db = RecordingSession(version_rows)
+
+        response = await self.fetch(
+            db, user, uuid4(), if_none_match=f'W/{packet_etag("100")}'
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.body == b""
+        assert len(db.statements) == 1
+
+    async def test_packet_uncompressed_without_gzip(self):
+        """Test that clients not accepting gzip get plain JSON."""
+        import json
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+
+        response = await self.fetch(
+            RecordingSession(*self.packet_rows(user.id)), user, uuid4(), accept_encoding=""
+        )
+
+        assert "content-encoding" not in response.headers
+        assert len(json.loads(response.body)["voters"]) == 2
+
+    async def test_packet_access_checks(self):
+        """Test 404 for unknown assignments and 403 for other canvassers' turf."""
+        from fastapi import HTTPException
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        version_rows, _, _ = self.packet_rows(uuid4())
+
+        with pytest.raises(HTTPException) as missing:
+            await self.fetch(RecordingSession([]), user, uuid4())
+        with pytest.raises(HTTPException) as forbidden:
+            await self.fetch(RecordingSession(version_rows), user, uuid4())
+
+        assert missing.value.status_code == status.HTTP_404_NOT_FOUND
+        assert forbidden.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+# =============================================================================
+# Route Optimization Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestAssignmentRouteOptimization:
+    """Test POST /assignments/{id}/optimize against recorded statements."""
+
+    async def test_optimize_writes_sequence_in_one_statement(self):
+        """Test that the new order is saved with one set-based UPDATE."""
+        import struct
+        from app.models.assignment import Assignment, RouteOptimizeRequest
+        from app.models.user import User
+        from app.models.voter import Coordinate
+        from app.routes.assignments import UPDATE_SEQUENCE_QUERY, optimize_assignment_route
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment = Assignment(name="Turf 12", user_id=user.id)
+        far, near, unmapped, middle = uuid4(), uuid4(), uuid4(), uuid4()
+        doors = [
+            (far, struct.pack("<BIdd", 1, 1, -97.74, 30.2630)),
+            (near, struct.pack("<BIdd", 1, 1, -97.74, 30.2610)),
+            (unmapped, None),
+            (middle, struct.pack("<BIdd", 1, 1, -97.74, 30.2620)),
+        ]
+        db = RecordingSession([assignment], doors, [])
+
+        result = await optimize_assignment_route(
+            assignment_id=assignment.id,
+            db=db,
+            current_user=user,
+            request=RouteOptimizeRequest(start=Coordinate(latitude=30.2600, longitude=-97.74)),
+        )
+
+        assert result.voter_ids == [near, middle, far, unmapped]
+        assert (result.voter_count, result.routed_count) == (4, 3)
+        assert result.optimized_distance_meters < result.initial_distance_meters
+        statement, params = db.statements[-1]
+        assert statement is UPDATE_SEQUENCE_QUERY
+        assert params["sequence_orders"] == [1, 2, 3, 4]
+        assert len(db.statements) == 3
+        assert db.commits == 1
+
+    async def test_optimize_too_many_doors_rejected(self, monkeypatch):
+        """Test that an oversized assignment is refused before any distance matrix is built."""
+        import struct
+        from fastapi import HTTPException
+        from app.config import settings
+        from app.models.assignment import Assignment
+        from app.models.user import User
+        from app.routes import assignments
+        from tests.conftest import RecordingSession
+
+        monkeypatch.setattr(settings, "ROUTE_OPTIMIZE_MAX_DOORS", 2)
+        monkeypatch.setattr(
+            assignments, "optimize_route", lambda *args: pytest.fail("optimizer called")
+        )
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment = Assignment(name="Turf 12", user_id=user.id)
+        doors = [(uuid4(), struct.pack("<BIdd", 1, 1, -97.74, 30.26 + i / 1000)) for i in range(3)]
+        db = RecordingSession([assignment], doors)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await assignments.optimize_assignment_route(
+                assignment_id=assignment.id, db=db, current_user=user, request=None
+            )
+
+        assert exc_info.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert db.commits == 0
+
+    async def test_optimize_other_users_assignment_forbidden(self):
+        """Test that canvassers cannot reorder someone else's turf."""
+        from fastapi import HTTPException
+        from app.models.assignment import Assignment
+        from app.models.user import User
+        from app.routes.assignments import optimize_assignment_route
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([Assignment(name="Turf 9", user_id=uuid4())])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await optimize_assignment_route(
+                assignment_id=uuid4(), db=db, current_user=user, request=None
+            )
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        assert db.commits == 0
+
+
+# =============================================================================
+# Turf Cutting Unit Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestAssignmentTurfCutting:
+    """Test POST /assignments/turfs against recorded statements."""
+
+    @staticmethod
+    def make_manager():
+        from app.models.user import User
+
+        return User(id=uuid4(), email="manager@test.com", full_name="Test Manager", role="manager")
+
+    @staticmethod
+    def voter_rows(count):
+        import struct
+
+        # Locations arrive as ST_AsBinary WKB: (x, y) = (longitude, latitude)
+        return [
+            (uuid4(), struct.pack("<BIdd", 1, 1, -97.74 - i // 10 / 1000, 30.26 + i % 10 / 1000))
+            for i in range(count)
+        ]
+
+    async def test_turfs_created_with_two_inserts(self):
+        """Test that every turf and membership is written set-based in one commit."""
+        from app.models.assignment import TurfCutRequest
+        from app.routes.assignments import (
+            INSERT_ASSIGNMENT_VOTERS_QUERY,
+            INSERT_ASSIGNMENTS_QUERY,
+            cut_assignment_turfs,
+        )
+        from tests.conftest import RecordingSession
+
+        canvassers = [uuid4(), uuid4()]
+        voters = self.voter_rows(30)
+        db = RecordingSession(canvassers, voters, [], [])
+
+        result = await cut_assignment_turfs(
+            request=TurfCutRequest(zips=["78701"], doors_per_turf=8, user_ids=canvassers),
+            db=db,
+            current_user=self.make_manager(),
+        )
+
+        assert result.voter_count == 30
+        assert [a.name for a in result.assignments] == ["Turf 1", "Turf 2", "Turf 3", "Turf 4"]
+        assert sorted(a.voter_count for a in result.assignments) == [7, 7, 8, 8]
+        assert [a.user_id for a in result.assignments] == canvassers * 2
+        assert len(db.statements) == 4
+        assert db.commits == 1
+
+        (insert_assignments, assignment_params), (insert_voters, voter_params) = db.statements[2:]
+        assert insert_assignments is INSERT_ASSIGNMENTS_QUERY
+        assert assignment_params["ids"] == [a.id for a in result.assignments]
+        assert insert_voters is INSERT_ASSIGNMENT_VOTERS_QUERY
+        assert sorted(map(str, voter_params["voter_ids"])) == sorted(str(v[0]) for v in voters)
+        assert voter_params["sequence_orders"][:2] == [1, 2]
+
+    async def test_filters_applied(self):
+        """Test that filters and the active-assignment exclusion reach the query."""
+        from app.models.assignment import TurfCutRequest
+        from app.models.voter import Coordinate
+        from app.routes.assignments import cut_assignment_turfs
+        from tests.conftest import RecordingSession
+
+        manager = self.make_manager()
+        db = RecordingSession(self.voter_rows(5))
+        corners = [(30.25, -97.75), (30.27, -97.75), (30.27, -97.73)]
+
+        result = await cut_assignment_turfs(
+            request=TurfCutRequest(
+                support_levels=[4, 5],
+                party_affiliations=["DEM"],
+                polygon=[Coordinate(latitude=lat, longitude=lng) for lat, lng in corners],
+                turf_count=2,
+            ),
+            db=db,
+            current_user=manager,
+        )
+
+        sql = str(db.statements[0][0])
+        for fragment in ("support_level IN", "party_affiliation IN", "ST_Covers", "NOT (EXISTS"):
+            assert fragment in sql
+        assert "zip" not in sql.split("WHERE")[1]
+        assert {a.user_id for a in result.assignments} == {manager.id}
+
+    async def test_sizing_required(self):
+        """Test that a cut without turf_count, doors_per_turf or user_ids is rejected."""
+        from fastapi import HTTPException
+        from app.models.assignment import TurfCutRequest
+        from app.routes.assignments import cut_assignment_turfs
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await cut_assignment_turfs(
+                request=TurfCutRequest(zips=["78701"]), db=db, current_user=self.make_manager()
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert db.statements == []
+
+    async def test_unknown_canvasser_rejected(self):
+        """Test that all canvassers are checked in one query before clustering."""
+        from fastapi import HTTPException
+        from app.models.assignment import TurfCutRequest
+        from app.routes.assignments import cut_assignment_turfs
+        from tests.conftest import RecordingSession
+
+        known, unknown = uuid4(), uuid4()
+        db = RecordingSession([known])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await cut_assignment_turfs(
+                request=TurfCutRequest(user_ids=[known, unknown]),
+                db=db,
+                current_user=self.make_manager(),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert str(unknown) in exc_info.value.detail
+        assert len(db.statements) == 1 and db.commits == 0
+
+    async def test_oversized_universe_rejected(self, monkeypatch):
+        """Test that a filter matching more than the configured maximum is a 400."""
+        from fastapi import HTTPException
+        from app.config import settings
+        from app.models.assignment import TurfCutRequest
+        from app.routes.assignments import cut_assignment_turfs
+        from tests.conftest import RecordingSession
+
+        monkeypatch.setattr(settings, "TURF_CUT_MAX_VOTERS", 3)
+        db = RecordingSession(self.voter_rows(4))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await cut_assignment_turfs(
+                request=TurfCutRequest(turf_count=2), db=db, current_user=self.make_manager()
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert db.commits == 0
+
+    @pytest.mark.parametrize("sizing", ["turf_count", "doors_per_turf", "user_ids"])
+    async def test_oversized_turfs_rejected(self, monkeypatch, sizing):
+        """Test that no sizing can put more than the per-turf maximum into one turf."""
+        from fastapi import HTTPException
+        from app.config import settings
+        from app.models.assignment import TurfCutRequest
+        from app.routes import assignments
+        from tests.conftest import RecordingSession
+
+        monkeypatch.setattr(settings, "TURF_CUT_MAX_DOORS_PER_TURF", 4)
+        monkeypatch.setattr(assignments, "cut_turfs", lambda *args, **kwargs: pytest.fail())
+        canvasser = uuid4()
+        sizings = {"turf_count": 1, "doors_per_turf": 10, "user_ids": [canvasser]}
+        canvasser_rows = [[canvasser]] if sizing == "user_ids" else []
+        db = RecordingSession(*canvasser_rows, self.voter_rows(9))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await assignments.cut_assignment_turfs(
+                request=TurfCutRequest(**{sizing: sizings[sizing]}),
+                db=db,
+                current_user=self.make_manager(),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "at least 3 turfs" in exc_info.value.detail
+        assert db.commits == 0
+
+
+# =============================================================================
+# Assignment Voter Bulk Write Unit Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestAssignmentVoterBulkWrites:
+    """Test set-based assignment creation and bulk voter changes."""
+
+    @staticmethod
+    def make_manager():
+        from app.models.user import User
+
+        return User(id=uuid4(), email="manager@test.com", full_name="Test Manager", role="manager")
+
+    async def test_create_assignment_single_transaction(self):
+        """Test that creation validates once and inserts with two statements."""
+        from app.models.assignment import AssignmentCreate
+        from app.routes.assignments import (
+            INSERT_ASSIGNMENT_VOTERS_QUERY,
+            INSERT_ASSIGNMENTS_QUERY,
+            create_assignment,
+        )
+        from tests.conftest import RecordingSession
+
+        canvasser = uuid4()
+        voter_ids = [uuid4() for _ in range(1000)]
+        db = RecordingSession([canvasser], list(voter_ids))
+
+        result = await create_assignment(
+            assignment_data=AssignmentCreate(
+                name="Turf 12", user_id=canvasser, voter_ids=voter_ids + voter_ids[:3]
+            ),
+            db=db,
+            current_user=self.make_manager(),
+        )
+
+        assert result.voter_count == 1000
+        assert len(db.statements) == 4
+        assert db.commits == 1
+        (assignments_sql, assignment_params), (voters_sql, voter_params) = db.statements[2:]
+        assert assignments_sql is INSERT_ASSIGNMENTS_QUERY
+        assert assignment_params["ids"] == [result.id]
+        assert voters_sql is INSERT_ASSIGNMENT_VOTERS_QUERY
+        assert voter_params["voter_ids"] == voter_ids
+        assert voter_params["sequence_orders"] == list(range(1, 1001))
+        assert set(voter_params["assignment_ids"]) == {result.id}
+
+    async def test_create_assignment_missing_voter_writes_nothing(self):
+        """Test that an unknown voter ID fails before anything is written."""
+        from fastapi import HTTPException
+        from app.models.assignment import AssignmentCreate
+        from app.routes.assignments import create_assignment
+        from tests.conftest import RecordingSession
+
+        canvasser, known, unknown = uuid4(), uuid4(), uuid4()
+        db = RecordingSession([canvasser], [known])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_assignment(
+                assignment_data=AssignmentCreate(
+                    name="Turf 12", user_id=canvasser, voter_ids=[known, unknown]
+                ),
+                db=db,
+                current_user=self.make_manager(),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert str(unknown) in exc_info.value.detail
+        assert len(db.statements) == 2
+        assert db.commits == 0
+
+    async def test_create_assignment_missing_user(self):
+        """Test that an unknown canvasser is a 404."""
+        from fastapi import HTTPException
+        from app.models.assignment import AssignmentCreate
+        from app.routes.assignments import create_assignment
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession([])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_assignment(
+                assignment_data=AssignmentCreate(name="Turf 12", user_id=uuid4()),
+                db=db,
+                current_user=self.make_manager(),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert db.commits == 0
+
+    async def test_add_voters_appends_in_one_statement(self):
+        """Test bulk add reports added and already-present voters."""
+        from app.models.assignment import AssignmentVotersRequest
+        from app.routes.assignments import ADD_ASSIGNMENT_VOTERS_QUERY, add_assignment_voters
+        from tests.conftest import RecordingSession
+
+        assignment_id = uuid4()
+        new, present = uuid4(), uuid4()
+        db = RecordingSession([assignment_id], [new, present], [(new,)])
+
+        result = await add_assignment_voters(
+            assignment_id=assignment_id,
+            request=AssignmentVotersRequest(voter_ids=[new, present, new]),
+            db=db,
+            current_user=self.make_manager(),
+        )
+
+        assert result.voter_ids == [new]
+        assert result.skipped_count == 1
+        statement, params = db.statements[-1]
+        assert statement is ADD_ASSIGNMENT_VOTERS_QUERY
+        assert params == {"assignment_id": assignment_id, "voter_ids": [new, present]}
+        assert len(db.statements) == 3
+        assert db.commits == 1
+
+    async def test_remove_voters_in_one_statement(self):
+        """Test bulk remove reports removed and absent voters."""
+        from app.models.assignment import AssignmentVotersRequest
+        from app.routes.assignments import (
+            REMOVE_ASSIGNMENT_VOTERS_QUERY,
+            remove_assignment_voters,
+        )
+        from tests.conftest import RecordingSession
+
+        assignment_id = uuid4()
+        on_turf, absent = uuid4(), uuid4()
+        db = RecordingSession([assignment_id], [(on_turf,)])
+
+        result = await remove_assignment_voters(
+            assignment_id=assignment_id,
+            request=AssignmentVotersRequest(voter_ids=[on_turf, absent]),
+            db=db,
+            current_user=self.make_manager(),
+        )
+
+        assert result.voter_ids == [on_turf]
+        assert result.skipped_count == 1
+        assert db.statements[-1][0] is REMOVE_ASSIGNMENT_VOTERS_QUERY
+        assert db.commits == 1
+
+    async def test_bulk_change_unknown_assignment(self):
+        """Test that bulk changes to a missing assignment are a 404."""
+        from fastapi import HTTPException
+        from app.models.assignment import AssignmentVotersRequest
+        from app.routes.assignments import add_assignment_voters
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession([])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await add_assignment_voters(
+                assignment_id=uuid4(),
+                request=AssignmentVotersRequest(voter_ids=[uuid4()]),
+                db=db,
+                current_user=self.make_manager(),
+            )
+
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+        assert db.commits == 0
+
+
+# =============================================================================
+# Assignment Detail Read Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestAssignmentDetailRead:
+    """Test the voter read behind GET /assignments/{id}."""
+
+    async def test_detail_uses_lateral_last_contact(self):
+        """Test that voters and last contacts come from one set-based statement."""
+        from datetime import datetime
+        from types import SimpleNamespace
+        from app.models.assignment import Assignment
+        from app.models.user import User
+        from app.models.voter import Coordinate
+        from app.packets import ASSIGNMENT_VOTERS_QUERY
+        from app.routes.assignments import get_assignment
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment = Assignment(name="Turf 12", user_id=user.id)
+        voter = dict(
+            id=uuid4(), voter_id="TX1", first_name="Ann", last_name="Lee",
+            address="1 Main St", city="Austin", zip="78701", party_affiliation=None,
+            support_level=4, sequence_order=1,
+            location=Coordinate(latitude=30.2672, longitude=-97.7431),
+        )
+        contacted = dict(
+            last_contacted_at=datetime(2026, 10, 17, 9), last_contact_type="knocked",
+            last_contact_result="Supportive",
+        )
+        never = dict(last_contacted_at=None, last_contact_type=None, last_contact_result=None)
+        rows = [
+            SimpleNamespace(_mapping={**voter, **contacted}),
+            SimpleNamespace(_mapping={**voter, "id": uuid4(), "sequence_order": 2, **never}),
+        ]
+        db = RecordingSession([assignment], rows)
+
+        result = await get_assignment(assignment_id=assignment.id, db=db, current_user=user)
+
+        assert len(db.statements) == 2
+        assert db.statements[1][0] is ASSIGNMENT_VOTERS_QUERY
+        assert result.voters[0].last_contact.type == "knocked"
+        assert result.voters[0].location.latitude == 30.2672
+        assert result.voters[1].last_contact is None
+        data = result.model_dump(mode="json")
+        assert data["voters"][0]["last_contact"]["result"] == "Supportive"
+
+    def test_no_correlated_subquery(self):
+        """Test that the last contact is joined LATERAL, not selected per row."""
+        from app.packets import ASSIGNMENT_VOTERS_QUERY
+
+        sql = " ".join(str(ASSIGNMENT_VOTERS_QUERY).split())
+
+        assert "LEFT JOIN LATERAL" in sql
+        assert "json_build_object" not in sql
+        assert "cl.assignment_id = av.assignment_id AND cl.voter_id = av.voter_id" in sql
+
+    async def test_voter_list_decodes_wkb(self):
+        """Test that GET /assignments/{id}/voters reads locations as WKB, not WKT."""
+        import struct
+        from types import SimpleNamespace
+        from app.models.assignment import Assignment
+        from app.models.user import User
+        from app.routes.assignments import get_assignment_voters
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment = Assignment(name="Turf 12", user_id=user.id)
+        voter = dict(
+            id=uuid4(), voter_id="TX1", first_name="Ann", last_name="Lee",
+            address="1 Main St", city="Austin", zip="78701", party_affiliation=None,
+            support_level=4, sequence_order=1,
+        )
+        rows = [
+            SimpleNamespace(**voter, location=struct.pack("<BIdd", 1, 1, -97.7431, 30.2672)),
+            SimpleNamespace(**{**voter, "sequence_order": 2}, location=None),
+        ]
+        db = RecordingSession([assignment], rows)
+
+        voters = await get_assignment_voters(assignment_id=assignment.id, db=db, current_user=user)
+
+        sql = str(db.statements[1][0])
+        assert "ST_AsBinary" in sql
+        assert "ST_AsText" not in sql
+        assert voters[0]["location"] == {"latitude": 30.2672, "longitude": -97.7431}
+        assert voters[1]["location"] is None
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+class TestAssignmentDetailLatency:
+    """Hold the assignment voter read under its latency budget on PostgreSQL."""
+
+    def test_large_assignment_within_budget(self, large_assignment):
+        """Test the 1,000-voter / 20,000-log fixture against the p95 budget."""
+        from benchmarks.assignment_detail import LATENCY_BUDGET_MS, p95, time_query
+        from app.packets import ASSIGNMENT_VOTERS_QUERY
+
+        connection, assignment_id = large_assignment
+
+        rows = connection.execute(ASSIGNMENT_VOTERS_QUERY, {"assignment_id": assignment_id}).all()
+        timings = time_query(connection, ASSIGNMENT_VOTERS_QUERY, assignment_id, runs=20)
+
+        assert len(rows) == 1000
+        assert all(row.last_contacted_at is not None for row in rows)
+        assert p95(timings) < LATENCY_BUDGET_MS
+
+    def test_last_contact_probe_uses_index(self, large_assignment):
+        """Test that each voter's last contact is an index probe."""
+        from sqlalchemy import text
+        from app.packets import ASSIGNMENT_VOTERS_QUERY
+
+        connection, assignment_id = large_assignment
+
+        plan = connection.execute(
+            text("EXPLAIN " + str(ASSIGNMENT_VOTERS_QUERY)), {"assignment_id": assignment_id}
+        ).scalars().all()
+
+        assert any("idx_contact_logs_assignment_voter_recent" in line for line in plan)
+
+
+@pytest.mark.integration
+class TestAssignmentPacketVersion:
+    """Test packet versions against real transaction IDs on PostgreSQL."""
+
+    def test_lower_xid_committed_last_changes_version(self, postgres_engine):
+        """Test that a write committed after one from a newer transaction changes the ETag."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+        from benchmarks.assignment_detail import seed_large_assignment
+        from app.packets import PACKET_VERSION_QUERY
+
+        current_xid = text("SELECT CAST(CAST(pg_current_xact_id() AS TEXT) AS BIGINT)")
+        touch_voter = text("""
+            UPDATE voters SET city = city
+            WHERE id = (
+                SELECT voter_id FROM assignment_voters
+                WHERE assignment_id = :assignment_id AND sequence_order = :position
+            )
+        """)
+
+        try:
+            with postgres_engine.begin() as connection:
+                assignment_id = seed_large_assignment(connection, voters=2, logs=0)
+        except OperationalError:
+            pytest.skip("PostgreSQL not reachable for integration tests")
+
+        def version():
+            with postgres_engine.connect() as connection:
+                return connection.execute(
+                    PACKET_VERSION_QUERY, {"assignment_id": assignment_id}
+                ).one().version
+
+        try:
+            with postgres_engine.connect() as early, postgres_engine.connect() as late:
+                early_transaction = early.begin()
+                lower = early.execute(current_xid).scalar_one()
+                with late.begin():
+                    higher = late.execute(current_xid).scalar_one()
+                    late.execute(touch_voter, {"assignment_id": assignment_id, "position": 1})
+                before = version()
+
+                early.execute(touch_voter, {"assignment_id": assignment_id, "position": 2})
+                early_transaction.commit()
+
+            assert lower < higher
+            assert version() != before
+        finally:
+            self.delete_seeded(postgres_engine, assignment_id)
+
+    def test_packet_writes_bump_version_in_one_row(self, postgres_engine):
+        """Test that log, walking order and voter writes each bump the stored version."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+        from benchmarks.assignment_detail import seed_large_assignment
+        from app.packets import PACKET_VERSION_QUERY
+
+        writes = [
+            """
+            INSERT INTO contact_logs (assignment_id, voter_id, user_id, contact_type)
+            SELECT av.assignment_id, av.voter_id, a.user_id, 'knocked'
+            FROM assignment_voters av JOIN assignments a ON a.id = av.assignment_id
+            WHERE av.assignment_id = :assignment_id AND av.sequence_order = 1
+            """,
+            """
+            UPDATE assignment_voters SET sequence_order = 3 - sequence_order
+            WHERE assignment_id = :assignment_id
+            """,
+            """
+            UPDATE voters SET city = 'Round Rock'
+            WHERE id IN (
+                SELECT voter_id FROM assignment_voters WHERE assignment_id = :assignment_id
+            )
+            """,
+        ]
+        stored = text(
+            "SELECT packet_version, change_xid FROM assignments WHERE id = :assignment_id"
+        )
+
+        try:
+            with postgres_engine.begin() as connection:
+                assignment_id = seed_large_assignment(connection, voters=2, logs=0)
+        except OperationalError:
+            pytest.skip("PostgreSQL not reachable for integration tests")
+
+        params = {"assignment_id": assignment_id}
+
+        def snapshot():
+            with postgres_engine.connect() as connection:
+                version = connection.execute(PACKET_VERSION_QUERY, params).one().version
+                return version, connection.execute(stored, params).one().change_xid
+
+        try:
+            snapshots = [snapshot()]
+            for write in writes:
+                with postgres_engine.begin() as connection:
+                    connection.execute(text(write), params)
+                snapshots.append(snapshot())
+            versions, change_xids = zip(*snapshots)
+
+            assert len(set(versions)) == len(versions)
+            # Only the first contact changed the assignment row itself (completed_count)
+            assert change_xids[1] != change_xids[0]
+            assert change_xids[3] == change_xids[2] == change_xids[1]
+        finally:
+            self.delete_seeded(postgres_engine, assignment_id)
+
+    @staticmethod
+    def delete_seeded(postgres_engine, assignment_id):
+        """Delete an assignment seeded by seed_large_assignment and its rows."""
+        from sqlalchemy import text
+
+        with postgres_engine.begin() as connection:
+            user_id = connection.execute(
+                text("SELECT user_id FROM assignments WHERE id = :id"), {"id": assignment_id}
+            ).scalar_one()
+            voter_ids = connection.execute(
+                text("SELECT voter_id FROM assignment_voters WHERE assignment_id = :id"),
+                {"id": assignment_id},
+            ).scalars().all()
+            connection.execute(text("DELETE FROM users WHERE id = :id"), {"id": user_id})
+            connection.execute(
+                text("DELETE FROM voters WHERE id = ANY(:ids)"), {"ids": voter_ids}
+            )
+            connection.execute(
+                text(
+                    "DELETE FROM sync_tombstones "
+                    "WHERE assignment_id = :id OR entity_id = :id OR user_id = :user_id"
+                ),
+                {"id": assignment_id, "user_id": user_id},
+            )
+
+
+@pytest.mark.integration
+class TestAssignmentVoterAppend:
+    """Test appending voters to an assignment on PostgreSQL."""
+
+    def test_new_voters_numbered_without_gaps(self, postgres_engine):
+        """Test that voters already on the assignment do not use up positions."""
+        from sqlalchemy import text
+        from sqlalchemy.exc import OperationalError
+        from benchmarks.assignment_detail import seed_large_assignment
+        from app.routes.assignments import ADD_ASSIGNMENT_VOTERS_QUERY
+
+        try:
+            connection = postgres_engine.connect()
+        except OperationalError:
+            pytest.skip("PostgreSQL not reachable for integration tests")
+
+        transaction = connection.begin()
+        try:
+            assignment_id = seed_large_assignment(connection, voters=3, logs=0)
+            existing = connection.execute(
+                text("""
+                    SELECT voter_id FROM assignment_voters
+                    WHERE assignment_id = :assignment_id ORDER BY sequence_order
+                """),
+                {"assignment_id": assignment_id},
+            ).scalars().all()
+            new = connection.execute(
+                text("""
+                    INSERT INTO voters (voter_id, first_name, last_name, address, city, zip)
+                    SELECT 'APPEND-' || g || '-' || :suffix, 'New', 'Voter' || g,
+                           g || ' Oak St', 'Austin', '78701'
+                    FROM generate_series(1, 2) AS g
+                    RETURNING id
+                """),
+                {"suffix": uuid4().hex},
+            ).scalars().all()
+
+            added = connection.execute(
+                ADD_ASSIGNMENT_VOTERS_QUERY,
+                {
+                    "assignment_id": assignment_id,
+                    "voter_ids": [str(v) for v in (existing[0], new[0], existing[2], new[1])],
+                },
+            ).scalars().all()
+            orders = dict(
+                connection.execute(
+                    text("""
+                        SELECT voter_id, sequence_order FROM assignment_voters
+                        WHERE assignment_id = :assignment_id
+                    """),
+                    {"assignment_id": assignment_id},
+                ).all()
+            )
+
+            assert sorted(map(str, added)) == sorted(map(str, new))
+            assert [orders[voter_id] for voter_id in existing] == [1, 2, 3]
+            assert [orders[voter_id] for voter_id in new] == [4, 5]
+        finally:
+            transaction.rollback()
+            connection.close()
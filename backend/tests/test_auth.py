@@ -440,3 +440,150 @@ class TestAuthIntegration:
         
         assert client.get("/auth/me", headers=headers1).status_code == status.HTTP_200_OK
         assert client.get("/auth/me", headers=headers2).status_code == status.HTTP_200_OK
+
+
+# =============================================================================
+# Stateless Authorization Tests
+# =============================================================================
+
+@pytest.fixture
+def stateless_auth(monkeypatch):
+    """Switch STATELESS_AUTH on for one test."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "STATELESS_AUTH", True)
+
+
+def decode(token):
+    """Claims of a token signed with the app's secret."""
+    from jose import jwt
+    from app.config import settings
+
+    return jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+
+
+def make_user(**overrides):
+    """Unsaved manager, with overrides."""
+    from uuid import uuid4
+    from app.models.user import User
+
+    values = dict(id=uuid4(), email="manager@test.com", full_name="Test Manager", role="manager")
+    values.update(overrides)
+    return User(**values)
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+class TestStatelessAuth:
+    """Test role claims, refresh tokens and zero-query role checks."""
+
+    def test_access_token_carries_role_and_version(self, stateless_auth):
+        """Test that tokens are short-lived and sign in the role and version."""
+        import time
+        from app.routes.auth import issue_token
+
+        token = issue_token(make_user(token_version=3))
+        access, refresh = decode(token.token), decode(token.refresh_token)
+
+        assert (access["type"], access["role"], access["ver"]) == ("access", "manager", 3)
+        assert access["exp"] - time.time() <= 5 * 60 + 1
+        assert (refresh["type"], refresh["ver"]) == ("refresh", 3)
+        assert "role" not in refresh
+        assert refresh["exp"] > access["exp"]
+
+    def test_no_refresh_token_by_default(self):
+        """Test that the default mode keeps issuing a single long-lived token."""
+        from app.routes.auth import issue_token
+
+        token = issue_token(make_user())
+
+        assert token.refresh_token is None
+        assert decode(token.token)["role"] == "manager"
+
+    async def test_role_check_without_database(self, stateless_auth):
+        """Test that require_manager passes on claims alone."""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.dependencies import get_current_user, require_manager
+        from app.routes.auth import issue_token
+        from tests.conftest import RecordingSession
+
+        user = make_user()
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=issue_token(user).token
+        )
+        db = RecordingSession()
+
+        current = await require_manager(await get_current_user(credentials=credentials, db=db))
+
+        assert (current.id, current.role) == (user.id, "manager")
+        assert db.statements == []
+
+    async def test_refresh_token_rejected_as_bearer(self, stateless_auth):
+        """Test that a refresh token cannot authorize API requests."""
+        from fastapi import HTTPException
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.dependencies import get_current_user
+        from app.routes.auth import issue_token
+        from tests.conftest import RecordingSession
+
+        token = issue_token(make_user())
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=token.refresh_token
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials=credentials, db=RecordingSession())
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_refresh_picks_up_role_change(self, stateless_auth):
+        """Test that refreshing re-reads the user and signs in the current role."""
+        from app.routes.auth import RefreshRequest, issue_token, refresh
+        from tests.conftest import RecordingSession
+
+        user = make_user(role="canvasser")
+        refresh_token = issue_token(user).refresh_token
+        db = RecordingSession([make_user(id=user.id, role="canvasser")])
+
+        token = await refresh(refresh_data=RefreshRequest(refresh_token=refresh_token), db=db)
+
+        assert decode(token.token)["role"] == "canvasser"
+        assert len(db.statements) == 1
+
+    async def test_refresh_after_version_bump_refused(self, stateless_auth):
+        """Test that a role change revokes outstanding refresh tokens."""
+        from fastapi import HTTPException
+        from app.models.user import UserUpdate
+        from app.routes.auth import RefreshRequest, issue_token, refresh
+        from app.routes.users import update_user
+        from tests.conftest import RecordingSession
+
+        user = make_user()
+        refresh_token = issue_token(user).refresh_token
+        stored = make_user(id=user.id)
+        db = RecordingSession([stored], [stored])
+
+        await update_user(
+            user_id=user.id,
+            user_data=UserUpdate(role="canvasser"),
+            db=db,
+            current_user=make_user(role="admin"),
+        )
+        assert stored.token_version == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await refresh(refresh_data=RefreshRequest(refresh_token=refresh_token), db=db)
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_access_token_refused_at_refresh(self, stateless_auth):
+        """Test that an access token cannot be used to mint new tokens."""
+        from fastapi import HTTPException
+        from app.routes.auth import RefreshRequest, issue_token, refresh
+        from tests.conftest import RecordingSession
+
+        access_token = issue_token(make_user()).token
+        db = RecordingSession()
+
+        with pytest.raises(HTTPException):
+            await refresh(refresh_data=RefreshRequest(refresh_token=access_token), db=db)
+        assert db.statements == []
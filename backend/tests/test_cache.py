@@ -0,0 +1,68 @@
+"""
+VEP MVP Backend - Cache Tests
+
+Tests for the in-process TTL/LRU cache.
+"""
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# =============================================================================
+# TTL Cache Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test expiry and LRU eviction."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are served until their TTL, then dropped."""
+        from app.cache import TTLCache
+
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=30, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 29.9
+        assert cache.get("a") == 1
+        clock.now = 30.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        """Test that reads refresh recency and the oldest entry is evicted."""
+        from app.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_invalidates(self):
+        """Test that pop removes an entry and returns its live value."""
+        from app.cache import TTLCache
+
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.get("a") is None
+        clock.now = 10
+        assert cache.pop("b", "gone") == "gone"
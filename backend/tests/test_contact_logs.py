@@ -305,16 +305,15 @@ class TestContactLogFiltering:
         pytest.skip("Backend implementation pending from Agent 2")
         
         response = client.get(
-            "/contact-logs?limit=10&offset=0",
+            "/contact-logs?limit=10",
             headers=auth_headers_canvasser,
         )
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert "logs" in data
-        assert "total" in data
         assert "limit" in data
-        assert "offset" in data
+        assert "next_cursor" in data
 
 
 # =============================================================================
@@ -624,3 +623,288 @@ class TestContactLogIntegration:
             headers=auth_headers_canvasser,
         )
         assert "location" in get_response.json()
+
+
+# =============================================================================
+# Batch Upload Unit Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestContactLogBatch:
+    """Test batch contact log validation and statement count."""
+
+    @staticmethod
+    async def upload(logs, assignment_rows, voter_rows, user, *more_results):
+        from fastapi import Response
+        from app.models.contact_log import ContactLogBatchCreate
+        from app.routes.contact_logs import create_contact_logs_batch
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession(assignment_rows, voter_rows, *more_results)
+        response = Response()
+        result = await create_contact_logs_batch(
+            batch=ContactLogBatchCreate(logs=logs),
+            response=response,
+            db=db,
+            current_user=user,
+        )
+        return result, response, db
+
+    @pytest.mark.parametrize("batch_size", [5, 500])
+    async def test_batch_uses_constant_statements(self, batch_size):
+        """Test that a batch costs two lookups and one insert regardless of size."""
+        from app.models.user import User
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        assignment_id = uuid4()
+        voter_ids = [uuid4() for _ in range(batch_size)]
+        logs = [
+            {
+                "assignment_id": str(assignment_id),
+                "voter_id": str(voter_id),
+                "contact_type": "knocked",
+                "location": {"latitude": 30.2672, "longitude": -97.7431},
+                "contacted_at": (datetime.now() - timedelta(minutes=i)).isoformat(),
+            }
+            for i, voter_id in enumerate(voter_ids)
+        ]
+
+        result, response, db = await self.upload(
+            logs, [(assignment_id, user.id)], voter_ids, user
+        )
+
+        assert result.created == batch_size
+        assert result.errors == []
+        assert response.status_code != status.HTTP_207_MULTI_STATUS
+        assert len(db.statements) == 3
+        lookups = [str(statement) for statement, _ in db.statements[:2]]
+        assert all(sql.lstrip().startswith("SELECT") for sql in lookups)
+        insert_statement, insert_params = db.statements[-1]
+        insert_sql = str(insert_statement)
+        assert insert_sql.lstrip().startswith("INSERT INTO contact_logs")
+        assert "FROM unnest(" in insert_sql
+        assert "ON CONFLICT (user_id, idempotency_key)" in insert_sql
+        assert len(insert_params["ids"]) == batch_size
+        assert insert_params["latitudes"][0] == 30.2672
+
+    async def test_batch_reports_per_item_failures(self):
+        """Test that invalid items fail individually with 207 Multi-Status."""
+        from app.models.user import User
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        own_assignment, other_assignment = uuid4(), uuid4()
+        voter_id = uuid4()
+        logs = [
+            {"assignment_id": str(assignment), "voter_id": str(voter), "contact_type": contact_type}
+            for assignment, voter, contact_type in [
+                (own_assignment, voter_id, "knocked"),
+                (other_assignment, voter_id, "knocked"),
+                (uuid4(), voter_id, "knocked"),
+                (own_assignment, uuid4(), "knocked"),
+                (own_assignment, voter_id, "waved"),
+            ]
+        ]
+
+        result, response, db = await self.upload(
+            logs,
+            [(own_assignment, user.id), (other_assignment, uuid4())],
+            [voter_id],
+            user,
+        )
+
+        assert result.created == 1
+        assert [item.index for item in result.errors] == [1, 2, 3, 4]
+        assert result.results[0].status == "created"
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+
+    async def test_batch_deduplicates_idempotency_keys(self):
+        """Test that uploaded and repeated keys resolve to the original log."""
+        from app.models.user import User
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        assignment_id, voter_id = uuid4(), uuid4()
+        uploaded_key, uploaded_log_id = uuid4(), uuid4()
+        new_key = uuid4()
+        log = {
+            "assignment_id": str(assignment_id),
+            "voter_id": str(voter_id),
+            "contact_type": "knocked",
+        }
+        logs = [
+            {**log, "idempotency_key": str(uploaded_key)},
+            {**log, "idempotency_key": str(new_key)},
+            {**log, "idempotency_key": str(new_key)},
+        ]
+
+        result, _, db = await self.upload(
+            logs,
+            [(assignment_id, user.id)],
+            [voter_id],
+            user,
+            [(uploaded_key, uploaded_log_id)],
+            lambda statement, params: [(log_id,) for log_id in params["ids"]],
+        )
+
+        _, insert_params = db.statements[-1]
+        assert [item.status for item in result.results] == ["duplicate", "created", "duplicate"]
+        assert result.results[0].id == uploaded_log_id
+        assert result.results[2].id == result.results[1].id == insert_params["ids"][0]
+        assert insert_params["idempotency_keys"] == [new_key]
+        assert result.created == 1
+
+    async def test_batch_resolves_concurrent_upload_race(self):
+        """Test that rows skipped by ON CONFLICT report the winning log's ID."""
+        from app.models.user import User
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        assignment_id, voter_id = uuid4(), uuid4()
+        key, winner_id = uuid4(), uuid4()
+        logs = [
+            {
+                "assignment_id": str(assignment_id),
+                "voter_id": str(voter_id),
+                "contact_type": "knocked",
+                "idempotency_key": str(key),
+            }
+        ]
+
+        result, _, db = await self.upload(
+            logs,
+            [(assignment_id, user.id)],
+            [voter_id],
+            user,
+            [],
+            [],
+            [(key, winner_id)],
+        )
+
+        assert result.results[0].status == "duplicate"
+        assert result.results[0].id == winner_id
+        assert result.created == 0
+
+    async def test_retry_returns_original_log(self):
+        """Test that a single-log retry is a lookup returning 200 OK."""
+        from fastapi import Response
+        from app.models.contact_log import ContactLog, ContactLogCreate
+        from app.models.user import User
+        from app.models.voter import Coordinate
+        from app.routes.contact_logs import create_contact_log
+        from tests.conftest import RecordingSession
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        key = uuid4()
+        original = ContactLog(
+            assignment_id=uuid4(),
+            voter_id=uuid4(),
+            user_id=user.id,
+            contact_type="knocked",
+            idempotency_key=key,
+            location=Coordinate(latitude=30.2672, longitude=-97.7431),
+        )
+        db = RecordingSession([original])
+        response = Response()
+
+        log = await create_contact_log(
+            log_data=ContactLogCreate(
+                assignment_id=original.assignment_id,
+                voter_id=original.voter_id,
+                contact_type="knocked",
+                idempotency_key=key,
+            ),
+            response=response,
+            db=db,
+            current_user=user,
+        )
+
+        assert log.id == original.id
+        assert log.location.latitude == 30.2672
+        assert response.status_code == status.HTTP_200_OK
+        assert len(db.statements) == 1
+
+    async def test_create_inserts_location_in_one_statement(self):
+        """Test that a new log is one INSERT and one commit with no re-read."""
+        from fastapi import Response
+        from app.models.assignment import Assignment
+        from app.models.contact_log import ContactLogCreate
+        from app.models.user import User
+        from app.routes.contact_logs import create_contact_log
+        from tests.conftest import RecordingSession
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        assignment = Assignment(name="Turf 1", user_id=user.id)
+        db = RecordingSession([assignment])
+
+        log = await create_contact_log(
+            log_data=ContactLogCreate(
+                assignment_id=assignment.id,
+                voter_id=uuid4(),
+                contact_type="knocked",
+                location={"latitude": 30.2672, "longitude": -97.7431},
+            ),
+            response=Response(),
+            db=db,
+            current_user=user,
+        )
+
+        assert len(db.statements) == 1
+        lookup_sql = str(db.statements[0][0])
+        assert lookup_sql.lstrip().startswith("SELECT")
+        assert "FROM assignments" in lookup_sql
+        assert db.commits == 1
+        assert db.added[0].location.latitude == 30.2672
+        assert log.location.longitude == -97.7431
+
+
+# =============================================================================
+# Keyset Pagination Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestContactLogKeysetPagination:
+    """Test cursor-based contact log pagination."""
+
+    async def test_cursor_seeks_before_last_row(self):
+        """Test that the next page starts strictly after the last (contacted_at, id)."""
+        from sqlalchemy.dialects import postgresql
+        from app.models.contact_log import ContactLog
+        from app.models.user import User
+        from app.routes.contact_logs import list_contact_logs
+        from tests.conftest import RecordingSession
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+        now = datetime.now()
+        rows = [
+            (
+                ContactLog(
+                    assignment_id=uuid4(),
+                    voter_id=uuid4(),
+                    user_id=user.id,
+                    contact_type="knocked",
+                    contacted_at=now - timedelta(minutes=i),
+                ),
+                "Jane",
+                f"Doe{i}",
+            )
+            for i in range(3)
+        ]
+        db = RecordingSession(rows, [])
+
+        page = await list_contact_logs(
+            db=db, current_user=user, assignment_id=None, start_date=None, limit=2, cursor=None
+        )
+        await list_contact_logs(
+            db=db,
+            current_user=user,
+            assignment_id=None,
+            start_date=None,
+            limit=2,
+            cursor=page.next_cursor,
+        )
+        statement, _ = db.statements[-1]
+        compiled = statement.compile(dialect=postgresql.dialect())
+
+        assert [log.voter_name for log in page.logs] == ["Jane Doe0", "Jane Doe1"]
+        assert "(contact_logs.contacted_at, contact_logs.id) <" in str(compiled)
+        assert "contact_logs.user_id =" in str(compiled)
+        assert rows[1][0].contacted_at in compiled.params.values()
+        assert rows[1][0].id in compiled.params.values()
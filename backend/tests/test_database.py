@@ -0,0 +1,118 @@
+"""
+VEP MVP Backend - Database Engine Tests
+
+Tests for connection pool configuration and checkout-wait instrumentation.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.config import Settings
+from app.database import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedNullPool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    PoolMode,
+    async_database_url,
+    create_async_db_engine,
+    create_db_engine,
+    pool_status,
+)
+
+
+# =============================================================================
+# Pool Configuration Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestPoolConfiguration:
+    """Test engine construction for each pooling mode."""
+
+    def test_queue_mode_uses_sized_queue_pool(self):
+        """Test that queue mode builds a QueuePool from settings."""
+        app_settings = Settings(DB_POOL_MODE=PoolMode.QUEUE, DB_POOL_SIZE=3, DEBUG=False)
+        engine = create_db_engine("sqlite://", app_settings)
+
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        assert engine.pool.size() == 3
+        engine.dispose()
+
+    def test_external_mode_does_not_hold_connections(self):
+        """Test that external pooler mode opens a connection per checkout."""
+        app_settings = Settings(DB_POOL_MODE=PoolMode.EXTERNAL, DEBUG=False)
+        engine = create_db_engine("sqlite://", app_settings)
+
+        assert isinstance(engine.pool, InstrumentedNullPool)
+        engine.dispose()
+
+    def test_async_engine_uses_asyncpg(self):
+        """Test that the async engine targets asyncpg with an async-safe pool."""
+        app_settings = Settings(DB_POOL_MODE=PoolMode.QUEUE, DEBUG=False)
+        engine = create_async_db_engine("postgresql://u:p@localhost/vep", app_settings)
+
+        assert engine.url.drivername == "postgresql+asyncpg"
+        assert isinstance(engine.pool, InstrumentedAsyncQueuePool)
+
+    def test_async_url_translates_sslmode(self):
+        """Test libpq URL conversion for asyncpg."""
+        url = async_database_url("postgres://u:p@db.example.com:5432/vep?sslmode=require")
+
+        assert url == "postgresql+asyncpg://u:p@db.example.com:5432/vep?ssl=require"
+
+    def test_unknown_mode_rejected(self):
+        """Test that a misspelled pool mode fails loudly."""
+        app_settings = Settings(DB_POOL_MODE="bouncer", DEBUG=False)
+
+        with pytest.raises(ValueError):
+            create_db_engine("sqlite://", app_settings)
+
+
+# =============================================================================
+# Pool Metrics Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Test checkout-wait metric collection."""
+
+    def test_checkout_recorded(self):
+        """Test that connecting records a checkout."""
+        app_settings = Settings(DB_POOL_MODE=PoolMode.QUEUE, DEBUG=False)
+        engine = create_db_engine("sqlite://", app_settings)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        status = pool_status(engine)
+        assert status["checkout_wait"]["checkouts"] == 1
+        assert status["checked_out"] == 0
+        engine.dispose()
+
+    def test_engines_counted_separately(self):
+        """Test that engines on the same pool class keep their own counters."""
+        app_settings = Settings(DB_POOL_MODE=PoolMode.QUEUE, DEBUG=False)
+        busy = create_db_engine("sqlite://", app_settings)
+        idle = create_db_engine("sqlite://", app_settings)
+
+        for _ in range(3):
+            with busy.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        assert pool_status(busy)["checkout_wait"]["checkouts"] == 3
+        assert pool_status(idle)["checkout_wait"]["checkouts"] == 0
+        busy.dispose()
+        idle.dispose()
+
+    def test_snapshot_averages(self):
+        """Test average and max wait calculation."""
+        metrics = PoolMetrics()
+        metrics.record_checkout(0.002)
+        metrics.record_checkout(0.004)
+        metrics.record_timeout(0.5)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 2
+        assert snapshot["timeouts"] == 1
+        assert snapshot["avg_wait_ms"] == pytest.approx(3.0)
+        assert snapshot["max_wait_ms"] == pytest.approx(500.0)
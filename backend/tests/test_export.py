@@ -0,0 +1,166 @@
+"""
+VEP MVP Backend - Export Tests
+
+Tests for streaming NDJSON/CSV exports of voters and contact logs.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+from sqlmodel import select
+
+
+class ExportRow:
+    """Result row stand-in exposing `_mapping` like a SQLAlchemy Row."""
+
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+
+def make_voter_rows(statement, count):
+    """Build result rows shaped like the statement's selected columns."""
+    from app.models.voter import Coordinate
+
+    keys = [column.name for column in statement.selected_columns]
+    rows = []
+    for i in range(count):
+        values = {
+            "id": uuid4(),
+            "voter_id": f"TX{1000000 + i}",
+            "first_name": f"Voter{i}",
+            "last_name": "Doe, Jr.",
+            "location": Coordinate(latitude=30.2672, longitude=-97.7431) if i % 2 else None,
+            "created_at": datetime(2026, 10, 17, tzinfo=timezone.utc),
+        }
+        rows.append(ExportRow({key: values.get(key) for key in keys}))
+    return rows
+
+
+async def collect(response):
+    """Read a StreamingResponse body into one string."""
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+# =============================================================================
+# Export Streaming Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestExportStreaming:
+    """Test export formatting and batching."""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        """Patch new export sessions to a RecordingSession holding 5 voter rows."""
+        import app.export
+        from app.routes.voters import VOTER_EXPORT_COLUMNS
+        from tests.conftest import RecordingSession
+
+        statement = select(*VOTER_EXPORT_COLUMNS)
+        db = RecordingSession(make_voter_rows(statement, 5))
+        monkeypatch.setattr(app.export, "new_async_session", lambda: db)
+        monkeypatch.setattr(app.export, "EXPORT_BATCH_SIZE", 2)
+        return db
+
+    async def test_ndjson_export(self, session):
+        """Test one JSON object per line with flattened coordinates."""
+        from app.models.user import User
+        from app.routes.voters import export_voters
+
+        user = User(email="manager@test.com", full_name="Test Manager", role="manager")
+        response = await export_voters(current_user=user, zip=None, export_format="ndjson")
+        lines = (await collect(response)).splitlines()
+        records = [json.loads(line) for line in lines]
+
+        assert response.media_type == "application/x-ndjson"
+        assert len(records) == 5
+        assert records[0]["latitude"] is None
+        assert records[1]["latitude"] == 30.2672
+        assert "location" not in records[1]
+        assert records[0]["created_at"] == "2026-10-17T00:00:00+00:00"
+
+    async def test_csv_export(self, session):
+        """Test a header row followed by one quoted row per voter."""
+        from app.models.user import User
+        from app.routes.voters import export_voters
+
+        user = User(email="manager@test.com", full_name="Test Manager", role="manager")
+        response = await export_voters(current_user=user, zip="78701", export_format="csv")
+        body = await collect(response)
+        records = list(csv.DictReader(io.StringIO(body)))
+
+        assert response.headers["content-disposition"] == 'attachment; filename="voters.csv"'
+        assert len(records) == 5
+        assert records[0]["last_name"] == "Doe, Jr."
+        assert records[1]["longitude"] == "-97.7431"
+
+    async def test_rows_streamed_in_batches(self, session):
+        """Test that the body is produced one chunk per fetched batch."""
+        from app.models.user import User
+        from app.routes.voters import export_voters
+
+        user = User(email="manager@test.com", full_name="Test Manager", role="manager")
+        response = await export_voters(current_user=user, zip=None, export_format="ndjson")
+        chunks = [chunk async for chunk in response.body_iterator]
+        statement, _ = session.statements[0]
+
+        assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+        assert statement.get_execution_options()["yield_per"] == 2
+
+    async def test_unsupported_format_rejected(self):
+        """Test that an unknown format is a 400 before streaming starts."""
+        from app.models.user import User
+        from app.routes.voters import export_voters
+
+        user = User(email="manager@test.com", full_name="Test Manager", role="manager")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await export_voters(current_user=user, zip=None, export_format="xlsx")
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# =============================================================================
+# Export Scoping Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestContactLogExportScoping:
+    """Test that contact log exports apply list role scoping."""
+
+    @staticmethod
+    async def export_sql(monkeypatch, role):
+        import app.export
+        from sqlalchemy.dialects import postgresql
+        from app.models.user import User
+        from app.routes.contact_logs import export_contact_logs
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession()
+        monkeypatch.setattr(app.export, "new_async_session", lambda: db)
+        user = User(email=f"{role}@test.com", full_name="Test User", role=role)
+
+        response = await export_contact_logs(
+            current_user=user, assignment_id=None, start_date=None, export_format="ndjson"
+        )
+        await collect(response)
+        statement, _ = db.statements[0]
+        return str(statement.compile(dialect=postgresql.dialect()))
+
+    async def test_canvasser_export_scoped_to_own_logs(self, monkeypatch):
+        """Test that canvassers only export their own logs."""
+        sql = await self.export_sql(monkeypatch, "canvasser")
+
+        assert "contact_logs.user_id =" in sql
+        assert "ST_AsBinary(contact_logs.location)" in sql
+
+    async def test_manager_export_unscoped(self, monkeypatch):
+        """Test that managers export every log."""
+        sql = await self.export_sql(monkeypatch, "manager")
+
+        assert "contact_logs.user_id =" not in sql
@@ -0,0 +1,138 @@
+"""
+VEP MVP Backend - Geometry Tests
+
+Tests for the WKB/EWKB point codec.
+"""
+
+import struct
+
+import pytest
+
+
+def wkb(longitude, latitude, order="<"):
+    """Plain 2D WKB point, as ST_AsBinary returns it."""
+    return struct.pack(f"{order}BIdd", 1 if order == "<" else 0, 1, longitude, latitude)
+
+
+# =============================================================================
+# Point Decoding Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestDecodePoint:
+    """Test decoding single WKB and EWKB points."""
+
+    def test_little_endian(self):
+        """Test that x/y come back as (latitude, longitude)."""
+        from app.geometry import decode_point
+
+        assert decode_point(wkb(-97.7431, 30.2672)) == (30.2672, -97.7431)
+
+    def test_big_endian(self):
+        """Test that XDR (big-endian) points decode the same."""
+        from app.geometry import decode_point
+
+        assert decode_point(wkb(-97.7431, 30.2672, order=">")) == (30.2672, -97.7431)
+
+    def test_ewkb_with_srid(self):
+        """Test that an embedded SRID is skipped."""
+        from app.geometry import EWKB_SRID_FLAG, decode_point
+
+        value = struct.pack("<BIIdd", 1, 1 | EWKB_SRID_FLAG, 4326, -97.7431, 30.2672)
+
+        assert decode_point(value) == (30.2672, -97.7431)
+
+    def test_empty_point(self):
+        """Test that POINT EMPTY (NaN ordinates) decodes to None."""
+        from app.geometry import decode_point
+
+        assert decode_point(wkb(float("nan"), float("nan"))) is None
+
+    def test_not_a_point(self):
+        """Test that other geometry types are rejected."""
+        from app.geometry import decode_point
+
+        linestring = struct.pack("<BII", 1, 2, 0)
+
+        with pytest.raises(ValueError, match="Not a WKB point"):
+            decode_point(linestring)
+        with pytest.raises(ValueError, match="Not a WKB geometry"):
+            decode_point(b"POINT(-97.7 30.2)")
+
+    def test_truncated(self):
+        """Test that a cut-off point raises instead of returning garbage."""
+        from app.geometry import decode_point
+
+        with pytest.raises(ValueError, match="Truncated"):
+            decode_point(wkb(-97.7431, 30.2672)[:13])
+
+
+# =============================================================================
+# Column Decoding Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestDecodePoints:
+    """Test decoding whole result-set columns."""
+
+    def test_fast_path_with_nulls(self):
+        """Test plain WKB with NULLs decodes to NaN rows in place."""
+        import numpy as np
+        from app.geometry import decode_points
+
+        points = decode_points([wkb(-97.1, 30.1), None, wkb(-97.3, 30.3)])
+
+        assert points.shape == (3, 2)
+        assert points[0].tolist() == [30.1, -97.1]
+        assert np.isnan(points[1]).all()
+        assert points[2].tolist() == [30.3, -97.3]
+
+    def test_mixed_encodings(self):
+        """Test that a column the fast path cannot take falls back per value."""
+        import numpy as np
+        from app.geometry import EWKB_SRID_FLAG, decode_points
+
+        values = [
+            wkb(-97.1, 30.1),
+            wkb(-97.2, 30.2, order=">"),
+            struct.pack("<BIIdd", 1, 1 | EWKB_SRID_FLAG, 4326, -97.3, 30.3),
+            wkb(float("nan"), float("nan")),
+        ]
+
+        points = decode_points(values)
+
+        assert points[:3].tolist() == [[30.1, -97.1], [30.2, -97.2], [30.3, -97.3]]
+        assert np.isnan(points[3]).all()
+
+    def test_empty_column(self):
+        """Test that no rows gives an empty (0, 2) array."""
+        from app.geometry import decode_points
+
+        assert decode_points([]).shape == (0, 2)
+
+
+# =============================================================================
+# Encoding Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestEncodeGeometry:
+    """Test EWKT encoding for bound parameters."""
+
+    def test_encode_point(self):
+        """Test that points are written x = longitude, y = latitude."""
+        from app.geometry import encode_point
+
+        assert encode_point(30.2672, -97.7431) == "SRID=4326;POINT(-97.7431 30.2672)"
+
+    def test_encode_polygon_closes_ring(self):
+        """Test that an open ring is closed and an already closed one is left alone."""
+        from app.geometry import encode_polygon
+
+        corners = [(30.25, -97.75), (30.27, -97.75), (30.27, -97.73)]
+        expected = (
+            "SRID=4326;POLYGON((-97.75 30.25, -97.75 30.27, -97.73 30.27, -97.75 30.25))"
+        )
+
+        assert encode_polygon(corners) == expected
+        assert encode_polygon(corners + corners[:1]) == expected
@@ -0,0 +1,127 @@
+"""
+VEP MVP Backend - Password Hashing Tests
+
+Tests for bcrypt hashing on the bounded thread pool.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.fixture
+def hasher():
+    """Cheap-to-run pool (4 rounds is bcrypt's minimum)."""
+    from app.passwords import PasswordHasher
+
+    pool = PasswordHasher(workers=2, max_queue=4, rounds=4)
+    yield pool
+    pool.shutdown()
+
+
+# =============================================================================
+# Password Hashing Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestPasswordHasher:
+    """Test hashing results, back-pressure and metrics."""
+
+    async def test_hash_and_verify(self, hasher):
+        """Test that a hash verifies only its own password."""
+        hashed = await hasher.hash("correct horse battery staple")
+
+        assert hashed.startswith("$2b$04$")
+        assert await hasher.verify("correct horse battery staple", hashed)
+        assert not await hasher.verify("wrong", hashed)
+        assert not await hasher.verify("anything", "not-a-bcrypt-hash")
+
+    async def test_long_passwords_truncated(self, hasher):
+        """Test that passwords over bcrypt's 72-byte limit hash instead of raising."""
+        password = "x" * 72
+
+        hashed = await hasher.hash(password + "ignored")
+
+        assert await hasher.verify(password, hashed)
+
+    async def test_event_loop_keeps_running(self):
+        """Test that other coroutines run while a slow hash is in progress."""
+        from app.passwords import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_queue=1, rounds=10)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await hasher.hash("correct horse battery staple")
+        elapsed = time.perf_counter() - started
+        task.cancel()
+        hasher.shutdown()
+
+        assert ticks >= elapsed / 0.005 / 4
+
+    async def test_full_queue_rejected(self, hasher):
+        """Test that calls beyond workers + max_queue get a 503."""
+        from fastapi import HTTPException
+
+        # Slow enough that no call finishes while the burst is submitted
+        hasher.rounds = 8
+        results = await asyncio.gather(
+            *(hasher.hash(f"password{i}") for i in range(8)), return_exceptions=True
+        )
+
+        rejected = [r for r in results if isinstance(r, HTTPException)]
+        assert len(rejected) == 2
+        assert rejected[0].status_code == 503
+        assert rejected[0].headers["Retry-After"] == "1"
+        assert hasher.snapshot()["rejected"] == 2
+
+    async def test_cancelled_queued_call_releases_slot(self):
+        """Test that cancelling a call still waiting for a thread frees its queue slot."""
+        from app.passwords import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_queue=1, rounds=10)
+        running = asyncio.create_task(hasher.hash("password0"))
+        queued = asyncio.create_task(hasher.hash("password1"))
+        await asyncio.sleep(0.01)
+        assert hasher.snapshot()["queued"] == 1
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await running
+        hasher.shutdown()
+
+        snapshot = hasher.snapshot()
+        assert (snapshot["queued"], snapshot["running"]) == (0, 0)
+        assert (snapshot["completed"], snapshot["cancelled"]) == (1, 1)
+
+    async def test_metrics(self, hasher):
+        """Test that completed calls and wait/work times are counted."""
+        await asyncio.gather(*(hasher.hash(f"password{i}") for i in range(4)))
+
+        snapshot = hasher.snapshot()
+        assert (snapshot["queued"], snapshot["running"], snapshot["completed"]) == (0, 0, 4)
+        assert snapshot["avg_work_ms"] > 0
+        assert snapshot["max_wait_ms"] >= snapshot["avg_wait_ms"]
+        assert snapshot["bcrypt_rounds"] == 4
+
+    async def test_signup_hashes_on_pool(self, monkeypatch):
+        """Test that get_password_hash goes through the shared pool."""
+        from app.passwords import password_hasher
+        from app.routes.auth import get_password_hash, verify_password
+
+        monkeypatch.setattr(password_hasher, "rounds", 4)
+        completed = password_hasher.metrics.completed
+
+        hashed = await get_password_hash("correct horse battery staple")
+
+        assert await verify_password("correct horse battery staple", hashed)
+        assert password_hasher.metrics.completed == completed + 2
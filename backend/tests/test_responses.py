@@ -0,0 +1,141 @@
+"""
+VEP MVP Backend - Response Encoding Tests
+
+Tests for the opt-in fast JSON path (FAST_JSON_RESPONSES).
+"""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    """Switch FAST_JSON_RESPONSES on for one test."""
+    pytest.importorskip("orjson")
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+
+
+def voter_columns(i, **overrides):
+    """Plain voter row, as selected with VOTER_READ_COLUMNS."""
+    from app.models.voter import Coordinate
+
+    values = dict(
+        voter_id=f"TX{i}", first_name="Ann", last_name=f"Lee{i}", address="1 Main St",
+        city="Austin", state="TX", zip="78701", party_affiliation=None, support_level=4,
+        phone=None, email=None, id=uuid4(),
+        location=Coordinate(latitude=30.2672, longitude=-97.7431) if i % 2 else None,
+        created_at=datetime(2026, 10, 17, 9, 30, 1, 250000, tzinfo=timezone.utc),
+        updated_at=datetime(2026, 10, 17, 9, 30),
+    )
+    values.update(overrides)
+    return SimpleNamespace(_mapping=values, **values)
+
+
+# =============================================================================
+# Fast JSON Response Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestFastJSONResponses:
+    """Test that the fast path is opt-in and encodes the same JSON."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that the setting is off by default and needs orjson."""
+        from app import responses
+        from app.config import Settings, settings
+
+        assert Settings().FAST_JSON_RESPONSES is False
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        monkeypatch.setattr(responses, "orjson", None)
+        assert responses.fast_json_enabled() is False
+
+    def test_same_json_as_validated_path(self, fast_json):
+        """Test that plain rows encode exactly like the response model."""
+        from pydantic import TypeAdapter
+        from app.models.voter import VoterPage, VoterRead
+        from app.responses import FastJSONResponse, model_rows
+
+        rows = [voter_columns(i) for i in range(4)]
+        adapter = TypeAdapter(VoterPage)
+        page = VoterPage(voters=[VoterRead(**row._mapping) for row in rows], limit=4)
+
+        validated = adapter.dump_json(page)
+        fast = FastJSONResponse(
+            {"voters": model_rows(VoterRead, rows), "limit": 4, "next_cursor": None}
+        ).body
+
+        assert fast == validated
+
+    async def test_list_voters_returns_plain_rows(self, fast_json):
+        """Test that list_voters selects columns and skips model construction."""
+        from app.models.user import User
+        from app.responses import FastJSONResponse
+        from app.routes.voters import list_voters
+        from tests.conftest import RecordingSession
+
+        rows = [voter_columns(i) for i in range(3)]
+        db = RecordingSession(rows)
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+
+        response = await list_voters(db=db, current_user=user, zip=None, limit=2, cursor=None)
+
+        assert isinstance(response, FastJSONResponse)
+        page = json.loads(response.body)
+        assert [voter["voter_id"] for voter in page["voters"]] == ["TX0", "TX1"]
+        assert page["voters"][1]["location"] == {"latitude": 30.2672, "longitude": -97.7431}
+        assert page["voters"][0]["created_at"] == "2026-10-17T09:30:01.250000Z"
+        assert page["next_cursor"] is not None
+        assert "voters.location" in str(db.statements[0][0])
+        assert len(db.statements) == 1
+
+    async def test_get_assignment_matches_validated_path(self, monkeypatch):
+        """Test the assignment detail encodes identically with the setting on or off."""
+        pytest.importorskip("orjson")
+        from pydantic import TypeAdapter
+        from app.config import settings
+        from app.models.assignment import Assignment, AssignmentWithVoters
+        from app.models.user import User
+        from app.models.voter import Coordinate
+        from app.responses import FastJSONResponse
+        from app.routes.assignments import get_assignment
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        assignment = Assignment(name="Turf 12", user_id=user.id)
+        row = SimpleNamespace(_mapping=dict(
+            id=uuid4(), voter_id="TX1", first_name="Ann", last_name="Lee",
+            address="1 Main St", city="Austin", zip="78701", party_affiliation=None,
+            support_level=4, sequence_order=1,
+            location=Coordinate(latitude=30.2672, longitude=-97.7431),
+            last_contacted_at=datetime(2026, 10, 17, 9, tzinfo=timezone.utc),
+            last_contact_type="knocked", last_contact_result=None,
+        ))
+
+        async def read(enabled):
+            monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", enabled)
+            db = RecordingSession([assignment], [row])
+            return await get_assignment(assignment_id=assignment.id, db=db, current_user=user)
+
+        validated = TypeAdapter(AssignmentWithVoters).dump_json(await read(False))
+        fast = await read(True)
+
+        assert isinstance(fast, FastJSONResponse)
+        assert fast.body == validated
+
+    def test_typed_routes_keep_pydantic_encoder(self):
+        """Test that the app-wide default leaves response_model routes on pydantic-core."""
+        from fastapi.datastructures import DefaultPlaceholder
+        from fastapi.responses import JSONResponse
+        from app.main import app
+
+        default = app.router.default_response_class
+
+        # A placeholder, unlike a fixed class, keeps FastAPI's direct JSON dump
+        assert isinstance(default, DefaultPlaceholder)
+        assert issubclass(default.value, JSONResponse)
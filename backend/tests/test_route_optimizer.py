@@ -0,0 +1,82 @@
+"""
+VEP MVP Backend - Route Optimizer Tests
+
+Tests for distance computation and walking-order optimization.
+"""
+
+import time
+
+import pytest
+
+
+# =============================================================================
+# Route Optimizer Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestRouteOptimizer:
+    """Test the haversine matrix and route construction/improvement."""
+
+    def test_haversine_matrix(self):
+        """Test distances against known values."""
+        import numpy as np
+        from app.route_optimizer import haversine_matrix
+
+        dist = haversine_matrix(np.array([30.0, 31.0, 30.0]), np.array([-97.0, -97.0, -96.0]))
+
+        assert dist[0, 1] == pytest.approx(111_195, rel=1e-3)
+        assert dist[0, 2] == pytest.approx(96_297, rel=1e-3)
+        assert np.allclose(dist, dist.T)
+        assert np.all(np.diag(dist) == 0)
+
+    def test_shuffled_street_walked_end_to_end(self):
+        """Test that doors along one street are walked in order from the start."""
+        import numpy as np
+        from app.route_optimizer import optimize_route
+
+        latitudes = np.linspace(30.26, 30.27, 40)
+        shuffle = np.random.default_rng(7).permutation(40)
+
+        plan = optimize_route(latitudes[shuffle], [-97.74] * 40, start=(30.2599, -97.74))
+
+        assert [int(shuffle[i]) for i in plan.order] == list(range(40))
+        assert plan.optimized_distance < plan.initial_distance / 5
+
+    def test_good_order_never_made_worse(self):
+        """Test that an already optimal input order is kept."""
+        from app.route_optimizer import optimize_route
+
+        latitudes = [30.26 + i * 0.0001 for i in range(10)]
+
+        plan = optimize_route(latitudes, [-97.74] * 10)
+
+        assert plan.optimized_distance <= plan.initial_distance
+        assert sorted(plan.order) == list(range(10))
+
+    def test_small_inputs(self):
+        """Test empty and single-door routes."""
+        from app.route_optimizer import optimize_route
+
+        assert optimize_route([], []).order == []
+        single = optimize_route([30.26], [-97.74], start=(30.27, -97.74))
+        assert single.order == [0]
+        assert single.optimized_distance == pytest.approx(1112, rel=1e-2)
+
+    @pytest.mark.slow
+    def test_thousand_doors_under_a_second(self):
+        """Test that a 1,000-door turf is optimized within the time budget."""
+        import numpy as np
+        from app.route_optimizer import optimize_route
+
+        rng = np.random.default_rng(42)
+        latitudes = 30.26 + rng.random(1000) * 0.02
+        longitudes = -97.75 + rng.random(1000) * 0.02
+
+        started = time.perf_counter()
+        plan = optimize_route(latitudes, longitudes, start=(30.27, -97.74), time_limit=0.8)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert sorted(plan.order) == list(range(1000))
+        # Random order is ~1,000 km here; a good open route is ~50 km
+        assert plan.optimized_distance < plan.initial_distance / 15
@@ -0,0 +1,140 @@
+"""
+VEP MVP Backend - Sync Tests
+
+Tests for the delta sync endpoint: cursors, scoping and tombstones.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+
+def mapped(**values):
+    """Result row stand-in exposing `_mapping` like a SQLAlchemy Row."""
+    return SimpleNamespace(_mapping=values)
+
+
+def assignment_row(user_id):
+    now = datetime.utcnow()
+    return mapped(
+        id=uuid4(), user_id=user_id, name="Turf 12", description=None,
+        assigned_date=now.date(), due_date=None, status="in_progress",
+        voter_count=2, completed_count=1, created_at=now, updated_at=now,
+    )
+
+
+def voter_row(deleted_at=None):
+    from app.models.voter import Coordinate
+
+    now = datetime.utcnow()
+    return mapped(
+        id=uuid4(), voter_id="TX1", first_name="Ann", last_name="Lee",
+        address="1 Main St", city="Austin", state="TX", zip="78701",
+        party_affiliation=None, support_level=4, phone=None, email=None,
+        location=Coordinate(latitude=30.2672, longitude=-97.7431),
+        deleted_at=deleted_at, created_at=now, updated_at=now,
+    )
+
+
+# =============================================================================
+# Delta Sync Unit Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestSyncChanges:
+    """Test GET /sync/changes against recorded statements."""
+
+    @staticmethod
+    def make_user():
+        from app.models.user import User
+
+        return User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+
+    async def test_full_sync_without_cursor(self):
+        """Test that a first sync returns everything and skips tombstones."""
+        from app.pagination import decode_cursor
+        from app.routes.sync import get_changes
+        from tests.conftest import RecordingSession
+
+        user = self.make_user()
+        membership = mapped(id=uuid4(), assignment_id=uuid4(), voter_id=uuid4(), sequence_order=1)
+        db = RecordingSession(
+            [("5001",)], [assignment_row(user.id)], [membership], [voter_row()], []
+        )
+
+        changes = await get_changes(db=db, current_user=user, since=None)
+
+        assert changes.reset is True
+        assert len(db.statements) == 5
+        assert all(params["since"] == "0" for _, params in db.statements[1:])
+        assert all(params["user_id"] == user.id for _, params in db.statements[1:])
+        assert changes.assignments[0].voter_count == 2
+        assert changes.assignment_voters[0].sequence_order == 1
+        assert changes.voters[0].location.latitude == 30.2672
+        assert changes.deleted == []
+        assert decode_cursor(changes.next_cursor, int, datetime.fromisoformat)[0] == 5001
+
+    async def test_delta_sync_uses_cursor_and_returns_tombstones(self):
+        """Test that a recent cursor limits rows by xid and includes deletes."""
+        from app.models.sync import SyncEntity
+        from app.pagination import encode_cursor
+        from app.routes.sync import SYNC_TOMBSTONES_QUERY, get_changes
+        from tests.conftest import RecordingSession
+
+        user = self.make_user()
+        deleted_log = mapped(entity=SyncEntity.CONTACT_LOG, id=uuid4())
+        soft_deleted = voter_row(deleted_at=datetime.utcnow())
+        db = RecordingSession([("7002",)], [], [], [soft_deleted], [], [deleted_log])
+
+        changes = await get_changes(
+            db=db, current_user=user, since=encode_cursor(7000, datetime.utcnow())
+        )
+
+        assert changes.reset is False
+        assert all(params["since"] == "7000" for _, params in db.statements[1:])
+        assert db.statements[-1][0] is SYNC_TOMBSTONES_QUERY
+        assert changes.voters[0].deleted_at is not None
+        assert changes.deleted[0].entity == SyncEntity.CONTACT_LOG
+        assert changes.assignments == [] and changes.contact_logs == []
+
+    async def test_expired_cursor_forces_full_resync(self):
+        """Test that cursors older than tombstone retention get a reset."""
+        from app.config import settings
+        from app.pagination import encode_cursor
+        from app.routes.sync import get_changes
+        from tests.conftest import RecordingSession
+
+        user = self.make_user()
+        issued = datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS + 1)
+        db = RecordingSession([("9000",)])
+
+        changes = await get_changes(db=db, current_user=user, since=encode_cursor(42, issued))
+
+        assert changes.reset is True
+        assert len(db.statements) == 5
+        assert db.statements[1][1]["since"] == "0"
+
+    async def test_malformed_cursor_rejected(self):
+        """Test that a garbage cursor is a 400, not a full resync."""
+        from fastapi import HTTPException
+        from app.routes.sync import get_changes
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_changes(db=db, current_user=self.make_user(), since="not-a-cursor")
+
+        assert exc_info.value.status_code == 400
+        assert db.statements == []
+
+    def test_locations_decoded_as_points(self):
+        """Test that text queries decode WKB locations with the point type."""
+        from app.models.voter import PointGeometry
+        from app.routes.sync import SYNC_CONTACT_LOGS_QUERY, SYNC_VOTERS_QUERY
+
+        for query in (SYNC_VOTERS_QUERY, SYNC_CONTACT_LOGS_QUERY):
+            location = query.selected_columns["location"]
+            assert isinstance(location.type, PointGeometry)
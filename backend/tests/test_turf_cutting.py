@@ -0,0 +1,133 @@
+"""
+VEP MVP Backend - Turf Cutting Tests
+
+Tests for balanced clustering of voters into turfs.
+"""
+
+import time
+
+import pytest
+
+
+def scattered_voters(count, seed=3):
+    """Voters spread uniformly over a few square kilometres of Austin."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    return 30.25 + rng.random(count) * 0.05, -97.76 + rng.random(count) * 0.05
+
+
+# =============================================================================
+# Turf Cutting Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestTurfCutting:
+    """Test turf sizes, coverage, compactness and ordering."""
+
+    def test_every_voter_in_exactly_one_turf(self):
+        """Test that turfs partition the input."""
+        from app.turf_cutting import cut_turfs
+
+        latitudes, longitudes = scattered_voters(503)
+
+        turfs = cut_turfs(latitudes, longitudes, 12)
+
+        assert len(turfs) == 12
+        assert sorted(i for turf in turfs for i in turf) == list(range(503))
+
+    def test_turf_sizes_differ_by_at_most_one(self):
+        """Test capacity balancing, including clustered input."""
+        import numpy as np
+        from app.turf_cutting import cut_turfs
+
+        latitudes, longitudes = scattered_voters(400)
+        # Half the voters packed into one apartment block
+        latitudes[:200] = 30.2672 + np.linspace(0, 0.0002, 200)
+        longitudes[:200] = -97.7431
+
+        sizes = [len(turf) for turf in cut_turfs(latitudes, longitudes, 7)]
+
+        assert max(sizes) - min(sizes) <= 1
+        assert sum(sizes) == 400
+
+    def test_separated_neighbourhoods_become_separate_turfs(self):
+        """Test that well-separated groups are never mixed."""
+        import numpy as np
+        from app.turf_cutting import cut_turfs
+
+        rng = np.random.default_rng(1)
+        centres = [(30.20, -97.80), (30.30, -97.80), (30.20, -97.70), (30.30, -97.70)]
+        latitudes = np.concatenate([lat + rng.normal(0, 0.001, 25) for lat, _ in centres])
+        longitudes = np.concatenate([lng + rng.normal(0, 0.001, 25) for _, lng in centres])
+
+        turfs = cut_turfs(latitudes, longitudes, 4)
+
+        assert all(len({i // 25 for i in turf}) == 1 for turf in turfs)
+
+    def test_turfs_walked_in_order_and_sorted_north_to_south(self):
+        """Test that each turf comes back in optimized walking order."""
+        import numpy as np
+        from app.route_optimizer import haversine_matrix, path_length
+        from app.turf_cutting import cut_turfs
+
+        latitudes, longitudes = scattered_voters(300)
+
+        turfs = cut_turfs(latitudes, longitudes, 6)
+
+        centres = [latitudes[turf].mean() for turf in turfs]
+        assert centres == sorted(centres, reverse=True)
+        for turf in turfs:
+            dist = haversine_matrix(latitudes[turf], longitudes[turf])
+            walked = path_length(np.arange(len(turf)), dist)
+            shuffled = path_length(np.random.default_rng(0).permutation(len(turf)), dist)
+            assert walked < shuffled
+
+    def test_repeatable(self):
+        """Test that the same universe always cuts the same turfs."""
+        from app.turf_cutting import cut_turfs
+
+        latitudes, longitudes = scattered_voters(200)
+
+        assert cut_turfs(latitudes, longitudes, 5) == cut_turfs(latitudes, longitudes, 5)
+
+    def test_small_inputs(self):
+        """Test empty input and more turfs than voters."""
+        from app.turf_cutting import cut_turfs
+
+        assert cut_turfs([], [], 3) == []
+        assert sorted(cut_turfs([30.26, 30.27], [-97.74, -97.74], 5)) == [[0], [1]]
+
+    def test_turfs_too_large_to_route_left_unrouted(self, monkeypatch):
+        """Test that the optimizer only sees turfs within max_route_doors."""
+        from app import turf_cutting
+        from app.route_optimizer import optimize_route
+
+        routed = []
+
+        def recording_optimize_route(latitudes, longitudes, **kwargs):
+            routed.append(len(latitudes))
+            return optimize_route(latitudes, longitudes, **kwargs)
+
+        monkeypatch.setattr(turf_cutting, "optimize_route", recording_optimize_route)
+        latitudes, longitudes = scattered_voters(41)
+
+        turfs = turf_cutting.cut_turfs(latitudes, longitudes, 2, max_route_doors=20)
+
+        assert sorted(len(turf) for turf in turfs) == [20, 21]
+        assert routed == [20]
+        assert sorted(i for turf in turfs for i in turf) == list(range(41))
+
+    @pytest.mark.slow
+    def test_weekend_of_turfs_in_seconds(self):
+        """Test that 10,000 voters cut into 200 turfs within a few seconds."""
+        from app.turf_cutting import cut_turfs
+
+        latitudes, longitudes = scattered_voters(10_000)
+
+        started = time.perf_counter()
+        turfs = cut_turfs(latitudes, longitudes, 200, route_budget=2.0)
+        elapsed = time.perf_counter() - started
+
+        assert {len(turf) for turf in turfs} == {50}
+        assert elapsed < 6.0
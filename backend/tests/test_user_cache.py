@@ -0,0 +1,264 @@
+"""
+VEP MVP Backend - User Cache Tests
+
+Tests for the authenticated-user cache and its invalidation.
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def empty_user_cache():
+    from app.user_cache import user_cache
+
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+def bearer(user_id):
+    """Bearer credentials for a user, as get_current_user receives them."""
+    from fastapi.security import HTTPAuthorizationCredentials
+    from app.routes.auth import create_access_token
+
+    token = create_access_token({"sub": str(user_id)})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class FakeConnection:
+    """asyncpg connection stand-in recording LISTEN registrations."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.on_terminate = None
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.on_terminate = callback
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+# =============================================================================
+# Current User Lookup Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestCurrentUserCache:
+    """Test that authenticated requests skip the users lookup when cached."""
+
+    async def test_second_request_makes_no_query(self):
+        """Test that only the first request for a user reads the database."""
+        from app.dependencies import get_current_user
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([user])
+
+        first = await get_current_user(credentials=bearer(user.id), db=db)
+        second = await get_current_user(credentials=bearer(user.id), db=db)
+
+        assert len(db.statements) == 1
+        assert first.id == second.id == user.id
+        assert second is not first
+
+    async def test_requests_get_independent_copies(self):
+        """Test that mutating one request's user does not change the cached record."""
+        from app.dependencies import get_current_user
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([user])
+
+        first = await get_current_user(credentials=bearer(user.id), db=db)
+        first.role = "admin"
+        second = await get_current_user(credentials=bearer(user.id), db=db)
+
+        assert second.role == "canvasser"
+
+    async def test_unknown_user_not_cached(self):
+        """Test that a miss is retried, so newly created users can sign in."""
+        from fastapi import HTTPException
+        from app.dependencies import get_current_user
+        from app.models.user import User
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="new@test.com", full_name="New User")
+        db = RecordingSession([], [user])
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(credentials=bearer(user.id), db=db)
+        assert exc_info.value.status_code == 401
+
+        assert (await get_current_user(credentials=bearer(user.id), db=db)).id == user.id
+        assert len(db.statements) == 2
+
+    async def test_entries_expire(self, monkeypatch):
+        """Test that a cached user is re-read once its TTL passes."""
+        from app.cache import TTLCache
+        from app.models.user import User
+        from app.user_cache import load_user
+        from tests.conftest import RecordingSession
+        import app.user_cache as user_cache_module
+
+        now = [0.0]
+        monkeypatch.setattr(
+            user_cache_module, "user_cache", TTLCache(maxsize=10, ttl=60, clock=lambda: now[0])
+        )
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([user], [user])
+
+        await load_user(db, user.id)
+        now[0] = 59.0
+        await load_user(db, user.id)
+        now[0] = 60.0
+        await load_user(db, user.id)
+
+        assert len(db.statements) == 2
+
+
+# =============================================================================
+# Invalidation Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestUserCacheInvalidation:
+    """Test that user updates evict cached copies."""
+
+    async def test_role_change_evicts_after_commit(self):
+        """Test that a changed role is seen on the very next request."""
+        from app.dependencies import get_current_user
+        from app.models.user import User, UserUpdate
+        from app.routes.users import update_user
+        from tests.conftest import RecordingSession
+
+        admin = User(id=uuid4(), email="admin@test.com", full_name="Admin", role="admin")
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        promoted = User(**{**user.model_dump(), "role": "manager"})
+        db = RecordingSession([user], [user.model_copy()], [promoted])
+
+        assert (await get_current_user(credentials=bearer(user.id), db=db)).role == "canvasser"
+        await update_user(
+            user_id=user.id, user_data=UserUpdate(role="manager"), db=db, current_user=admin
+        )
+        current = await get_current_user(credentials=bearer(user.id), db=db)
+
+        assert current.role == "manager"
+        assert db.commits == 1
+        assert len(db.statements) == 3
+
+    async def test_notify_sent_before_commit_when_listening(self, monkeypatch):
+        """Test that other workers are told in the same transaction as the write."""
+        from app.config import settings
+        from app.models.user import User, UserUpdate
+        from app.routes.users import update_user
+        from app.user_cache import NOTIFY_USER_CHANGED_QUERY, USER_CHANGES_CHANNEL
+        from tests.conftest import RecordingSession
+
+        monkeypatch.setattr(settings, "USER_CACHE_LISTEN", True)
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([user])
+
+        await update_user(
+            user_id=user.id, user_data=UserUpdate(full_name="Renamed"), db=db, current_user=user
+        )
+
+        statement, params = db.statements[-1]
+        assert statement is NOTIFY_USER_CHANGED_QUERY
+        assert params == {"channel": USER_CHANGES_CHANNEL, "user_id": str(user.id)}
+
+    async def test_no_notify_by_default(self):
+        """Test that without a listener configured, updates send no NOTIFY."""
+        from app.models.user import User, UserUpdate
+        from app.routes.users import update_user
+        from tests.conftest import RecordingSession
+
+        user = User(id=uuid4(), email="canvasser@test.com", full_name="Test Canvasser")
+        db = RecordingSession([user])
+
+        await update_user(
+            user_id=user.id, user_data=UserUpdate(full_name="Renamed"), db=db, current_user=user
+        )
+
+        assert len(db.statements) == 1
+
+
+# =============================================================================
+# Cross-Worker Listener Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestUserChangeListener:
+    """Test the LISTEN connection that evicts users changed elsewhere."""
+
+    async def test_notification_evicts_user(self):
+        """Test that a NOTIFY payload drops just that user."""
+        from app.cache import TTLCache
+        from app.user_cache import USER_CHANGES_CHANNEL, UserChangeListener
+
+        connection = FakeConnection()
+
+        async def connect(dsn):
+            return connection
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        listener = UserChangeListener("postgresql://test", cache=cache, connect=connect)
+        listener.start()
+        await asyncio.sleep(0)
+        changed, other = uuid4(), uuid4()
+        cache.set(changed, {})
+        cache.set(other, {})
+
+        notify = connection.listeners[USER_CHANGES_CHANNEL]
+        notify(connection, 1, USER_CHANGES_CHANNEL, str(changed))
+        notify(connection, 1, USER_CHANGES_CHANNEL, "junk")
+
+        assert listener.connected
+        assert cache.get(changed) is None
+        assert cache.get(other) == {}
+        await listener.stop()
+        assert connection.closed
+
+    async def test_disconnect_clears_cache_and_reconnects(self):
+        """Test that missed notifications cannot leave stale users behind."""
+        from app.cache import TTLCache
+        from app.user_cache import UserChangeListener
+
+        connections, attempts = [], []
+
+        async def connect(dsn):
+            attempts.append(dsn)
+            if len(attempts) == 2:
+                raise OSError("connection refused")
+            connections.append(FakeConnection())
+            return connections[-1]
+
+        cache = TTLCache(maxsize=10, ttl=60)
+        listener = UserChangeListener(
+            "postgresql://test", cache=cache, retry_seconds=0, connect=connect
+        )
+        listener.start()
+        await asyncio.sleep(0)
+        cache.set(uuid4(), {})
+
+        connections[0].on_terminate(connections[0])
+        assert len(cache) == 0
+        assert not listener.connected
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert (len(attempts), len(connections)) == (3, 2)
+        assert listener.connected
+        await listener.stop()
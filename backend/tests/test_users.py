@@ -496,3 +496,132 @@ class TestUserIntegration:
         
         # Check that assignments are also deleted
         # ...
+
+
+# =============================================================================
+# Bulk Provisioning Unit Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestBulkProvisioning:
+    """Test bulk user provisioning against recorded statements."""
+
+    @staticmethod
+    def inserted_ids(statement, params):
+        """Canned RETURNING rows: every submitted user was inserted."""
+        return [(user_id,) for user_id in params["ids"]]
+
+    async def test_batch_uses_one_lookup_and_one_insert(self):
+        """Test that a batch costs one SELECT, one INSERT and one commit."""
+        from app.user_provisioning import (
+            EXISTING_EMAILS_QUERY,
+            INSERT_USERS_QUERY,
+            provision_users,
+        )
+        from tests.conftest import RecordingSession
+
+        rows = [
+            {"email": f"volunteer{i}@test.com", "full_name": f"Volunteer {i}"}
+            for i in range(50)
+        ]
+        db = RecordingSession([], self.inserted_ids)
+
+        report = await provision_users(db, rows)
+
+        assert (report.created, report.existing, report.rejected) == (50, 0, 0)
+        assert [statement for statement, _ in db.statements] == [
+            EXISTING_EMAILS_QUERY,
+            INSERT_USERS_QUERY,
+        ]
+        assert db.commits == 1
+        params = db.statements[1][1]
+        assert params["roles"] == ["canvasser"] * 50
+        assert [r.user_id for r in report.results] == params["ids"]
+
+    async def test_per_row_outcomes(self):
+        """Test invalid, duplicate, existing and raced rows are reported in order."""
+        from app.models.user import UserProvisionStatus
+        from app.user_provisioning import provision_users
+        from tests.conftest import RecordingSession
+
+        rows = [
+            {"email": "new@test.com", "full_name": "New"},
+            {"email": "not-an-email", "full_name": "Bad"},
+            {"email": "lead@test.com", "full_name": "Lead", "role": "owner"},
+            {"email": "new@test.com", "full_name": "Again"},
+            {"email": "taken@test.com", "full_name": "Taken"},
+            {"email": "raced@test.com", "full_name": "Raced"},
+            "not an object",
+            {"email": "secret@test.com", "full_name": "Secret", "password": "hunter22"},
+            {"email": "blank@test.com", "full_name": "Blank", "password": ""},
+        ]
+        # raced@ was registered between the lookup and the insert
+        db = RecordingSession(
+            [("taken@test.com",)],
+            lambda statement, params: [(params["ids"][0],), (params["ids"][2],)],
+        )
+
+        report = await provision_users(db, rows)
+
+        assert [r.status for r in report.results] == [
+            UserProvisionStatus.CREATED,
+            UserProvisionStatus.INVALID,
+            UserProvisionStatus.INVALID,
+            UserProvisionStatus.DUPLICATE,
+            UserProvisionStatus.EXISTS,
+            UserProvisionStatus.EXISTS,
+            UserProvisionStatus.INVALID,
+            UserProvisionStatus.INVALID,
+            UserProvisionStatus.CREATED,
+        ]
+        assert report.results[1].error.startswith("email:")
+        assert report.results[2].error.startswith("role:")
+        assert report.results[7].error.startswith("password:")
+        assert (report.created, report.existing, report.rejected) == (2, 2, 5)
+        assert db.statements[1][1]["emails"] == [
+            "new@test.com", "raced@test.com", "blank@test.com"
+        ]
+
+    async def test_nothing_valid_writes_nothing(self):
+        """Test that a batch with no valid rows makes no queries."""
+        from app.user_provisioning import provision_users
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession()
+
+        report = await provision_users(db, [{"email": "bad"}])
+
+        assert report.rejected == 1
+        assert db.statements == []
+        assert db.commits == 0
+
+    def test_read_csv_and_json(self):
+        """Test that CSV headers are normalized and JSON arrays pass through."""
+        import io
+        from app.user_provisioning import read_provision_rows
+
+        csv_rows = read_provision_rows(
+            io.StringIO("Email,Full Name,Role,Phone\na@test.com,Ann Lee,,5125550100\n")
+        )
+        json_rows = read_provision_rows(
+            io.StringIO('[{"email": "a@test.com", "full_name": "Ann Lee"}]'), "users.json"
+        )
+
+        assert csv_rows == [{"email": "a@test.com", "full_name": "Ann Lee", "phone": "5125550100"}]
+        assert json_rows == [{"email": "a@test.com", "full_name": "Ann Lee"}]
+
+    def test_unreadable_files_rejected(self, monkeypatch):
+        """Test malformed JSON, missing email column and oversized batches."""
+        import io
+        from app.config import settings
+        from app.user_provisioning import UserProvisionFileError, read_provision_rows
+
+        monkeypatch.setattr(settings, "USER_PROVISION_MAX_ROWS", 2)
+        for content, message in (
+            ("[{", "Invalid JSON"),
+            ('{"email": "a@test.com"}', "array"),
+            ("name,phone\nAnn,1\n", "email"),
+            ("email\na@test.com\nb@test.com\nc@test.com\n", "At most 2"),
+        ):
+            with pytest.raises(UserProvisionFileError, match=message):
+                read_provision_rows(io.StringIO(content), "users.json" if "{" in content else "")
@@ -0,0 +1,378 @@
+"""
+VEP MVP Backend - Voter Import Tests
+
+Tests for CSV voter file parsing, validation, sharding and the COPY-based loader.
+"""
+
+import io
+from contextlib import asynccontextmanager
+
+import pytest
+
+
+VAN_HEADER = (
+    "Voter File VANID,FirstName,LastName,Address,City,State,Zip5,Party,"
+    "Cell Phone,Latitude,Longitude"
+)
+
+
+def make_voter_file(count, header=VAN_HEADER):
+    """Build an in-memory VAN-style voter file with `count` valid rows."""
+    lines = [header]
+    for i in range(count):
+        lines.append(
+            f"TX{1000000 + i},Voter{i},Test{i},{100 + i} Main St,Austin,TX,78701,D,"
+            f"512-555-{i:04d},30.2672,-97.7431"
+        )
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+class FakeCopyConnection:
+    """asyncpg connection stand-in recording executed SQL and COPYed records."""
+
+    def __init__(self, inserted=0, updated=0, unchanged=0, deleted=0):
+        self.executed = []
+        self.copies = []
+        self.counts = {
+            "distinct_voters": inserted + updated + unchanged,
+            "inserted": inserted,
+            "updated": updated,
+            "deleted": deleted,
+        }
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query):
+        self.executed.append(query)
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copies.append((table, list(records), columns))
+
+    async def fetchrow(self, query):
+        self.executed.append(query)
+        return self.counts
+
+
+# =============================================================================
+# Parsing and Validation Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestVoterFileParsing:
+    """Test header mapping and row validation."""
+
+    def test_van_headers_mapped(self):
+        """Test that VAN-style headers map onto voter fields."""
+        from app.voter_import import read_voter_rows
+
+        line, fields = next(read_voter_rows(make_voter_file(1)))
+
+        assert line == 2
+        assert fields["voter_id"] == "TX1000000"
+        assert fields["zip"] == "78701"
+        assert fields["phone"] == "512-555-0000"
+        assert fields["longitude"] == "-97.7431"
+
+    def test_missing_required_columns_rejected(self):
+        """Test that a file without required columns fails up front."""
+        from app.voter_import import VoterFileError, read_voter_rows
+
+        with pytest.raises(VoterFileError, match="address, city"):
+            next(read_voter_rows(io.StringIO("VANID,FirstName,LastName,Zip\nTX1,A,B,78701\n")))
+
+    def test_invalid_rows_rejected_with_line_numbers(self):
+        """Test that bad rows are reported individually and good rows kept."""
+        from app.voter_import import read_voter_rows, validate_chunk
+
+        source = io.StringIO(
+            "VANID,FirstName,LastName,Address,City,Zip,Support Level,Lat,Lng\n"
+            "TX1,Ann,Lee,1 Main St,Austin,78701,4,30.1,-97.1\n"
+            "TX2,Bob,,2 Main St,Austin,78701,,,\n"
+            "TX3,Cy,Day,3 Main St,Austin,78701,9,,\n"
+            "TX4,Di,Eve,4 Main St,Austin,78701,,95.0,-97.1\n"
+            "TX5,Ed,Fox,5 Main St,Austin,78701,,,\n"
+        )
+
+        records, rejected, rejected_ids = validate_chunk(list(read_voter_rows(source)))
+
+        assert [record[1] for record in records] == ["TX1", "TX5"]
+        assert records[0][6] == "TX"
+        assert records[0][-3:-1] == (30.1, -97.1)
+        assert records[1][-3:-1] == (None, None)
+        assert [row.line for row in rejected] == [3, 4, 5]
+        assert rejected_ids == ["TX2", "TX3", "TX4"]
+        assert rejected[0].error.startswith("last_name")
+        assert rejected[1].error.startswith("support_level")
+        assert "out of range" in rejected[2].error
+
+
+    def test_normalization_ignores_cosmetic_changes(self):
+        """Test that formatting-only differences produce the same content hash."""
+        from app.voter_import import read_voter_rows, validate_chunk
+
+        source = io.StringIO(
+            "VANID,FirstName,LastName,Address,City,State,Zip,Phone,Email\n"
+            "TX1,Ann,Lee,1 Main St,Austin,TX,78701,(512) 555-0100,ann@example.org\n"
+            "TX1, Ann ,Lee,1  Main   St,Austin,tx,78701-1234,1-512-555-0100,Ann@Example.org\n"
+            "TX1,Ann,Lee,2 Main St,Austin,TX,78701,512-555-0100,ann@example.org\n"
+        )
+
+        records, _, _ = validate_chunk(list(read_voter_rows(source)))
+        original, reformatted, moved = records
+
+        assert reformatted[1:] == original[1:]
+        assert original[7] == "78701"
+        assert original[10] == "512-555-0100"
+        assert moved[-1] != original[-1]
+
+
+# =============================================================================
+# Sharded Import Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestVoterFileSharding:
+    """Test byte-range sharding for the process pool import."""
+
+    def write_file(self, tmp_path, count):
+        path = tmp_path / "voters.csv"
+        content = make_voter_file(count).getvalue().replace("\n", "\r\n")
+        path.write_text("\ufeff" + content, newline="")
+        return str(path)
+
+    def test_shards_end_on_line_boundaries(self, tmp_path):
+        """Test that shards cover the data exactly, split only after newlines."""
+        from app.voter_import import iter_shards, read_header
+
+        path = self.write_file(tmp_path, 50)
+        column_map, data_start = read_header(path)
+        shards = list(iter_shards(path, data_start, 200))
+        data = open(path, "rb").read()
+
+        assert column_map[0] == "voter_id"
+        assert data[:data_start].endswith(b"Longitude\r\n")
+        assert shards[0].start == data_start and shards[-1].end == len(data)
+        assert all(a.end == b.start for a, b in zip(shards, shards[1:]))
+        assert all(data[shard.end - 1:shard.end] == b"\n" for shard in shards)
+        assert shards[0].first_line == 2
+        assert all(
+            b.first_line == a.first_line + data[a.start:a.end].count(b"\n")
+            for a, b in zip(shards, shards[1:])
+        )
+
+    def test_shards_validate_like_a_stream(self, tmp_path):
+        """Test that shard-by-shard validation matches the streaming reader."""
+        from app.voter_import import (
+            iter_shards,
+            prepare_shard,
+            read_header,
+            read_voter_rows,
+            validate_chunk,
+        )
+
+        path = self.write_file(tmp_path, 40)
+        column_map, data_start = read_header(path)
+        with open(path, newline="", encoding="utf-8-sig") as source:
+            expected, _, _ = validate_chunk(list(read_voter_rows(source)))
+
+        shards = iter_shards(path, data_start, 300)
+        prepared = [prepare_shard(path, shard, column_map) for shard in shards]
+
+        assert len(prepared) > 1
+        assert [record for chunk in prepared for record in chunk.records] == expected
+
+    async def test_process_pool_import_copies_shards_in_order(self, tmp_path, monkeypatch):
+        """Test the process pool import end to end with two workers."""
+        from app import voter_import
+        from app.voter_import import STAGING_TABLE, import_voter_path
+
+        monkeypatch.setattr(voter_import.os, "cpu_count", lambda: 4)
+        path = tmp_path / "voters.csv"
+        path.write_text(
+            make_voter_file(30).getvalue() + "TX9,Bad,,1 Main St,Austin,TX,78701,D,,,\n"
+        )
+        connection = FakeCopyConnection(inserted=30)
+
+        report = await import_voter_path(connection, str(path), workers=2, shard_bytes=512)
+
+        records = [
+            record
+            for table, batch, _ in connection.copies if table == STAGING_TABLE
+            for record in batch
+        ]
+        assert len(connection.copies) > 2
+        assert [record[0] for record in records] == list(range(2, 32))
+        assert report.rows_read == 31
+        assert (report.rows_loaded, report.rows_rejected) == (30, 1)
+        assert report.errors[0].line == 32
+        assert report.inserted == 30
+
+    def test_multiline_cells_detected(self, tmp_path):
+        """Test that a quoted cell spanning lines is found, and plain quoting is not."""
+        from app.voter_import import has_multiline_cells, read_header
+
+        plain = tmp_path / "plain.csv"
+        header = "VANID,FirstName,LastName,Address,City,Zip\n"
+        plain.write_text(header + 'TX1,"Ann",Lee,"1 Main St",Austin,78701\n')
+        multiline = tmp_path / "multiline.csv"
+        multiline.write_text(header + 'TX1,Ann,Lee,"1 Main St\nApt 2",Austin,78701\n')
+
+        assert not has_multiline_cells(str(plain), read_header(str(plain))[1])
+        assert has_multiline_cells(str(multiline), read_header(str(multiline))[1])
+
+    async def test_multiline_cells_streamed_instead_of_sharded(self, tmp_path, monkeypatch):
+        """Test that a file sharding would mis-parse keeps every row."""
+        from app import voter_import
+        from app.voter_import import STAGING_TABLE, import_voter_path
+
+        monkeypatch.setattr(voter_import.os, "cpu_count", lambda: 4)
+        header = "VANID,FirstName,LastName,Address,City,Zip\n"
+        rows = "".join(
+            f'TX{i},Voter{i},Test{i},"{i} Main St\nApt {i}",Austin,78701\n' for i in range(30)
+        )
+        path = tmp_path / "voters.csv"
+        path.write_text(header + rows)
+        connection = FakeCopyConnection(inserted=30)
+
+        report = await import_voter_path(
+            connection, str(path), workers=2, shard_bytes=64, delete_missing=True
+        )
+
+        records = [
+            record
+            for table, batch, _ in connection.copies if table == STAGING_TABLE
+            for record in batch
+        ]
+        assert (report.rows_read, report.rows_rejected) == (30, 0)
+        assert len(records) == 30
+
+    def test_workers_capped_at_core_count(self, monkeypatch):
+        """Test that configured workers never exceed the CPU core count."""
+        from app import voter_import
+        from app.voter_import import import_worker_count
+
+        monkeypatch.setattr(voter_import.os, "cpu_count", lambda: 4)
+        assert [import_worker_count(n) for n in (0, 1, 2, 8)] == [4, 1, 2, 4]
+
+        monkeypatch.setattr(voter_import.os, "cpu_count", lambda: None)
+        assert [import_worker_count(n) for n in (0, 8)] == [1, 1]
+
+    async def test_single_core_streams_instead_of_sharding(self, tmp_path, monkeypatch):
+        """Test that a single-core host validates in a thread, not a process pool."""
+        from app import voter_import
+        from app.voter_import import import_voter_path
+
+        def no_process_pool(*args):
+            raise AssertionError("process pool used on a single core")
+
+        monkeypatch.setattr(voter_import.os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(voter_import, "prepare_in_processes", no_process_pool)
+        path = tmp_path / "voters.csv"
+        path.write_text(make_voter_file(30).getvalue())
+        connection = FakeCopyConnection(inserted=30)
+
+        report = await import_voter_path(connection, str(path), workers=4, shard_bytes=512)
+
+        assert (report.rows_read, report.rows_loaded) == (30, 30)
+
+
+# =============================================================================
+# Loader Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestVoterFileImport:
+    """Test the chunked COPY and upsert flow."""
+
+    async def test_rows_copied_in_chunks_then_upserted_once(self):
+        """Test one COPY per chunk followed by a single set-based upsert."""
+        from app.voter_import import STAGING_TABLE, import_voter_file
+
+        connection = FakeCopyConnection(inserted=15, updated=5, unchanged=5)
+        progress = []
+
+        report = await import_voter_file(
+            connection, make_voter_file(25), chunk_size=10, progress=progress.append
+        )
+
+        assert [len(records) for _, records, _ in connection.copies] == [10, 10, 5]
+        assert all(table == STAGING_TABLE for table, _, _ in connection.copies)
+        assert connection.executed[0].strip().startswith("CREATE TEMP TABLE")
+        assert "ON CONFLICT (voter_id)" in connection.executed[-1]
+        assert report.rows_read == report.rows_loaded == 25
+        assert (report.inserted, report.updated, report.unchanged) == (15, 5, 5)
+        assert report.deleted == 0
+        assert not any("deleted_at = NOW()" in query for query in connection.executed)
+        assert len(progress) == 3
+
+    async def test_delete_missing_protects_rejected_voters(self):
+        """Test that a sync soft-deletes missing voters but not rejected rows."""
+        from app.voter_import import REJECTED_IDS_TABLE, import_voter_file
+
+        connection = FakeCopyConnection(updated=1, deleted=7)
+        source = io.StringIO(
+            "VANID,FirstName,LastName,Address,City,Zip\n"
+            "TX1,Ann,Lee,1 Main St,Austin,78701\n"
+            "TX2,Bob,,2 Main St,Austin,78701\n"
+        )
+
+        report = await import_voter_file(connection, source, delete_missing=True)
+
+        assert connection.copies[-1][0] == REJECTED_IDS_TABLE
+        assert connection.copies[-1][1] == [("TX2",)]
+        assert "deleted_at = NOW()" in connection.executed[-1]
+        assert report.deleted == 7
+
+    async def test_reported_errors_capped(self, monkeypatch):
+        """Test that only the first rejected rows are kept in the report."""
+        from app.config import settings
+        from app.voter_import import import_voter_file
+
+        monkeypatch.setattr(settings, "VOTER_IMPORT_MAX_REPORTED_ERRORS", 2)
+        source = io.StringIO(
+            "VANID,FirstName,LastName,Address,City,Zip\n"
+            + "".join(f"TX{i},A,,1 Main St,Austin,78701\n" for i in range(5))
+        )
+
+        report = await import_voter_file(FakeCopyConnection(), source, chunk_size=2)
+
+        assert report.rows_rejected == 5
+        assert [row.line for row in report.errors] == [2, 3]
+
+    async def test_oversized_upload_refused(self, monkeypatch):
+        """Test that uploads over the size cap are refused before importing."""
+        from fastapi import HTTPException, UploadFile, status
+        from app.config import settings
+        from app.models.user import User
+        from app.routes.voters import import_voters
+
+        monkeypatch.setattr(settings, "VOTER_IMPORT_MAX_UPLOAD_BYTES", 1024)
+        content = make_voter_file(100).getvalue().encode()
+        upload = UploadFile(io.BytesIO(content), filename="voters.csv")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await import_voters(
+                file=upload,
+                current_user=User(email="admin@test.com", full_name="Test Admin"),
+                delete_missing=False,
+            )
+
+        assert exc_info.value.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert "import-voters" in exc_info.value.detail
+
+    def test_cli_import_command(self):
+        """Test that the CLI exposes import-voters with a chunk size option."""
+        from app.cli import build_parser, import_voters
+
+        args = build_parser().parse_args(
+            [
+                "import-voters", "voters.csv",
+                "--chunk-size", "500", "--delete-missing", "--workers", "4",
+            ]
+        )
+
+        assert args.handler is import_voters
+        assert (args.path, args.chunk_size, args.delete_missing) == ("voters.csv", 500, True)
+        assert args.workers == 4
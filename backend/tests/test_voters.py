@@ -7,7 +7,7 @@ and spatial queries using PostGIS.
 
 import pytest
 from fastapi import status
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 
 # =============================================================================
@@ -278,16 +278,24 @@ class TestVoterSearchAndFilter:
         pytest.skip("Backend implementation pending from Agent 2")
         
         response = client.get(
-            "/voters?limit=10&offset=0",
+            "/voters?limit=10",
             headers=auth_headers_canvasser,
         )
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert "voters" in data
-        assert "total" in data
         assert "limit" in data
-        assert "offset" in data
+        assert "next_cursor" in data
+        
+        if data["next_cursor"]:
+            next_response = client.get(
+                f"/voters?limit=10&cursor={data['next_cursor']}",
+                headers=auth_headers_canvasser,
+            )
+            assert next_response.status_code == status.HTTP_200_OK
+            next_ids = {voter["id"] for voter in next_response.json()["voters"]}
+            assert not next_ids & {voter["id"] for voter in data["voters"]}
 
 
 # =============================================================================
@@ -569,3 +577,156 @@ class TestVoterIntegration:
             headers=auth_headers_manager,
         )
         assert final_response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# =============================================================================
+# Query Count Regression Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestVoterQueryCount:
+    """Test that voter reads cost a constant number of statements."""
+
+    @staticmethod
+    def make_rows(count):
+        from app.models.voter import Coordinate, Voter
+
+        return [
+            Voter(
+                voter_id=f"TX{1000000 + i}",
+                first_name=f"Voter{i}",
+                last_name=f"Test{i}",
+                address=f"{100 + i} Main St",
+                city="Austin",
+                zip="78701",
+                location=(
+                    Coordinate(latitude=30.2672 + (i * 0.001), longitude=-97.7431 + (i * 0.001))
+                    if i % 10
+                    else None
+                ),
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.parametrize("page_size", [1, 10, 100])
+    async def test_list_voters_single_statement(self, page_size):
+        """Test that list_voters issues one statement regardless of page size."""
+        from sqlalchemy.dialects import postgresql
+        from app.models.user import User
+        from app.routes.voters import list_voters
+        from tests.conftest import RecordingSession
+
+        db = RecordingSession(self.make_rows(page_size))
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+
+        page = await list_voters(db=db, current_user=user, zip=None, limit=page_size, cursor=None)
+
+        assert len(page.voters) == page_size
+        assert len(db.statements) == 1
+        sql = str(db.statements[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.lstrip().startswith("SELECT")
+        assert "ST_AsBinary(voters.location)" in sql
+        assert page.voters[0].location is None
+        if page_size > 1:
+            assert page.voters[1].location.latitude == pytest.approx(30.2682)
+
+    def test_location_selected_as_wkb(self):
+        """Test that the mapped location column is read as WKB in the voter SELECT."""
+        from sqlalchemy.dialects import postgresql
+        from sqlmodel import select
+        from app.models.voter import Voter
+
+        sql = str(select(Voter).compile(dialect=postgresql.dialect()))
+
+        assert "ST_AsBinary(voters.location)" in sql
+        assert "ST_AsText" not in sql
+
+    def test_wkb_point_decoding(self):
+        """Test WKB decoding in both byte orders and for empty points."""
+        import struct
+        from app.models.voter import wkb_to_coordinate
+
+        little = wkb_to_coordinate(struct.pack("<BIdd", 1, 1, -97.7431, 30.2672))
+        big = wkb_to_coordinate(struct.pack(">BIdd", 0, 1, -97.7431, 30.2672))
+
+        assert (little.latitude, little.longitude) == (30.2672, -97.7431)
+        assert big == little
+        assert wkb_to_coordinate(struct.pack("<BIdd", 1, 1, float("nan"), float("nan"))) is None
+
+    async def test_update_voter_location_single_statement(self):
+        """Test that a location update is written with the row, not a second UPDATE."""
+        from app.models.user import User
+        from app.models.voter import VoterUpdate
+        from app.routes.voters import update_voter
+        from tests.conftest import RecordingSession
+
+        voter = self.make_rows(1)[0]
+        db = RecordingSession([voter])
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+
+        result = await update_voter(
+            voter_id=voter.id,
+            voter_data=VoterUpdate(location={"latitude": 30.3, "longitude": -97.7}),
+            db=db,
+            current_user=user,
+        )
+
+        assert len(db.statements) == 1
+        assert db.commits == 1
+        assert voter.location.latitude == 30.3
+        assert result.location.longitude == -97.7
+
+
+# =============================================================================
+# Keyset Pagination Tests
+# =============================================================================
+
+@pytest.mark.unit
+class TestVoterKeysetPagination:
+    """Test cursor-based voter pagination."""
+
+    async def test_next_cursor_continues_after_last_row(self):
+        """Test that a full page returns a cursor seeking past its last row."""
+        from sqlalchemy.dialects import postgresql
+        from app.models.user import User
+        from app.pagination import decode_cursor
+        from app.routes.voters import list_voters
+        from tests.conftest import RecordingSession
+
+        rows = TestVoterQueryCount.make_rows(3)
+        db = RecordingSession(rows, [])
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+
+        page = await list_voters(db=db, current_user=user, zip="78701", limit=2, cursor=None)
+
+        assert len(page.voters) == 2
+        assert decode_cursor(page.next_cursor, str, str, UUID) == (
+            rows[1].last_name,
+            rows[1].first_name,
+            rows[1].id,
+        )
+
+        last_page = await list_voters(
+            db=db, current_user=user, zip="78701", limit=2, cursor=page.next_cursor
+        )
+        sql = str(db.statements[-1][0].compile(dialect=postgresql.dialect()))
+
+        assert last_page.next_cursor is None
+        assert "(voters.last_name, voters.first_name, voters.id) >" in sql
+        assert "OFFSET" not in sql
+
+    async def test_malformed_cursor_rejected(self):
+        """Test that a tampered cursor is a 400, not a server error."""
+        from fastapi import HTTPException
+        from app.models.user import User
+        from app.routes.voters import list_voters
+        from tests.conftest import RecordingSession
+
+        user = User(email="canvasser@test.com", full_name="Test Canvasser")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await list_voters(
+                db=RecordingSession(), current_user=user, zip=None, limit=10, cursor="not-a-cursor"
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
@@ -89,14 +89,16 @@ class APIClient: ObservableObject {
     }
     
     /// Search voters with filters
-    func searchVoters(zip: String? = nil, limit: Int = 50, offset: Int = 0) async throws -> [Voter] {
+    func searchVoters(zip: String? = nil, limit: Int = 50, cursor: String? = nil) async throws -> [Voter] {
         var queryItems: [URLQueryItem] = [
-            URLQueryItem(name: "limit", value: "\(limit)"),
-            URLQueryItem(name: "offset", value: "\(offset)")
+            URLQueryItem(name: "limit", value: "\(limit)")
         ]
         if let zip = zip {
             queryItems.append(URLQueryItem(name: "zip", value: zip))
         }
+        if let cursor = cursor {
+            queryItems.append(URLQueryItem(name: "cursor", value: cursor))
+        }
         
         let response: VotersResponse = try await request(
             endpoint: "/voters",
@@ -111,6 +113,7 @@ class APIClient: ObservableObject {
     /// Create a new contact log
     func createContactLog(_ log: ContactLog) async throws -> ContactLog {
         let body: [String: Any] = [
+            "idempotency_key": log.id.uuidString,
             "assignment_id": log.assignmentId.uuidString,
             "voter_id": log.voterId.uuidString,
             "contact_type": log.contactType.rawValue,
@@ -219,9 +222,14 @@ private struct AssignmentsResponse: Decodable {
 
 private struct VotersResponse: Decodable {
     let voters: [Voter]
-    let total: Int?
     let limit: Int?
-    let offset: Int?
+    let nextCursor: String?
+    
+    enum CodingKeys: String, CodingKey {
+        case voters
+        case limit
+        case nextCursor = "next_cursor"
+    }
 }
 
 private struct ContactLogsResponse: Decodable {